@@ -34,7 +34,7 @@ class PlotConfig:
     line_width: float = 1.5
     grid_alpha: float = 0.3
     auto_scale: bool = True
-    update_interval: int = 100  # milliseconds
+    update_interval: int = 33  # milliseconds between live plot redraws
 
 
 @dataclass
@@ -157,6 +157,113 @@ class DataAnalyzer:
         return {'hysteresis_detected': False, 'reason': 'No significant hysteresis found'}
 
 
+class MeasurementBuffer:
+    """
+    Growable float64 column storage for live measurement data
+    
+    Columns are kept in one preallocated NumPy array and filled up to a
+    write index, so readers get contiguous views instead of Python lists.
+    
+    With max_points set the buffer is a sliding window over the newest
+    max_points samples: storage stops growing at twice that size and the
+    window is moved back to the start when it fills (one copy per
+    max_points appends), so views stay contiguous. Samples that left the
+    window are counted in dropped.
+    """
+    
+    COLUMNS = ('voltage', 'current', 'time')
+    
+    def __init__(self, capacity: int = 1024, max_points: Optional[int] = None):
+        self.max_points = max(1, int(max_points)) if max_points else None
+        if self.max_points:
+            capacity = min(capacity, 2 * self.max_points)
+        self._capacity = max(1, int(capacity))
+        self._size = 0
+        self._appended = 0
+        self._data = np.empty((len(self.COLUMNS), self._capacity), dtype=np.float64)
+    
+    @property
+    def dropped(self) -> int:
+        """Number of samples appended since the last clear that are no longer in the window"""
+        return self._appended - len(self)
+    
+    @property
+    def _start(self) -> int:
+        """Index of the oldest sample in the window"""
+        return max(0, self._size - self.max_points) if self.max_points else 0
+    
+    def __len__(self) -> int:
+        return self._size - self._start
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Get a view of the filled part of a column ('voltage', 'current' or 'time')"""
+        return self._data[self.COLUMNS.index(column), self._start:self._size]
+    
+    def _grow(self, min_capacity: int):
+        """Reallocate storage with at least min_capacity rows (doubling)"""
+        new_capacity = max(min_capacity, 2 * self._capacity)
+        if self.max_points:
+            new_capacity = max(min_capacity, min(new_capacity, 2 * self.max_points))
+        new_data = np.empty((len(self.COLUMNS), new_capacity), dtype=np.float64)
+        new_data[:, :self._size] = self._data[:, :self._size]
+        self._data = new_data
+        self._capacity = new_capacity
+    
+    def _reserve(self, count: int):
+        """Make room for count more rows, dropping samples that leave the window"""
+        if self._size + count <= self._capacity:
+            return
+        
+        if not self.max_points or self._size + count <= 2 * self.max_points:
+            self._grow(self._size + count)
+            return
+        
+        # Move the samples that stay in the window back to the start
+        keep = min(self._size, max(0, self.max_points - count))
+        self._data[:, :keep] = self._data[:, self._size - keep:self._size]
+        self._size = keep
+        if self._size + count > self._capacity:
+            self._grow(self._size + count)
+    
+    def append(self, voltage: float, current: float, timestamp: float):
+        """Append one data point"""
+        self._reserve(1)
+        
+        column = self._data[:, self._size]
+        column[0] = voltage
+        column[1] = current
+        column[2] = timestamp
+        self._size += 1
+        self._appended += 1
+    
+    def extend(self, voltages, currents, timestamps):
+        """Append a batch of data points (equal-length sequences) in one copy"""
+        count = len(voltages)
+        self._appended += count
+        if self.max_points and count > self.max_points:
+            # Only the newest max_points of the batch can be in the window
+            skip = count - self.max_points
+            voltages, currents, timestamps = voltages[skip:], currents[skip:], timestamps[skip:]
+            count = self.max_points
+        self._reserve(count)
+        
+        end = self._size + count
+        self._data[0, self._size:end] = voltages
+        self._data[1, self._size:end] = currents
+        self._data[2, self._size:end] = timestamps
+        self._size = end
+    
+    def get_array(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get (voltage, current, time) views of the filled data without copying"""
+        data = self._data[:, self._start:self._size]
+        return data[0], data[1], data[2]
+    
+    def clear(self):
+        """Discard all data but keep the allocated storage"""
+        self._size = 0
+        self._appended = 0
+
+
 class DataManager:
     """
     Comprehensive data management for IV measurements
@@ -171,6 +278,64 @@ class DataManager:
         
         # Analysis cache
         self.analysis_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Live data of the running/last measurement, one buffer per sweep.
+        # This is the only copy of the samples; the plots read views of it.
+        self.live_data: Dict[int, MeasurementBuffer] = {}
+    
+    def clear_live_data(self):
+        """Discard live measurement data"""
+        self.live_data.clear()
+    
+    def export_live_data(self, filename: str, sweep_numbers: List[int]) -> Tuple[int, Dict[int, int]]:
+        """
+        Export live sweep data to CSV, one sweep at a time
+        
+        Live buffers only keep the newest points of long sweeps. Sweeps that
+        lost points are exported truncated and listed in '#' comment lines at
+        the top of the file; the complete data is in the measurement file.
+        
+        Args:
+            filename: Destination CSV file
+            sweep_numbers: Sweeps to export (in this order)
+            
+        Returns:
+            Tuple of (number of data points written, {sweep_number: points missing})
+        """
+        columns = ['sweep_number', 'voltage', 'current', 'time', 'resistance']
+        total_points = 0
+        truncated = {sweep_num: self.live_data[sweep_num].dropped for sweep_num in sweep_numbers
+                     if sweep_num in self.live_data and self.live_data[sweep_num].dropped}
+        
+        with open(filename, 'w', newline='') as fp:
+            for sweep_num, dropped in truncated.items():
+                fp.write(f"# sweep {sweep_num}: oldest {dropped} points not included "
+                         f"(live buffer limit), see the measurement file for full data\n")
+            fp.write(",".join(columns) + "\n")
+            
+            for sweep_num in sweep_numbers:
+                if sweep_num not in self.live_data:
+                    continue
+                
+                # DataFrame over the buffer views; peak memory is O(points per sweep)
+                voltage, current, timestamps = self.live_data[sweep_num].get_array()
+                resistance = np.full_like(voltage, np.inf)
+                np.divide(voltage, current, out=resistance, where=np.abs(current) > 1e-12)
+                
+                df = pd.DataFrame({
+                    'sweep_number': sweep_num,
+                    'voltage': voltage,
+                    'current': current,
+                    'time': timestamps,
+                    'resistance': resistance
+                }, columns=columns)
+                df.to_csv(fp, header=False, index=False)
+                total_points += len(df)
+        
+        logger.info(f"Exported {total_points} live data points to {filename}")
+        if truncated:
+            logger.warning(f"Export truncated by the live buffer limit (sweep: missing points): {truncated}")
+        return total_points, truncated
     
     def load_measurement_data(self, filename: str, force_reload: bool = False) -> Optional[pd.DataFrame]:
         """
@@ -194,7 +359,7 @@ class DataManager:
         
         try:
             # Load CSV data
-            data = pd.read_csv(file_path)
+            data = pd.read_csv(file_path, comment='#')
             
             # Convert timestamp to datetime if present
             if 'timestamp' in data.columns:
@@ -8,21 +8,103 @@ from tkinter import ttk, filedialog, messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
+from matplotlib import transforms as mtransforms
 import numpy as np
 import pandas as pd
 import threading
-import queue
+import functools
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable, Tuple
 import logging
 
 from keithley_driver import Keithley2634B, MeasurementSettings, SourceFunction, SenseFunction
 from measurement_engine import DataAcquisitionEngine, SweepParameters, MonitorParameters
-from data_manager import DataManager
+from data_manager import DataManager, MeasurementBuffer
 
 logger = logging.getLogger(__name__)
 
+# Classification of settings-pull failures (checked in priority order)
+_PULL_ERROR_RE = re.compile(r'timeout|not connected|query', re.IGNORECASE)
+_PULL_ERROR_REASONS = {
+    'timeout': "Communication timeout - instrument may be busy",
+    'not connected': "Instrument not properly connected",
+    'query': "Invalid command or instrument response",
+}
+
+# Keystroke validation patterns (accept partial input such as "-", "1." or "1e-")
+_FLOAT_INPUT_RE = re.compile(r'[+-]?(\d+\.?\d*|\.\d*)?([eE][+-]?\d*)?')
+_INT_INPUT_RE = re.compile(r'\d*')
+
+
+def _safe_bool(validation_func: Callable, proposed: str) -> bool:
+    """Run a validatecommand check; empty input is allowed so fields can be cleared"""
+    if proposed == "":
+        return True
+    try:
+        return bool(validation_func(proposed))
+    except (ValueError, TypeError):
+        return False
+
+
+class FloatEntry(ttk.Entry):
+    """Entry that rejects keystrokes which can no longer form a float"""
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        vcmd = (self.register(lambda P: _safe_bool(_FLOAT_INPUT_RE.fullmatch, P)), "%P")
+        self.configure(validate="key", validatecommand=vcmd)
+
+
+class IntEntry(ttk.Entry):
+    """Entry that rejects keystrokes which can no longer form a non-negative integer"""
+    
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        vcmd = (self.register(lambda P: _safe_bool(_INT_INPUT_RE.fullmatch, P)), "%P")
+        self.configure(validate="key", validatecommand=vcmd)
+
+
+# GUI function names ("dcvolts"/"dcamps") to driver enums
+_SRC_MAP = {function.value: function for function in SourceFunction}
+_SNS_MAP = {function.value: function for function in SenseFunction}
+
+
+def _require_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Raise ValueError if a ParameterFrame value could not be read (empty or partial entry)"""
+    invalid = [name for name, value in values.items() if value is None]
+    if invalid:
+        raise ValueError(f"Invalid value for: {', '.join(invalid)}")
+    return values
+
+
+@functools.lru_cache(maxsize=4)
+def _settings_from_items(items: Tuple[Tuple[str, Any], ...]) -> MeasurementSettings:
+    """Convert sorted (name, value) pairs from MeasurementSettingsFrame to MeasurementSettings
+    
+    Values are already typed by the frame's variables (DoubleVar, IntVar, BooleanVar).
+    """
+    settings_values = _require_values(dict(items))
+    return MeasurementSettings(
+        source_function=_SRC_MAP.get(settings_values.get("source_function"), SourceFunction.CURRENT),
+        sense_function=_SNS_MAP.get(settings_values.get("sense_function"), SenseFunction.VOLTAGE),
+        source_range=settings_values.get("source_range", 1.0),
+        sense_range=settings_values.get("sense_range", 0.001),
+        source_autorange=settings_values.get("source_autorange", True),
+        sense_autorange=settings_values.get("sense_autorange", True),
+        compliance=settings_values.get("compliance", 0.001),
+        nplc=settings_values.get("nplc", 1.0),
+        filter_enable=settings_values.get("filter_enable", False),
+        filter_count=settings_values.get("filter_count", 10),
+        blank_display=settings_values.get("blank_display", False)
+    )
+
 
 class CommandConsoleDialog:
     """Advanced command console for direct TSP communication"""
@@ -177,6 +259,8 @@ class CommandConsoleDialog:
         self.append_output(f">>> {cmd_type.upper()}: {command}", "command")
         
         try:
+            # Direct commands (e.g. *RST) can change settings the driver thinks are applied
+            self.keithley.invalidate_configuration()
             if cmd_type == "query":
                 result = self.keithley.query(command)
                 self.append_output(f"<<< {result}", "response")
@@ -273,6 +357,67 @@ class CommandConsoleDialog:
 logger = logging.getLogger(__name__)
 
 
+class CallbackButton(ttk.Button):
+    """Button with an assignable callback that is enabled only in the given states"""
+    
+    def __init__(self, parent, text: str, callback: Optional[Callable] = None, 
+                 enable_in: Tuple[str, ...] = (), **kwargs):
+        self.callback = callback
+        self.enabled_states = frozenset(enable_in)
+        super().__init__(parent, text=text, command=self._fire, **kwargs)
+    
+    def _fire(self):
+        """Run the callback if one is assigned"""
+        callback = self.callback
+        if callback:
+            callback()
+    
+    def set_state(self, state: str):
+        """Enable the button if state is one of its enable_in states"""
+        self.config(state="normal" if state in self.enabled_states else "disabled")
+
+
+def _make_entry(parent, default_value: Any, options: List):
+    var = tk.StringVar(value=str(default_value))
+    return var, ttk.Entry(parent, textvariable=var, width=15)
+
+
+def _make_float_entry(parent, default_value: Any, options: List):
+    var = tk.DoubleVar(value=float(default_value))
+    return var, FloatEntry(parent, textvariable=var, width=15)
+
+
+def _make_int_entry(parent, default_value: Any, options: List):
+    var = tk.IntVar(value=int(default_value))
+    return var, IntEntry(parent, textvariable=var, width=15)
+
+
+def _make_combobox(parent, default_value: Any, options: List):
+    var = tk.StringVar(value=str(default_value))
+    return var, ttk.Combobox(parent, textvariable=var, values=options or [], width=12, state="readonly")
+
+
+def _make_checkbutton(parent, default_value: Any, options: List):
+    var = tk.BooleanVar(value=bool(default_value))
+    return var, ttk.Checkbutton(parent, variable=var)
+
+
+def _make_spinbox(parent, default_value: Any, options: List):
+    var = tk.DoubleVar(value=float(default_value))
+    return var, ttk.Spinbox(parent, textvariable=var, width=15, from_=0, to=1000, increment=0.1)
+
+
+# ParameterFrame.add_parameter widget_type -> factory(parent, default_value, options) -> (variable, widget)
+_WIDGET_FACTORIES: Dict[str, Callable[[Any, Any, List], Tuple[tk.Variable, tk.Widget]]] = {
+    "entry": _make_entry,
+    "float": _make_float_entry,
+    "int": _make_int_entry,
+    "combobox": _make_combobox,
+    "checkbutton": _make_checkbutton,
+    "spinbox": _make_spinbox,
+}
+
+
 class ParameterFrame(ttk.LabelFrame):
     """Base class for parameter input frames"""
     
@@ -280,68 +425,75 @@ class ParameterFrame(ttk.LabelFrame):
         super().__init__(parent, text=title, padding="10")
         self.variables = {}
         self.widgets = {}
+        
+        # get_values() cache, invalidated by write traces on the variables
+        self._dirty = True
+        self._cached_values: Dict[str, Any] = {}
     
     def add_parameter(self, name: str, label: str, default_value: Any, 
                      widget_type: str = "entry", options: List = None, 
                      tooltip: str = "", validation: Callable = None):
-        """Add a parameter input widget"""
+        """Add a parameter input widget
+        
+        widget_type "float" and "int" create validated entries backed by
+        DoubleVar/IntVar, so get_values() returns numbers (None while the
+        text is empty or partial, e.g. "1e-").
+        
+        A validation callable receives the proposed text on every keystroke;
+        a falsy result or ValueError rejects the keystroke.
+        """
         row = len(self.variables)
         
         # Create label
         ttk.Label(self, text=label).grid(row=row, column=0, sticky="w", padx=5, pady=2)
         
-        # Create variable
-        if widget_type == "entry":
-            var = tk.StringVar(value=str(default_value))
-            widget = ttk.Entry(self, textvariable=var, width=15)
-        elif widget_type == "combobox":
-            var = tk.StringVar(value=str(default_value))
-            widget = ttk.Combobox(self, textvariable=var, values=options or [], width=12, state="readonly")
-        elif widget_type == "checkbutton":
-            var = tk.BooleanVar(value=bool(default_value))
-            widget = ttk.Checkbutton(self, variable=var)
-        elif widget_type == "spinbox":
-            var = tk.DoubleVar(value=float(default_value))
-            widget = ttk.Spinbox(self, textvariable=var, width=15, from_=0, to=1000, increment=0.1)
-        else:
+        # Create variable and widget
+        factory = _WIDGET_FACTORIES.get(widget_type)
+        if factory is None:
             raise ValueError(f"Unknown widget type: {widget_type}")
+        var, widget = factory(self, default_value, options)
         
         widget.grid(row=row, column=1, sticky="w", padx=5, pady=2)
         
         # Store references
         self.variables[name] = var
         self.widgets[name] = widget
+        var.trace_add('write', self._mark_dirty)
+        self._dirty = True
         
-        # Add validation if provided
-        if validation and hasattr(var, 'trace'):
-            var.trace('w', lambda *args, v=var, f=validation: self._validate(v, f))
+        # Add keystroke validation if provided (rejected at the Tcl level)
+        if validation:
+            vcmd = (self.register(lambda P, f=validation: _safe_bool(f, P)), "%P")
+            widget.configure(validate="key", validatecommand=vcmd)
         
         # Add tooltip (simplified)
         if tooltip:
             self._add_tooltip(widget, tooltip)
     
-    def _validate(self, variable, validation_func):
-        """Validate input"""
-        try:
-            validation_func(variable.get())
-        except Exception as e:
-            logger.warning(f"Validation error: {e}")
-    
     def _add_tooltip(self, widget, text):
         """Add simple tooltip (placeholder implementation)"""
         # In a full implementation, you'd use a proper tooltip library
         pass
     
+    def _mark_dirty(self, *args):
+        """Invalidate the cached values (variable write trace)"""
+        self._dirty = True
+    
     def get_values(self) -> Dict[str, Any]:
         """Get all parameter values"""
-        values = {}
-        for name, var in self.variables.items():
-            try:
-                values[name] = var.get()
-            except Exception as e:
-                logger.error(f"Error getting value for {name}: {e}")
-                values[name] = None
-        return values
+        if self._dirty:
+            values = {}
+            for name, var in self.variables.items():
+                try:
+                    values[name] = var.get()
+                except tk.TclError:
+                    values[name] = None  # Empty or partial numeric entry
+                except Exception as e:
+                    logger.error(f"Error getting value for {name}: {e}")
+                    values[name] = None
+            self._cached_values = values
+            self._dirty = False
+        return dict(self._cached_values)
     
     def set_values(self, values: Dict[str, Any]):
         """Set parameter values"""
@@ -372,10 +524,10 @@ class InstrumentFrame(ParameterFrame):
         button_frame = ttk.Frame(self)
         button_frame.grid(row=3, column=0, columnspan=2, pady=10)
         
-        self.connect_btn = ttk.Button(button_frame, text="Connect", command=self.on_connect)
+        self.connect_btn = CallbackButton(button_frame, "Connect", enable_in=("disconnected",))
         self.connect_btn.pack(side="left", padx=5)
         
-        self.disconnect_btn = ttk.Button(button_frame, text="Disconnect", command=self.on_disconnect, state="disabled")
+        self.disconnect_btn = CallbackButton(button_frame, "Disconnect", enable_in=("connected",))
         self.disconnect_btn.pack(side="left", padx=5)
         
         # Output control
@@ -387,53 +539,31 @@ class InstrumentFrame(ParameterFrame):
         self.output_status_label = ttk.Label(output_frame, textvariable=self.output_status_var, foreground="red")
         self.output_status_label.pack(side="left", padx=5)
         
-        self.output_on_btn = ttk.Button(output_frame, text="Output ON", command=self.on_output_on, state="disabled")
+        self.output_on_btn = CallbackButton(output_frame, "Output ON", enable_in=("connected",))
         self.output_on_btn.pack(side="left", padx=5)
         
-        self.output_off_btn = ttk.Button(output_frame, text="Output OFF", command=self.on_output_off, state="disabled")
+        self.output_off_btn = CallbackButton(output_frame, "Output OFF", enable_in=("connected",))
         self.output_off_btn.pack(side="left", padx=5)
         
-        # Callbacks
-        self.connect_callback: Optional[Callable] = None
-        self.disconnect_callback: Optional[Callable] = None
-        self.output_on_callback: Optional[Callable] = None
-        self.output_off_callback: Optional[Callable] = None
-    
-    def on_connect(self):
-        """Handle connect button click"""
-        if self.connect_callback:
-            self.connect_callback()
-    
-    def on_disconnect(self):
-        """Handle disconnect button click"""
-        if self.disconnect_callback:
-            self.disconnect_callback()
-    
-    def on_output_on(self):
-        """Handle output on button click"""
-        if self.output_on_callback:
-            self.output_on_callback()
-    
-    def on_output_off(self):
-        """Handle output off button click"""
-        if self.output_off_callback:
-            self.output_off_callback()
+        # Buttons carry their own callbacks (assigned by MainApplication)
+        self._buttons = (self.connect_btn, self.disconnect_btn, self.output_on_btn, self.output_off_btn)
+        for btn in self._buttons:
+            btn.set_state("disconnected")
     
     def set_connected(self, connected: bool):
         """Update connection status"""
+        state = "connected" if connected else "disconnected"
+        for btn in self._buttons:
+            btn.set_state(state)
+        
         if connected:
             self.status_var.set("Connected")
-            self.connect_btn.config(state="disabled")
-            self.disconnect_btn.config(state="normal")
-            self.output_on_btn.config(state="normal")
-            self.output_off_btn.config(state="normal")
         else:
             self.status_var.set("Disconnected")
-            self.connect_btn.config(state="normal")
-            self.disconnect_btn.config(state="disabled")
-            self.output_on_btn.config(state="disabled")
-            self.output_off_btn.config(state="disabled")
             self.set_output_status(False)
+        
+        # Notify listeners (MainApplication) without polling
+        self.event_generate('<<StatusChanged>>', when='tail')
     
     def set_output_status(self, output_on: bool):
         """Update output status display"""
@@ -443,6 +573,9 @@ class InstrumentFrame(ParameterFrame):
         else:
             self.output_status_var.set("OFF")
             self.output_status_label.config(foreground="red")
+        
+        # Notify listeners (MainApplication) without polling
+        self.event_generate('<<StatusChanged>>', when='tail')
 
 
 class MeasurementSettingsFrame(ParameterFrame):
@@ -453,14 +586,15 @@ class MeasurementSettingsFrame(ParameterFrame):
         
         self.add_parameter("source_function", "Source Function:", "dcvolts", "combobox", ["dcvolts", "dcamps"])
         self.add_parameter("sense_function", "Measure Function:", "dcamps", "combobox", ["dcvolts", "dcamps"])
-        self.add_parameter("source_range", "Source Range:", "1.0")
-        self.add_parameter("sense_range", "Measure Range:", "0.001")
+        self.add_parameter("source_range", "Source Range:", 1.0, "float")
+        self.add_parameter("sense_range", "Measure Range:", 0.001, "float")
         self.add_parameter("source_autorange", "Source Auto Range:", True, "checkbutton")
         self.add_parameter("sense_autorange", "Measure Auto Range:", True, "checkbutton")
-        self.add_parameter("compliance", "Compliance:", "0.001")
-        self.add_parameter("nplc", "Integration Time (NPLC):", "1.0")
+        self.add_parameter("compliance", "Compliance:", 0.001, "float")
+        self.add_parameter("nplc", "Integration Time (NPLC):", 1.0, "float")
         self.add_parameter("filter_enable", "Enable Filter:", False, "checkbutton")
-        self.add_parameter("filter_count", "Filter Count:", "10")
+        self.add_parameter("filter_count", "Filter Count:", 10, "int")
+        self.add_parameter("blank_display", "Blank Display While Measuring:", False, "checkbutton")
         
         # Settings control buttons
         button_frame = ttk.Frame(self)
@@ -521,6 +655,9 @@ class MeasurementSettingsFrame(ParameterFrame):
         else:
             self.settings_status_var.set(message or "Not Applied")
             self.status_label.config(foreground="orange")
+        
+        # Notify listeners (MainApplication) without polling
+        self.event_generate('<<StatusChanged>>', when='tail')
     
     def set_pull_status(self, success: bool, message: str = ""):
         """Update pull settings status"""
@@ -530,6 +667,9 @@ class MeasurementSettingsFrame(ParameterFrame):
         else:
             self.pull_status_var.set(f"Pull failed: {message}")
             self.pull_status_label.config(foreground="red")
+        
+        # Notify listeners (MainApplication) without polling
+        self.event_generate('<<StatusChanged>>', when='tail')
 
 
 class SweepParametersFrame(ParameterFrame):
@@ -549,18 +689,21 @@ class SweepParametersFrame(ParameterFrame):
         # Bind double-click event for editing segments
         self.segments_listbox.bind("<Double-Button-1>", self.edit_segment)
         
+        # Typed segment storage; the listbox is only used for display
+        self._segments: List[Tuple[float, float, int]] = []
+        
         # Segment controls
         ttk.Label(self.segments_frame, text="Start:").grid(row=1, column=0, padx=2)
         self.start_var = tk.DoubleVar(value=0.0)
-        ttk.Entry(self.segments_frame, textvariable=self.start_var, width=8).grid(row=1, column=1, padx=2)
+        FloatEntry(self.segments_frame, textvariable=self.start_var, width=8).grid(row=1, column=1, padx=2)
         
         ttk.Label(self.segments_frame, text="Stop:").grid(row=2, column=0, padx=2)
         self.stop_var = tk.DoubleVar(value=1.0)
-        ttk.Entry(self.segments_frame, textvariable=self.stop_var, width=8).grid(row=2, column=1, padx=2)
+        FloatEntry(self.segments_frame, textvariable=self.stop_var, width=8).grid(row=2, column=1, padx=2)
         
         ttk.Label(self.segments_frame, text="Points:").grid(row=3, column=0, padx=2)
         self.points_var = tk.IntVar(value=11)
-        ttk.Entry(self.segments_frame, textvariable=self.points_var, width=8).grid(row=3, column=1, padx=2)
+        IntEntry(self.segments_frame, textvariable=self.points_var, width=8).grid(row=3, column=1, padx=2)
         
         # Segment buttons
         btn_frame = ttk.Frame(self.segments_frame)
@@ -571,30 +714,45 @@ class SweepParametersFrame(ParameterFrame):
         ttk.Button(btn_frame, text="Clear", command=self.clear_segments).pack(pady=2)
         
         # Other parameters
-        self.add_parameter("delay_per_point", "Delay per Point (s):", "0.1")
+        self.add_parameter("delay_per_point", "Delay per Point (s):", 0.1, "float")
         self.add_parameter("bidirectional", "Bidirectional:", False, "checkbutton")
-        self.add_parameter("settle_time", "Settle Time (s):", "0.0")
+        self.add_parameter("settle_time", "Settle Time (s):", 0.0, "float")
         
         # Initialize with default segment
         self.add_segment()
     
+    @staticmethod
+    def _format_segment(start: float, stop: float, points: int) -> str:
+        """Format a segment for display in the listbox"""
+        return f"{start}V → {stop}V ({points} pts)"
+    
     def add_segment(self):
         """Add a sweep segment"""
-        start = self.start_var.get()
-        stop = self.stop_var.get()
-        points = self.points_var.get()
+        try:
+            start = float(self.start_var.get())
+            stop = float(self.stop_var.get())
+            points = int(self.points_var.get())
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Invalid Input", "Please enter valid numeric values")
+            return
         
-        segment_str = f"{start}V → {stop}V ({points} pts)"
-        self.segments_listbox.insert(tk.END, segment_str)
+        if points <= 0:
+            messagebox.showerror("Invalid Input", "Points must be greater than 0")
+            return
+        
+        self._segments.append((start, stop, points))
+        self.segments_listbox.insert(tk.END, self._format_segment(start, stop, points))
     
     def remove_segment(self):
         """Remove selected segment"""
         selection = self.segments_listbox.curselection()
         if selection:
+            del self._segments[selection[0]]
             self.segments_listbox.delete(selection[0])
     
     def clear_segments(self):
         """Clear all segments"""
+        self._segments.clear()
         self.segments_listbox.delete(0, tk.END)
     
     def edit_segment(self, event=None):
@@ -604,17 +762,7 @@ class SweepParametersFrame(ParameterFrame):
             return
         
         index = selection[0]
-        segment_str = self.segments_listbox.get(index)
-        
-        # Parse current segment values
-        try:
-            parts = segment_str.replace('V', '').replace('(', '').replace('pts)', '').split()
-            current_start = float(parts[0])
-            current_stop = float(parts[2])
-            current_points = int(parts[3])
-        except Exception as e:
-            logger.error(f"Error parsing segment for editing: {e}")
-            return
+        current_start, current_stop, current_points = self._segments[index]
         
         # Create edit dialog
         self._show_segment_edit_dialog(index, current_start, current_stop, current_points)
@@ -648,21 +796,21 @@ class SweepParametersFrame(ParameterFrame):
         start_frame = ttk.Frame(main_frame)
         start_frame.pack(fill=tk.X, pady=2)
         ttk.Label(start_frame, text="Start (V):").pack(side=tk.LEFT)
-        start_entry = ttk.Entry(start_frame, textvariable=start_var, width=15)
+        start_entry = FloatEntry(start_frame, textvariable=start_var, width=15)
         start_entry.pack(side=tk.RIGHT)
         
         # Stop value
         stop_frame = ttk.Frame(main_frame)
         stop_frame.pack(fill=tk.X, pady=2)
         ttk.Label(stop_frame, text="Stop (V):").pack(side=tk.LEFT)
-        stop_entry = ttk.Entry(stop_frame, textvariable=stop_var, width=15)
+        stop_entry = FloatEntry(stop_frame, textvariable=stop_var, width=15)
         stop_entry.pack(side=tk.RIGHT)
         
         # Points value
         points_frame = ttk.Frame(main_frame)
         points_frame.pack(fill=tk.X, pady=2)
         ttk.Label(points_frame, text="Points:").pack(side=tk.LEFT)
-        points_entry = ttk.Entry(points_frame, textvariable=points_var, width=15)
+        points_entry = IntEntry(points_frame, textvariable=points_var, width=15)
         points_entry.pack(side=tk.RIGHT)
         
         # Buttons
@@ -671,28 +819,29 @@ class SweepParametersFrame(ParameterFrame):
         
         def save_changes():
             try:
-                new_start = start_var.get()
-                new_stop = stop_var.get()
-                new_points = points_var.get()
+                new_start = float(start_var.get())
+                new_stop = float(stop_var.get())
+                new_points = int(points_var.get())
                 
                 if new_points <= 0:
                     tk.messagebox.showerror("Invalid Input", "Points must be greater than 0")
                     return
                 
-                # Update the segment in the listbox
-                new_segment_str = f"{new_start}V → {new_stop}V ({new_points} pts)"
+                # Update the stored segment and its listbox entry
+                self._segments[index] = (new_start, new_stop, new_points)
                 self.segments_listbox.delete(index)
-                self.segments_listbox.insert(index, new_segment_str)
+                self.segments_listbox.insert(index, self._format_segment(new_start, new_stop, new_points))
                 self.segments_listbox.selection_set(index)  # Keep it selected
                 
                 dialog.destroy()
                 
-            except ValueError:
+            except (tk.TclError, ValueError):
                 tk.messagebox.showerror("Invalid Input", "Please enter valid numeric values")
         
         def delete_segment():
             result = tk.messagebox.askyesno("Delete Segment", "Are you sure you want to delete this segment?")
             if result:
+                del self._segments[index]
                 self.segments_listbox.delete(index)
                 dialog.destroy()
         
@@ -708,21 +857,7 @@ class SweepParametersFrame(ParameterFrame):
     
     def get_segments(self) -> List[Tuple[float, float, int]]:
         """Get list of sweep segments"""
-        segments = []
-        for i in range(self.segments_listbox.size()):
-            segment_str = self.segments_listbox.get(i)
-            # Parse segment string (simplified)
-            try:
-                # Extract values from "startV → stopV (points pts)"
-                parts = segment_str.replace('V', '').replace('(', '').replace('pts)', '').split()
-                start = float(parts[0])
-                stop = float(parts[2])
-                points = int(parts[3])
-                segments.append((start, stop, points))
-            except Exception as e:
-                logger.error(f"Error parsing segment: {e}")
-        
-        return segments
+        return list(self._segments)
 
 
 class MonitorParametersFrame(ParameterFrame):
@@ -731,13 +866,63 @@ class MonitorParametersFrame(ParameterFrame):
     def __init__(self, parent):
         super().__init__(parent, "Time Monitor Parameters")
         
-        self.add_parameter("duration", "Duration (s):", "60.0")
-        self.add_parameter("interval", "Interval (s):", "0.1")
-        self.add_parameter("source_level", "Source Level:", "0.0")
+        self.add_parameter("duration", "Duration (s):", 60.0, "float")
+        self.add_parameter("interval", "Interval (s):", 0.1, "float")
+        self.add_parameter("source_level", "Source Level:", 0.0, "float")
+
+
+def _assert_main_thread():
+    """Tk and matplotlib must only be touched from the main (mainloop) thread"""
+    assert threading.current_thread() is threading.main_thread(), \
+        "Plot updates must run on the Tk main thread; queue data from worker threads instead"
+
+
+def _minmax_decimate(x: np.ndarray, y: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a line to the lowest and highest point of each of `bins` index ranges
+    
+    Keeps the first and last point and the original point order, so a line
+    drawn with one bin per pixel column looks the same as the full data.
+    Returns the inputs unchanged when there are fewer than 4 points per bin.
+    """
+    n = len(y)
+    if bins <= 0 or n <= 4 * bins:
+        return x, y
+    
+    step = -(-n // bins)  # ceil(n / bins)
+    full = n - n % step
+    blocks = y[:full].reshape(-1, step)
+    starts = np.arange(0, full, step)
+    picks = [starts + blocks.argmin(axis=1), starts + blocks.argmax(axis=1), [0, n - 1]]
+    if full < n:
+        tail = y[full:]
+        picks.append([full + tail.argmin(), full + tail.argmax()])
+    
+    index = np.unique(np.concatenate(picks))  # Sorted: keeps the drawing order
+    return x[index], y[index]
+
+
+class _ExportToolbar(NavigationToolbar2Tk):
+    """Navigation toolbar whose Save button writes figures at export_dpi"""
+    
+    def __init__(self, canvas, window, export_dpi: int):
+        self.export_dpi = export_dpi
+        super().__init__(canvas, window)
+    
+    def save_figure(self, *args):
+        # The toolbar calls savefig without a dpi; scope the default to this save
+        with plt.rc_context({'savefig.dpi': self.export_dpi}):
+            return super().save_figure(*args)
 
 
 class PlotFrame(ttk.Frame):
-    """Frame for real-time plotting with sweep-based display modes"""
+    """Frame for real-time plotting with sweep-based display modes
+    
+    Threading contract: every method that touches the figure or Tk widgets
+    must be called from the Tk main thread. Measurement worker threads only
+    put data points on MainApplication.data_queue; process_data_queue (driven
+    by root.after) is the sole caller of append_point/flush.
+    """
     
     def __init__(self, parent):
         super().__init__(parent)
@@ -769,13 +954,15 @@ class PlotFrame(ttk.Frame):
         ttk.Checkbutton(auto_frame, text="Auto-follow current sweep", 
                        variable=self.auto_follow).pack()
         
-        # Create matplotlib figure
-        self.figure = Figure(figsize=(10, 6), dpi=100)
+        # Create matplotlib figure. Live plotting rasterizes at a lower DPI (Agg work
+        # scales with DPI squared); saved figures use export_dpi.
+        self.screen_dpi, self.live_dpi, self.export_dpi = 100, 72, 150
+        self.figure = Figure(figsize=(10, 6), dpi=self.screen_dpi)
         self.canvas = FigureCanvasTkAgg(self.figure, self)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
         
         # Navigation toolbar
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self)
+        self.toolbar = _ExportToolbar(self.canvas, self, self.export_dpi)
         self.toolbar.update()
         
         # Initialize plots
@@ -792,21 +979,71 @@ class PlotFrame(ttk.Frame):
         self.ax2.set_title("Time Series")
         self.ax2.grid(True, alpha=0.3)
         
-        # Enhanced data storage for sweep-based plotting
-        self.sweep_data = {}  # {sweep_number: {'voltage': [], 'current': [], 'time': []}}
+        # Enhanced data storage for sweep-based plotting. When a DataManager is
+        # attached its live_data is used so samples are stored only once.
+        self.data_manager: Optional[DataManager] = None
+        self._sweep_data: Dict[int, MeasurementBuffer] = {}
         self.current_sweep = None
         self.sweep_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', 
                            '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
         self.plot_lines = {}  # {sweep_number: {'iv_line': line, 'time_line': line}}
         self.sweep_checkboxes = {}  # {sweep_number: checkbox_var}
+        self._capacity_hint = 1024  # Preallocated points per new sweep buffer
+        self.max_points = 200_000  # Newest points kept per sweep for plotting (full data is on disk)
+        
+        # Blitting: sweep lines are animated and drawn on top of cached axes backgrounds
+        self._backgrounds = {}  # {axes: background captured after the last full draw}
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
+        # Redraw decimation: buffer every point and redraw at most once per
+        # update_interval seconds (set from PlotConfig.update_interval), when
+        # N points are pending or the stream has paused
+        self._pending_points = 0
+        self._pending_at_last_flush = 0
+        self._disp_skip = 5
+        self._last_draw = 0.0
+        self.update_interval = 0.033
+        self._needs_full_redraw = False
+        
+        # Manual axes limits: running data bounds per axes, limits only move when a
+        # point falls outside them (margin is a fraction of the data span)
+        self.limit_margin = 0.05
+        self.limit_growth = 0.5  # Live limits overshoot by this fraction of the span (O(log N) redraws)
+        self._data_bounds = {}  # {axes: [xmin, xmax, ymin, ymax]}
+        self._limits_changed = False
+        
+        # Skip drawing while hidden (frame unmapped or window iconified); points keep
+        # buffering and one full redraw catches up when the plots are shown again
+        self._visible = True
+        self._stale = False
+        toplevel = self.winfo_toplevel()
+        toplevel.bind("<Map>", self._on_map, add="+")
+        toplevel.bind("<Unmap>", self._on_unmap, add="+")
         
         self.figure.tight_layout()
+        
+        # Axes taking part in drawing/blitting; set_active() narrows this to the
+        # one plot the running measurement needs
+        self._active_axes = (self.ax1, self.ax2)
+        self._axes_positions = {ax: ax.get_position() for ax in self._active_axes}
+    
+    @property
+    def sweep_data(self) -> Dict[int, MeasurementBuffer]:
+        """Live data per sweep: {sweep_number: MeasurementBuffer}"""
+        if self.data_manager is not None:
+            return self.data_manager.live_data
+        return self._sweep_data
     
     def clear_plots(self):
         """Clear all plot data"""
         # Clear sweep data
-        self.sweep_data = {}
+        self.sweep_data.clear()
         self.current_sweep = None
+        self._backgrounds = {}
+        self._pending_points = self._pending_at_last_flush = 0
+        self._needs_full_redraw = False
+        self._data_bounds = {}
+        self._limits_changed = False
         
         # Clear plot lines
         for sweep_num, lines in self.plot_lines.items():
@@ -840,33 +1077,313 @@ class PlotFrame(ttk.Frame):
     
     def add_data_point(self, voltage: float, current: float, timestamp: float, sweep_number: int):
         """Add new data point with sweep information"""
+        self.append_point(voltage, current, timestamp, sweep_number)
+        self.flush()
+    
+    def append_point(self, voltage: float, current: float, timestamp: float, sweep_number: int):
+        """Buffer a data point without redrawing (call flush() to update the plots)"""
+        _assert_main_thread()
+        # Add data point
+        self._begin_sweep_data(sweep_number).append(voltage, current, timestamp)
+        self._pending_points += 1
+        
+        # Move the axes limits only if the new point falls outside the current view
+        if self.ax1 in self._active_axes:
+            self._extend_limits(self.ax1, voltage, voltage, current, current)
+        if self.ax2 in self._active_axes:
+            self._extend_limits(self.ax2, timestamp, timestamp, current, current)
+    
+    def extend_points(self, voltages, currents, timestamps, sweep_number: int):
+        """Buffer a batch of data points of one sweep without redrawing
+        
+        Args:
+            voltages, currents, timestamps: Equal-length sequences of the new points
+            sweep_number: Sweep the points belong to
+        """
+        _assert_main_thread()
+        voltages = np.asarray(voltages, dtype=np.float64)
+        currents = np.asarray(currents, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if not len(voltages):
+            return
+        
+        # Add data points in one vectorized copy
+        self._begin_sweep_data(sweep_number).extend(voltages, currents, timestamps)
+        self._pending_points += len(voltages)
+        
+        # Move the axes limits only if the batch reaches outside the current view
+        if self.ax1 in self._active_axes:
+            self._extend_limits_batch(self.ax1, voltages, currents)
+        if self.ax2 in self._active_axes:
+            self._extend_limits_batch(self.ax2, timestamps, currents)
+    
+    def _begin_sweep_data(self, sweep_number: int) -> MeasurementBuffer:
+        """Get the buffer for incoming points of a sweep, creating its lines if new"""
         # Initialize sweep data if new
         if sweep_number not in self.sweep_data:
-            self.sweep_data[sweep_number] = {
-                'voltage': [],
-                'current': [],
-                'time': []
-            }
+            self.sweep_data[sweep_number] = MeasurementBuffer(self._capacity_hint, self.max_points)
             self._create_sweep_checkbox(sweep_number)
             self._create_plot_lines(sweep_number)
-        
-        # Add data point
-        self.sweep_data[sweep_number]['voltage'].append(voltage)
-        self.sweep_data[sweep_number]['current'].append(current)
-        self.sweep_data[sweep_number]['time'].append(timestamp)
+            self._needs_full_redraw = True
         
         # Update current sweep tracking
+        if sweep_number != self.current_sweep:
+            self._animate_only(sweep_number)
+            self._needs_full_redraw = True
         self.current_sweep = sweep_number
         
         # Auto-follow current sweep if enabled
         if self.auto_follow.get() and self.display_mode.get() == "current":
             self.display_mode.set("current")
         
-        # Refresh plots based on current display mode
+        return self.sweep_data[sweep_number]
+    
+    def flush(self, force: bool = False):
+        """Redraw the plots once for all points buffered since the last draw
+        
+        Called once per data tick. Redraws are capped to one per update_interval
+        seconds and decimated to every Nth point (see set_disp_skip); points
+        held back are drawn on the first tick without new data. force skips
+        both limits.
+        """
+        _assert_main_thread()
+        streaming = self._pending_points != self._pending_at_last_flush
+        self._pending_at_last_flush = self._pending_points
+        if not self._pending_points:
+            return
+        
+        if not force:
+            if time.monotonic() - self._last_draw < self.update_interval:
+                return
+            if streaming and self._pending_points < self._disp_skip:
+                return
+        
+        if not self._visible or not self.winfo_viewable():
+            self._stale = True
+            return
+        
+        if self._needs_full_redraw or not self._backgrounds:
+            # New lines, legend entries or visibility changes need a full refresh
+            self.refresh_plots()
+        elif self._limits_changed:
+            # New limits invalidate the cached backgrounds (ticks, grid)
+            self._redraw_sweep(self.current_sweep, full=True)
+        else:
+            self._redraw_sweep(self.current_sweep)
+    
+    def set_active(self, plot: Optional[str]):
+        """Show only one plot ('iv' or 'time') enlarged to the whole figure, or both (None)
+        
+        Only the visible axes are drawn and blitted, so a measurement that
+        feeds one plot does not pay for the other.
+        """
+        _assert_main_thread()
+        active = {"iv": (self.ax1,), "time": (self.ax2,)}.get(plot, (self.ax1, self.ax2))
+        if active == self._active_axes:
+            return
+        
+        if len(active) == 1:
+            # Expand the remaining axes over the area both plots occupied
+            boxes = self._axes_positions.values()
+            x0 = min(box.x0 for box in boxes)
+            y0 = min(box.y0 for box in boxes)
+            x1 = max(box.x1 for box in boxes)
+            y1 = max(box.y1 for box in boxes)
+            active[0].set_position([x0, y0, x1 - x0, y1 - y0])
+        else:
+            for ax, position in self._axes_positions.items():
+                ax.set_position(position)
+        
+        for ax in (self.ax1, self.ax2):
+            ax.set_visible(ax in active)
+        self._active_axes = active
+        
+        # Rebuild limits and blit backgrounds for the new layout
+        self._backgrounds = {}
+        self.refresh_plots()
+    
+    def set_live_mode(self, live: bool):
+        """Render at live_dpi while measuring and at screen_dpi otherwise"""
+        _assert_main_thread()
+        ratio = getattr(self.canvas, 'device_pixel_ratio', 1)
+        dpi = (self.live_dpi if live else self.screen_dpi) * ratio
+        if self.figure.dpi == dpi:
+            return
+        
+        # Keep the figure the size of the widget in pixels at the new DPI
+        widget = self.canvas.get_tk_widget()
+        width, height = widget.winfo_width(), widget.winfo_height()
+        self.figure.set_dpi(dpi)
+        if width > 1 and height > 1:
+            self.figure.set_size_inches(width / dpi, height / dpi, forward=False)
+        
+        # Cached backgrounds are the wrong size now; the next draw recaptures them
+        self._backgrounds = {}
+        self._needs_full_redraw = True
+        self.canvas.draw_idle()
+    
+    def _on_map(self, event):
+        """Resume drawing when the plots or their window are mapped again"""
+        if event.widget is not self and event.widget is not self.winfo_toplevel():
+            return
+        self._visible = True
+        if self._stale:
+            self.after_idle(self._redraw_after_show)
+    
+    def _on_unmap(self, event):
+        """Stop drawing while the plots or their window are unmapped"""
+        if event.widget is self or event.widget is self.winfo_toplevel():
+            self._visible = False
+    
+    def _redraw_after_show(self):
+        """Full redraw with fresh blit backgrounds after points arrived while hidden"""
+        if not self._stale or not self.winfo_viewable():
+            return
+        self._stale = False
+        self._backgrounds = {}
         self.refresh_plots()
+    
+    def set_capacity_hint(self, points: int):
+        """Preallocate this many points for each new sweep (buffers still grow if exceeded)"""
+        self._capacity_hint = max(1, min(int(points), 1_000_000))
+    
+    def set_disp_skip(self, skip: int):
+        """Redraw the plots only every `skip` data points (1 = every point)"""
+        self._disp_skip = max(1, int(skip))
+    
+    def _redraw_sweep(self, sweep_number: int, full: bool = False):
+        """Redraw the lines of one sweep, blitting onto the cached backgrounds unless full"""
+        self._pending_points = self._pending_at_last_flush = 0
+        self._limits_changed = False
+        if sweep_number in self._get_sweeps_to_show():
+            self._set_line_data(sweep_number)
+        elif not full:
+            return
         
-        # Update sweep selection visibility
-        self._update_sweep_frame_visibility()
+        if full:
+            # draw_event recaptures the backgrounds and draws the lines
+            self.canvas.draw()
+        else:
+            self._blit_lines()
+        self._last_draw = time.monotonic()
+    
+    def _extend_limits(self, ax, x_lo: float, x_hi: float, y_lo: float, y_hi: float):
+        """Grow the running data bounds of ax and move its limits if new data is out of view"""
+        if not np.isfinite((x_lo, x_hi, y_lo, y_hi)).all():
+            return
+        
+        bounds = self._data_bounds.get(ax)
+        if bounds is None:
+            bounds = self._data_bounds[ax] = [x_lo, x_hi, y_lo, y_hi]
+        else:
+            bounds[0] = min(bounds[0], x_lo)
+            bounds[1] = max(bounds[1], x_hi)
+            bounds[2] = min(bounds[2], y_lo)
+            bounds[3] = max(bounds[3], y_hi)
+        
+        x0, x1 = ax.get_xlim()
+        below, above = x_lo < min(x0, x1), x_hi > max(x0, x1)
+        if below or above:
+            ax.set_xlim(*self._grown_limits(bounds[0], bounds[1], below, above), emit=False)
+            self._limits_changed = True
+        
+        y0, y1 = ax.get_ylim()
+        below, above = y_lo < min(y0, y1), y_hi > max(y0, y1)
+        if below or above:
+            ax.set_ylim(*self._grown_limits(bounds[2], bounds[3], below, above), emit=False)
+            self._limits_changed = True
+    
+    def _extend_limits_batch(self, ax, xs: np.ndarray, ys: np.ndarray):
+        """_extend_limits for arrays of points (non-finite points are ignored)"""
+        mask = np.isfinite(xs) & np.isfinite(ys)
+        if not mask.any():
+            return
+        xs, ys = xs[mask], ys[mask]
+        self._extend_limits(ax, xs.min(), xs.max(), ys.min(), ys.max())
+    
+    def _padded_limits(self, lo: float, hi: float) -> Tuple[float, float]:
+        """Axis limits covering [lo, hi] plus limit_margin of the span on each side"""
+        pad = (hi - lo) * self.limit_margin
+        return mtransforms.nonsingular(lo - pad, hi + pad, expander=self.limit_margin)
+    
+    def _grown_limits(self, lo: float, hi: float, below: bool, above: bool) -> Tuple[float, float]:
+        """Like _padded_limits, but leave limit_growth of the span free on the side(s) data left the view
+        
+        Data that keeps growing in one direction then moves the limits (and
+        forces a full redraw) a logarithmic number of times instead of on
+        nearly every batch.
+        """
+        span = hi - lo
+        lo -= span * (self.limit_growth if below else self.limit_margin)
+        hi += span * (self.limit_growth if above else self.limit_margin)
+        return mtransforms.nonsingular(lo, hi, expander=self.limit_margin)
+    
+    def _rescale_to_visible(self, sweeps_to_show: List[int]):
+        """Recompute the data bounds from the visible sweeps and set the limits once"""
+        self._data_bounds = {}
+        for sweep_num in sweeps_to_show:
+            buffer = self.sweep_data.get(sweep_num)
+            if buffer is None or not len(buffer):
+                continue
+            
+            voltage, current, timestamps = buffer.get_array()
+            for ax, x in ((self.ax1, voltage), (self.ax2, timestamps)):
+                mask = np.isfinite(x) & np.isfinite(current)
+                if not mask.any():
+                    continue
+                xs, ys = x[mask], current[mask]
+                bounds = [xs.min(), xs.max(), ys.min(), ys.max()]
+                old = self._data_bounds.get(ax)
+                if old is not None:
+                    bounds = [min(old[0], bounds[0]), max(old[1], bounds[1]),
+                              min(old[2], bounds[2]), max(old[3], bounds[3])]
+                self._data_bounds[ax] = bounds
+        
+        for ax, bounds in self._data_bounds.items():
+            ax.set_xlim(*self._padded_limits(bounds[0], bounds[1]), emit=False)
+            ax.set_ylim(*self._padded_limits(bounds[2], bounds[3]), emit=False)
+        self._limits_changed = False
+    
+    def _set_line_data(self, sweep_number: int):
+        """Set the IV and time line data of a sweep, decimated to the axes pixel width
+        
+        The buffers keep every point; only the drawn copy is reduced to a
+        min/max envelope of two points per pixel column.
+        """
+        voltage, current, timestamps = self.sweep_data[sweep_number].get_array()
+        lines = self.plot_lines[sweep_number]
+        lines['iv_line'].set_data(*_minmax_decimate(voltage, current, int(self.ax1.bbox.width)))
+        lines['time_line'].set_data(*_minmax_decimate(timestamps, current, int(self.ax2.bbox.width)))
+    
+    def _on_draw(self, event=None):
+        """Cache axes backgrounds after every full draw (resize, zoom, rescale)"""
+        self._backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self._active_axes}
+        self._draw_lines()
+    
+    def _draw_lines(self):
+        """Draw the animated sweep lines onto the canvas renderer"""
+        for ax in self._active_axes:
+            for line in ax.get_lines():
+                if line.get_animated():
+                    ax.draw_artist(line)
+    
+    def _animate_only(self, sweep_number: int):
+        """Blit only the lines of the sweep being fed
+        
+        Lines of other sweeps are not animated, so full draws render them into
+        the cached backgrounds and a blit redraws one line per axes.
+        """
+        for number, lines in self.plot_lines.items():
+            for line in lines.values():
+                line.set_animated(number == sweep_number)
+    
+    def _blit_lines(self):
+        """Restore cached backgrounds, redraw the sweep lines and blit the axes"""
+        for ax in self._active_axes:
+            self.canvas.restore_region(self._backgrounds[ax])
+        self._draw_lines()
+        for ax in self._active_axes:
+            self.canvas.blit(ax.bbox)
     
     def _create_sweep_checkbox(self, sweep_number: int):
         """Create checkbox for sweep selection"""
@@ -885,9 +1402,9 @@ class PlotFrame(ttk.Frame):
         color = self.sweep_colors[sweep_number % len(self.sweep_colors)]
         
         iv_line, = self.ax1.plot([], [], color=color, linewidth=1.5, 
-                                label=f'Sweep {sweep_number}', alpha=0.8)
+                                label=f'Sweep {sweep_number}', alpha=0.8, animated=True)
         time_line, = self.ax2.plot([], [], color=color, linewidth=1.5,
-                                  label=f'Sweep {sweep_number}', alpha=0.8)
+                                  label=f'Sweep {sweep_number}', alpha=0.8, animated=True)
         
         self.plot_lines[sweep_number] = {
             'iv_line': iv_line,
@@ -896,55 +1413,52 @@ class PlotFrame(ttk.Frame):
     
     def refresh_plots(self):
         """Refresh plots based on current display mode and selections"""
+        _assert_main_thread()
         # Clear existing line data
         for lines in self.plot_lines.values():
             lines['iv_line'].set_data([], [])
             lines['time_line'].set_data([], [])
         
-        display_mode = self.display_mode.get()
-        
-        if display_mode == "all":
-            # Show all sweeps
-            sweeps_to_show = list(self.sweep_data.keys())
-        elif display_mode == "current":
-            # Show only current sweep
-            sweeps_to_show = [self.current_sweep] if self.current_sweep is not None else []
-        elif display_mode == "select":
-            # Show selected sweeps
-            sweeps_to_show = [sweep_num for sweep_num, var in self.sweep_checkboxes.items() 
-                            if var.get()]
-        else:
-            sweeps_to_show = []
+        sweeps_to_show = self._get_sweeps_to_show()
         
         # Update plot data for selected sweeps
         for sweep_num in sweeps_to_show:
             if sweep_num in self.sweep_data and sweep_num in self.plot_lines:
-                data = self.sweep_data[sweep_num]
-                lines = self.plot_lines[sweep_num]
-                
-                # Update IV plot
-                lines['iv_line'].set_data(data['voltage'], data['current'])
-                
-                # Update time plot
-                lines['time_line'].set_data(data['time'], data['current'])
+                self._set_line_data(sweep_num)
         
         # Update legends
         if sweeps_to_show:
             self.ax1.legend(loc='best', fontsize=8)
             self.ax2.legend(loc='best', fontsize=8)
         
-        # Auto-scale axes
-        self.ax1.relim()
-        self.ax1.autoscale()
-        self.ax2.relim()
-        self.ax2.autoscale()
+        # Fit axes limits to the visible data (no relim/autoscale scan of every artist)
+        self._rescale_to_visible(sweeps_to_show)
         
         # Redraw canvas
         self.canvas.draw()
+        self._pending_points = self._pending_at_last_flush = 0
+        self._needs_full_redraw = False
+        self._last_draw = time.monotonic()
         
         # Update sweep selection visibility
         self._update_sweep_frame_visibility()
     
+    def _get_sweeps_to_show(self) -> List[int]:
+        """Get the sweep numbers visible in the current display mode"""
+        display_mode = self.display_mode.get()
+        
+        if display_mode == "all":
+            # Show all sweeps
+            return list(self.sweep_data.keys())
+        elif display_mode == "current":
+            # Show only current sweep
+            return [self.current_sweep] if self.current_sweep is not None else []
+        elif display_mode == "select":
+            # Show selected sweeps
+            return [sweep_num for sweep_num, var in self.sweep_checkboxes.items() 
+                    if var.get()]
+        return []
+    
     def _update_sweep_frame_visibility(self):
         """Show/hide sweep selection frame based on display mode"""
         if self.display_mode.get() == "select":
@@ -958,6 +1472,7 @@ class PlotFrame(ttk.Frame):
     
     def update_iv_plot(self, voltage: float, current: float):
         """Legacy method - kept for backward compatibility"""
+        _assert_main_thread()
         # This method is deprecated in favor of add_data_point
         # For now, we'll use sweep number 1 as default
         timestamp = datetime.now().timestamp()
@@ -965,6 +1480,7 @@ class PlotFrame(ttk.Frame):
     
     def update_time_plot(self, current: float, timestamp: float = None):
         """Legacy method - kept for backward compatibility"""
+        _assert_main_thread()
         # This method is deprecated in favor of add_data_point
         # The timestamp and current will be handled by add_data_point
         pass
@@ -977,7 +1493,7 @@ class PlotFrame(ttk.Frame):
             'display_mode': self.display_mode.get(),
             'selected_sweeps': [sweep_num for sweep_num, var in self.sweep_checkboxes.items() 
                               if var.get()],
-            'total_points': sum(len(data['voltage']) for data in self.sweep_data.values())
+            'total_points': sum(len(data) for data in self.sweep_data.values())
         }
 
 
@@ -1046,21 +1562,42 @@ class ControlFrame(ttk.Frame):
         btn_frame = ttk.Frame(self)
         btn_frame.pack(fill="x", pady=10)
         
-        self.start_btn = ttk.Button(btn_frame, text="Start", command=self.on_start, width=10)
+        self.start_btn = CallbackButton(btn_frame, "Start", self.on_start, 
+                                        enable_in=("ready",), width=10)
         self.start_btn.pack(side="left", padx=2)
         
-        self.pause_btn = ttk.Button(btn_frame, text="Pause", command=self.on_pause, state="disabled", width=10)
+        self.pause_btn = CallbackButton(btn_frame, "Pause", enable_in=("running",), width=10)
         self.pause_btn.pack(side="left", padx=2)
         
-        self.resume_btn = ttk.Button(btn_frame, text="Resume", command=self.on_resume, state="disabled", width=10)
+        self.resume_btn = CallbackButton(btn_frame, "Resume", enable_in=("paused",), width=10)
         self.resume_btn.pack(side="left", padx=2)
         
-        self.stop_btn = ttk.Button(btn_frame, text="Stop", command=self.on_stop, state="disabled", width=10)
+        self.stop_btn = CallbackButton(btn_frame, "Stop", enable_in=("running", "paused"), width=10)
         self.stop_btn.pack(side="left", padx=2)
         
-        self.clear_btn = ttk.Button(btn_frame, text="Clear Plots", command=self.on_clear, width=10)
+        self.clear_btn = CallbackButton(btn_frame, "Clear Plots", 
+                                        enable_in=("ready", "running", "paused", "stopping"), width=10)
         self.clear_btn.pack(side="left", padx=2)
         
+        self._buttons = (self.start_btn, self.pause_btn, self.resume_btn, self.stop_btn, self.clear_btn)
+        for btn in self._buttons:
+            btn.set_state("ready")
+        
+        # Plot update rate
+        plot_rate_frame = ttk.LabelFrame(self, text="Plot Updates", padding="5")
+        plot_rate_frame.pack(fill="x", pady=5)
+        
+        ttk.Label(plot_rate_frame, text="Redraw every").pack(side="left", padx=(0, 5))
+        self.disp_skip_var = tk.IntVar(value=5)
+        disp_skip_spinbox = ttk.Spinbox(plot_rate_frame, textvariable=self.disp_skip_var, 
+                                        from_=1, to=100, increment=1, width=5,
+                                        command=self.on_disp_skip_change)
+        disp_skip_spinbox.pack(side="left")
+        disp_skip_spinbox.bind("<Return>", self.on_disp_skip_change)
+        disp_skip_spinbox.bind("<FocusOut>", self.on_disp_skip_change)
+        ttk.Label(plot_rate_frame, text="points (higher = more responsive GUI)", 
+                 font=("TkDefaultFont", 8)).pack(side="left", padx=(5, 0))
+        
         # Status display
         self.status_var = tk.StringVar(value="Ready")
         status_frame = ttk.LabelFrame(self, text="Status", padding="5")
@@ -1068,6 +1605,12 @@ class ControlFrame(ttk.Frame):
         
         ttk.Label(status_frame, textvariable=self.status_var).pack()
         
+        # Transient status messages (replaces blocking info dialogs)
+        self.message_var = tk.StringVar(value="")
+        self.message_label = ttk.Label(status_frame, textvariable=self.message_var, 
+                                      font=("TkDefaultFont", 8))
+        self.message_label.pack()
+        
         # Sweep information display
         self.sweep_info_var = tk.StringVar(value="No sweeps")
         sweep_info_frame = ttk.LabelFrame(self, text="Sweep Information", padding="5")
@@ -1084,12 +1627,9 @@ class ControlFrame(ttk.Frame):
         ttk.Label(shortcuts_frame, text=shortcuts_text, 
                  font=("TkDefaultFont", 7), foreground="gray").pack()
         
-        # Callbacks
+        # Callbacks (pause/resume/stop/clear are assigned on the buttons directly)
         self.start_callback: Optional[Callable] = None
-        self.pause_callback: Optional[Callable] = None
-        self.resume_callback: Optional[Callable] = None
-        self.stop_callback: Optional[Callable] = None
-        self.clear_callback: Optional[Callable] = None
+        self.disp_skip_callback: Optional[Callable] = None
     
     def get_custom_filename(self) -> str:
         """Get custom filename from entry field"""
@@ -1194,61 +1734,46 @@ class ControlFrame(ttk.Frame):
             
             self.sweep_info_var.set(info_text)
     
+    def set_status_message(self, message: str, level: str = "info"):
+        """Show a short non-blocking message in the status area
+        
+        Args:
+            message: Text to display (empty string clears the message)
+            level: 'info', 'warning' or 'error'
+        """
+        colors = {"info": "green", "warning": "orange", "error": "red"}
+        self.message_var.set(message)
+        self.message_label.config(foreground=colors.get(level, "black"))
+    
     def on_start(self):
         """Handle start button click"""
         if self.start_callback:
             self.start_callback(self.measurement_type.get())
     
-    def on_pause(self):
-        """Handle pause button click"""
-        if self.pause_callback:
-            self.pause_callback()
-    
-    def on_resume(self):
-        """Handle resume button click"""
-        if self.resume_callback:
-            self.resume_callback()
-    
-    def on_stop(self):
-        """Handle stop button click"""
-        if self.stop_callback:
-            self.stop_callback()
-    
-    def on_clear(self):
-        """Handle clear button click"""
-        if self.clear_callback:
-            self.clear_callback()
+    def on_disp_skip_change(self, event=None):
+        """Handle plot redraw interval changes"""
+        try:
+            skip = self.disp_skip_var.get()
+        except tk.TclError:
+            return
+        if self.disp_skip_callback:
+            self.disp_skip_callback(skip)
     
     def set_measuring_state(self, state: str):
         """Update button states based on measurement status
         
         Args:
-            state: 'ready', 'running', 'paused', 'stopping'
+            state: 'ready', 'starting', 'running', 'paused', 'stopping'
         """
-        if state == "ready":
-            self.start_btn.config(state="normal")
-            self.pause_btn.config(state="disabled")
-            self.resume_btn.config(state="disabled")
-            self.stop_btn.config(state="disabled")
-            self.status_var.set("Ready")
-        elif state == "running":
-            self.start_btn.config(state="disabled")
-            self.pause_btn.config(state="normal")
-            self.resume_btn.config(state="disabled")
-            self.stop_btn.config(state="normal")
-            self.status_var.set("Measuring...")
-        elif state == "paused":
-            self.start_btn.config(state="disabled")
-            self.pause_btn.config(state="disabled")
-            self.resume_btn.config(state="normal")
-            self.stop_btn.config(state="normal")
-            self.status_var.set("Paused")
-        elif state == "stopping":
-            self.start_btn.config(state="disabled")
-            self.pause_btn.config(state="disabled")
-            self.resume_btn.config(state="disabled")
-            self.stop_btn.config(state="disabled")
-            self.status_var.set("Stopping...")
+        status_text = {"ready": "Ready", "starting": "Starting...", "running": "Measuring...", 
+                       "paused": "Paused", "stopping": "Stopping..."}
+        if state in status_text:
+            for btn in self._buttons:
+                btn.set_state(state)
+            self.status_var.set(status_text[state])
+        
+        # Notify listeners (MainApplication) without polling
+        self.event_generate('<<StatusChanged>>', when='tail')
     
     def set_measuring(self, measuring: bool):
         """Legacy method for backward compatibility"""
@@ -1275,15 +1800,65 @@ class MainApplication:
         data_dir = config_manager.current_config.data.data_directory if config_manager else "data"
         self.data_manager = DataManager(data_dir)
         
-        # Data update queue for thread-safe GUI updates
-        self.data_queue = queue.Queue()
+        # Data update queue for thread-safe GUI updates (single producer, single
+        # consumer: deque append/popleft are atomic). Items are single points or
+        # whole blocks, so the bound is on queued points, not items: a stalled GUI
+        # cannot grow memory without limit, and points that do not fit are dropped
+        # and counted (they are still saved to file)
+        self.data_queue = deque()
+        self.max_queued_points = 200_000
+        self.dropped_points = 0
+        self._queued_points = 0
+        self._queued_points_lock = threading.Lock()
+        
+        # Pending auto-clear for status bar messages
+        self._toast_after_id = None
+        
+        # Report successes in the status bar instead of modal dialogs (View menu)
+        self.quiet_success = tk.BooleanVar(value=False)
+        
+        # Hash of the last settings applied to the instrument, used to skip
+        # reconfiguration on Start when nothing changed since Apply
+        self._last_applied_hash: Optional[int] = None
+        self._last_apply_ok = False
+        
+        # Set by the engine worker thread when a measurement ends; handled on the Tk thread
+        self._measurement_done = threading.Event()
+        
+        # Blocking instrument calls from button handlers run here, one at a time,
+        # so VISA timeouts do not freeze the Tk mainloop
+        self._visa_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="visa")
+        
+        # Open VISA sessions by resource name: Disconnect only releases the
+        # instrument so a reconnect skips reopening the resource
+        self._session_pool: Dict[str, Keithley2634B] = {}
+        
+        # Output state cache (monotonic time, output_on): avoids a VISA query when
+        # the state was read or set less than status_ttl seconds ago
+        self.status_ttl = 2.0
+        self._status_cache: Optional[Tuple[float, bool]] = None
+        self._status_pending = False  # A status query is queued on the VISA worker
+        
+        # Adaptive data queue polling: fast while points arrive, backing off to
+        # _poll_max_ms during a measurement and _poll_idle_ms without one
+        # (worker threads cannot wake Tk themselves; Start kicks the poll)
+        self._poll_min_ms, self._poll_max_ms, self._poll_idle_ms = 20, 200, 1000
+        self._poll_delay_ms = self._poll_max_ms
+        self._poll_after_id = None
+        
+        # Watchdog backoff: reset to the minimum when the observed state changes,
+        # doubling up to the maximum while it stays the same
+        self._watchdog_min_ms, self._watchdog_max_ms = 500, 10000
+        self._watchdog_delay_ms = self._watchdog_min_ms
+        self._watchdog_state = None
         
         self.setup_gui()
         self.setup_callbacks()
         
-        # Start periodic GUI updates
-        self.root.after(100, self.process_data_queue)
-        self.root.after(2000, self.periodic_status_update)  # Update status every 2 seconds
+        # Status changes are event driven; only data processing and a slow watchdog are timed
+        self.root.bind_all('<<StatusChanged>>', self._on_status_changed)
+        self._poll_after_id = self.root.after(100, self.process_data_queue)
+        self.root.after(self._watchdog_delay_ms, self._watchdog)
         
         # Keyboard shortcuts
         self.root.bind('<space>', self.toggle_pause_resume)
@@ -1341,16 +1916,18 @@ class MainApplication:
                 elif event.num == 5:
                     left_canvas.yview_scroll(1, "units")
         
-        # Bind mouse wheel events to canvas and all child widgets
-        def bind_mousewheel(widget):
-            widget.bind("<MouseWheel>", _on_mousewheel)  # Windows
-            widget.bind("<Button-4>", _on_mousewheel)    # Linux
-            widget.bind("<Button-5>", _on_mousewheel)    # Linux
-            for child in widget.winfo_children():
-                bind_mousewheel(child)
+        # Bind mouse wheel once for the whole application and only scroll when
+        # the pointer is over the left panel (also covers lazily built widgets)
+        left_path = str(left_container)
+        
+        def _on_global_mousewheel(event):
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+            if widget is not None and (str(widget) + ".").startswith(left_path + "."):
+                _on_mousewheel(event)
         
-        # Apply mouse wheel binding after GUI is built
-        self.root.after(100, lambda: bind_mousewheel(left_scrollable_frame))
+        self.root.bind_all("<MouseWheel>", _on_global_mousewheel)  # Windows
+        self.root.bind_all("<Button-4>", _on_global_mousewheel)    # Linux
+        self.root.bind_all("<Button-5>", _on_global_mousewheel)    # Linux
         
         # Right panel for plots
         right_frame = ttk.Frame(main_paned)
@@ -1370,19 +1947,37 @@ class MainApplication:
         self.sweep_frame = SweepParametersFrame(param_notebook)
         param_notebook.add(self.sweep_frame, text="IV Sweep")
         
-        self.monitor_frame = MonitorParametersFrame(param_notebook)
-        param_notebook.add(self.monitor_frame, text="Time Monitor")
+        # Time monitor parameters are built on first use
+        self.monitor_frame: Optional[MonitorParametersFrame] = None
+        self._monitor_tab = ttk.Frame(param_notebook)
+        param_notebook.add(self._monitor_tab, text="Time Monitor")
+        param_notebook.bind("<<NotebookTabChanged>>", self._on_param_tab_changed)
         
         self.control_frame = ControlFrame(left_frame)
         self.control_frame.pack(fill="x", pady=5)
         
         # Right panel - plots
         self.plot_frame = PlotFrame(right_frame)
+        self.plot_frame.data_manager = self.data_manager
+        if self.config_manager:
+            self.plot_frame.update_interval = self.config_manager.current_config.plot.update_interval / 1000.0
         self.plot_frame.pack(fill="both", expand=True)
         
         # Menu bar
         self.setup_menu()
     
+    def _on_param_tab_changed(self, event):
+        """Build the time monitor parameters the first time their tab is shown"""
+        if event.widget.select() == str(self._monitor_tab):
+            self._get_monitor_frame()
+    
+    def _get_monitor_frame(self) -> MonitorParametersFrame:
+        """Get the time monitor parameter frame, creating it if needed"""
+        if self.monitor_frame is None:
+            self.monitor_frame = MonitorParametersFrame(self._monitor_tab)
+            self.monitor_frame.pack(fill="both", expand=True)
+        return self.monitor_frame
+    
     def setup_menu(self):
         """Setup menu bar"""
         menubar = tk.Menu(self.root)
@@ -1402,6 +1997,11 @@ class MainApplication:
         settings_menu.add_command(label="Save Configuration", command=self.save_config)
         settings_menu.add_command(label="Load Configuration", command=self.load_config)
         
+        # View menu
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="View", menu=view_menu)
+        view_menu.add_checkbutton(label="Quiet Success Messages", variable=self.quiet_success)
+        
         # Advanced menu
         advanced_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Advanced", menu=advanced_menu)
@@ -1411,6 +2011,8 @@ class MainApplication:
         advanced_menu.add_command(label="Force File Sync", command=self.force_file_sync)
         advanced_menu.add_separator()
         advanced_menu.add_command(label="Recover from Cache", command=self.show_cache_recovery)
+        advanced_menu.add_separator()
+        advanced_menu.add_command(label="Close Instrument Sessions", command=self.close_instrument_sessions)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -1420,10 +2022,10 @@ class MainApplication:
     def setup_callbacks(self):
         """Setup event callbacks"""
         # Instrument callbacks
-        self.instrument_frame.connect_callback = self.connect_instrument
-        self.instrument_frame.disconnect_callback = self.disconnect_instrument
-        self.instrument_frame.output_on_callback = self.output_on
-        self.instrument_frame.output_off_callback = self.output_off
+        self.instrument_frame.connect_btn.callback = self.connect_instrument
+        self.instrument_frame.disconnect_btn.callback = self.disconnect_instrument
+        self.instrument_frame.output_on_btn.callback = self.output_on
+        self.instrument_frame.output_off_btn.callback = self.output_off
         
         # Measurement settings callbacks
         self.measurement_settings_frame.apply_callback = self.apply_measurement_settings
@@ -1431,13 +2033,14 @@ class MainApplication:
         
         # Control callbacks
         self.control_frame.start_callback = self.start_measurement
-        self.control_frame.pause_callback = self.pause_measurement
-        self.control_frame.resume_callback = self.resume_measurement
-        self.control_frame.stop_callback = self.stop_measurement
-        self.control_frame.clear_callback = self.clear_plots
+        self.control_frame.pause_btn.callback = self.pause_measurement
+        self.control_frame.resume_btn.callback = self.resume_measurement
+        self.control_frame.stop_btn.callback = self.stop_measurement
+        self.control_frame.clear_btn.callback = self.clear_plots
+        self.control_frame.disp_skip_callback = self.plot_frame.set_disp_skip
     
     def connect_instrument(self):
-        """Connect to the instrument"""
+        """Connect to the instrument (opened on the VISA worker thread)"""
         try:
             values = self.instrument_frame.get_values()
             resource_name = values.get("resource_name", "")
@@ -1447,61 +2050,125 @@ class MainApplication:
                 messagebox.showerror("Error", "Please enter a VISA resource name")
                 return
             
-            self.keithley = Keithley2634B(resource_name, channel)
+            self._last_apply_ok = False
+            self.invalidate_status_cache()
             
-            if self.keithley.connect():
-                # Get data config and save directory
-                data_config = self.config_manager.current_config.data if self.config_manager else None
-                save_dir = data_config.data_directory if data_config else "data"
-                
-                self.engine = DataAcquisitionEngine(self.keithley, save_dir, data_config)
-                self.engine.add_data_callback(self.on_new_data)
-                
-                self.instrument_frame.set_connected(True)
-                self.measurement_settings_frame.set_instrument_connected(True)
-                
-                # Update output status
-                self.update_output_status()
-                
-                messagebox.showinfo("Success", "Connected to instrument successfully")
-            else:
-                messagebox.showerror("Error", "Failed to connect to instrument")
+            pooled = self._session_pool.pop(resource_name, None)
+            
+            def open_instrument():
+                if pooled is not None and pooled.channel == channel.lower() and pooled.reattach():
+                    return pooled, pooled.get_status()
+                if pooled is not None:
+                    pooled.disconnect()
+                keithley = Keithley2634B(resource_name, channel)
+                if not keithley.connect():
+                    return keithley, None
+                return keithley, keithley.get_status()
+            
+            self._submit_visa(open_instrument, self._on_connect_done, self._on_connect_error,
+                              button=self.instrument_frame.connect_btn)
                 
         except Exception as e:
             messagebox.showerror("Error", f"Connection error: {e}")
     
+    def _on_connect_done(self, result: Tuple[Keithley2634B, Optional[Dict[str, Any]]]):
+        """Finish connecting on the Tk thread"""
+        keithley, status = result
+        if status is None:
+            messagebox.showerror("Error", "Failed to connect to instrument")
+            return
+        
+        self.keithley = keithley
+        self._session_pool[keithley.resource_name] = keithley
+        
+        # Get data config and save directory
+        data_config = self.config_manager.current_config.data if self.config_manager else None
+        save_dir = data_config.data_directory if data_config else "data"
+        
+        self.engine = DataAcquisitionEngine(self.keithley, save_dir, data_config)
+        self.engine.add_data_callback(self.on_new_data)
+        self.engine.add_batch_callback(self.on_new_batch)
+        self.engine.add_completion_callback(self.on_measurement_done)
+        
+        self.instrument_frame.set_connected(True)
+        self.measurement_settings_frame.set_instrument_connected(True)
+        
+        # Update output status
+        self._set_output_state(status.get("output_on", False))
+        
+        self._notify_success("Connected to instrument successfully")
+    
+    def _on_connect_error(self, error: Exception):
+        """Report a connection failure on the Tk thread"""
+        messagebox.showerror("Error", f"Connection error: {error}")
+    
     def disconnect_instrument(self):
-        """Disconnect from the instrument"""
+        """Disconnect from the instrument (stopped and released on the VISA worker thread)"""
         try:
-            if self.engine and self.engine.is_measurement_active():
-                self.engine.stop_measurement()
+            engine, keithley = self.engine, self.keithley
+            
+            def release():
+                if engine and engine.is_measurement_active():
+                    engine.stop_measurement()
+                if keithley:
+                    # Output off only; the session stays in the pool for the next connect
+                    keithley.release()
             
-            if self.keithley:
-                self.keithley.disconnect()
-                self.keithley = None
+            def done(_):
+                self._notify_success("Disconnected from instrument")
             
+            def failed(error):
+                messagebox.showerror("Error", f"Disconnect error: {error}")
+            
+            self.keithley = None
             self.engine = None
+            self._last_apply_ok = False
+            self.invalidate_status_cache()
             self.instrument_frame.set_connected(False)
             self.measurement_settings_frame.set_instrument_connected(False)
             self.control_frame.set_measuring_state("ready")
             
-            messagebox.showinfo("Success", "Disconnected from instrument")
+            self._submit_visa(release, done, failed)
             
         except Exception as e:
             messagebox.showerror("Error", f"Disconnect error: {e}")
     
+    def close_instrument_sessions(self):
+        """Disconnect and fully close all pooled VISA sessions (on the VISA worker thread)"""
+        if self.keithley:
+            self.disconnect_instrument()
+        
+        sessions = list(self._session_pool.values())
+        self._session_pool.clear()
+        
+        def close():
+            for keithley in sessions:
+                keithley.disconnect()
+        
+        self._submit_visa(close, lambda _: self._toast("Instrument sessions closed"),
+                          lambda error: messagebox.showerror("Error", f"Failed to close sessions: {error}"))
+    
+    def close_session_pool(self):
+        """Close every pooled VISA session"""
+        for keithley in self._session_pool.values():
+            keithley.disconnect()
+        self._session_pool.clear()
+    
     def output_on(self):
         """Turn instrument output on"""
         if not self.keithley:
             messagebox.showerror("Error", "No instrument connected")
             return
         
-        try:
-            self.keithley.output_on()
-            self.update_output_status()
-            messagebox.showinfo("Success", "Output turned ON")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to turn output on: {e}")
+        def done(_):
+            self._set_output_state(True)  # Known state, no need to query it back
+            self._toast("Output turned ON")
+        
+        def failed(error):
+            messagebox.showerror("Error", f"Failed to turn output on: {error}")
+        
+        self._submit_visa(self.keithley.output_on, done, failed,
+                          button=self.instrument_frame.output_on_btn)
     
     def output_off(self):
         """Turn instrument output off"""
@@ -1509,24 +2176,119 @@ class MainApplication:
             messagebox.showerror("Error", "No instrument connected")
             return
         
+        def done(_):
+            self._set_output_state(False)  # Known state, no need to query it back
+            self._toast("Output turned OFF")
+        
+        def failed(error):
+            messagebox.showerror("Error", f"Failed to turn output off: {error}")
+        
+        self._submit_visa(self.keithley.output_off, done, failed,
+                          button=self.instrument_frame.output_off_btn)
+    
+    def _toast(self, message: str, level: str = "info"):
+        """Show a status bar message that clears itself after 3 seconds
+        
+        Unlike messagebox dialogs this does not block the Tk mainloop, so the
+        data queue keeps draining while the message is visible.
+        """
+        if self._toast_after_id is not None:
+            self.root.after_cancel(self._toast_after_id)
+        
+        self.control_frame.set_status_message(message, level)
+        self._toast_after_id = self.root.after(3000, self._clear_toast)
+    
+    def _notify_success(self, message: str, title: str = "Success"):
+        """Report a success with a dialog, or in the status bar when quiet_success is set"""
+        if self.quiet_success.get():
+            self._toast(" ".join(message.split()))
+        else:
+            messagebox.showinfo(title, message)
+    
+    def _clear_toast(self):
+        """Clear the status bar message"""
+        self._toast_after_id = None
+        self.control_frame.set_status_message("")
+    
+    @staticmethod
+    def _settings_hash(settings_values: Dict[str, Any]) -> int:
+        """Stable hash of measurement settings values as read from the GUI"""
+        return hash(tuple(sorted(settings_values.items())))
+    
+    @staticmethod
+    def _build_settings(settings_values: Dict[str, Any]) -> MeasurementSettings:
+        """Build MeasurementSettings from GUI values (memoized on the values)
+        
+        The returned object may be shared between calls and must not be modified.
+        """
+        return _settings_from_items(tuple(sorted(settings_values.items())))
+    
+    def _submit_visa(self, func: Callable, on_done: Callable, on_error: Callable, *args, 
+                     button: Optional[ttk.Button] = None):
+        """Run a blocking instrument call on the VISA worker thread
+        
+        on_done(result) or on_error(exception) is called on the Tk thread
+        once the call finishes; button is disabled while it is pending.
+        """
+        if button is not None:
+            button.config(state="disabled")
+        future = self._visa_exec.submit(func, *args)
+        self.root.after(50, self._poll_future, future, on_done, on_error, button)
+    
+    def _poll_future(self, future: Future, on_done: Callable, on_error: Callable, 
+                     button: Optional[ttk.Button]):
+        """Dispatch the result of a _submit_visa call once it is done"""
+        if not future.done():
+            self.root.after(50, self._poll_future, future, on_done, on_error, button)
+            return
+        
+        if button is not None:
+            button.config(state="normal")
         try:
-            self.keithley.output_off()
-            self.update_output_status()
-            messagebox.showinfo("Success", "Output turned OFF")
+            result = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to turn output off: {e}")
+            on_error(e)
+        else:
+            on_done(result)
     
-    def update_output_status(self):
-        """Update the output status display"""
+    def update_output_status(self, force: bool = False):
+        """Update the output status display (cached for status_ttl seconds unless force)
+        
+        The instrument is queried on the VISA worker thread; the display is
+        updated when the answer arrives.
+        """
         if not self.keithley:
             return
         
-        try:
-            status = self.keithley.get_status()
-            output_on = status.get("output_on", False)
-            self.instrument_frame.set_output_status(output_on)
-        except Exception as e:
-            logger.error(f"Failed to update output status: {e}")
+        cache = self._status_cache
+        if not force and cache is not None and time.monotonic() - cache[0] < self.status_ttl:
+            self.instrument_frame.set_output_status(cache[1])
+            return
+        
+        if self._status_pending:
+            return
+        self._status_pending = True
+        keithley = self.keithley
+        
+        def done(status: Dict[str, Any]):
+            self._status_pending = False
+            if self.keithley is keithley:
+                self._set_output_state(status.get("output_on", False))
+        
+        def failed(error):
+            self._status_pending = False
+            logger.error(f"Failed to update output status: {error}")
+        
+        self._submit_visa(keithley.get_status, done, failed)
+    
+    def _set_output_state(self, output_on: bool):
+        """Record a known output state in the cache and the display"""
+        self._status_cache = (time.monotonic(), output_on)
+        self.instrument_frame.set_output_status(output_on)
+    
+    def invalidate_status_cache(self):
+        """Force the next update_output_status() to query the instrument"""
+        self._status_cache = None
     
     def apply_measurement_settings(self):
         """Apply measurement settings to the instrument"""
@@ -1537,36 +2299,41 @@ class MainApplication:
         try:
             # Get measurement settings
             settings_values = self.measurement_settings_frame.get_values()
-            settings = MeasurementSettings(
-                source_function=SourceFunction.VOLTAGE if settings_values.get("source_function") == "dcvolts" else SourceFunction.CURRENT,
-                sense_function=SenseFunction.CURRENT if settings_values.get("sense_function") == "dcamps" else SenseFunction.VOLTAGE,
-                source_range=float(settings_values.get("source_range", 1.0)),
-                sense_range=float(settings_values.get("sense_range", 0.001)),
-                source_autorange=bool(settings_values.get("source_autorange", True)),
-                sense_autorange=bool(settings_values.get("sense_autorange", True)),
-                compliance=float(settings_values.get("compliance", 0.001)),
-                nplc=float(settings_values.get("nplc", 1.0)),
-                filter_enable=bool(settings_values.get("filter_enable", False)),
-                filter_count=int(settings_values.get("filter_count", 10))
-            )
+            settings = self._build_settings(settings_values)
             
-            # Apply settings to instrument with error checking
-            success, errors = self.keithley.configure_measurement_with_error_check(settings)
-            
-            if success:
-                self.measurement_settings_frame.set_settings_applied(True)
-                messagebox.showinfo("Success", "Measurement settings applied to instrument successfully!")
-            else:
-                error_msg = "Configuration failed with errors:\n\n" + "\n".join(errors[:5])  # Show first 5 errors
-                if len(errors) > 5:
-                    error_msg += f"\n... and {len(errors) - 5} more errors"
-                
-                self.measurement_settings_frame.set_settings_applied(False, f"Errors: {len(errors)} found")
-                messagebox.showerror("Configuration Errors", error_msg)
+            # Apply settings to instrument with error checking (turns the output off).
+            # Every step is sent: the user may have changed the instrument meanwhile
+            self._last_apply_ok = False
+            self.invalidate_status_cache()
+            settings_hash = self._settings_hash(settings_values)
+            self._submit_visa(functools.partial(self.keithley.configure_measurement_with_error_check, force=True),
+                              lambda result: self._on_apply_done(result, settings_hash),
+                              self._on_apply_error, settings,
+                              button=self.measurement_settings_frame.apply_btn)
             
         except Exception as e:
-            self.measurement_settings_frame.set_settings_applied(False, f"Error: {str(e)[:30]}...")
-            messagebox.showerror("Error", f"Failed to apply settings: {e}")
+            self._on_apply_error(e)
+    
+    def _on_apply_done(self, result: Tuple[bool, List[str]], settings_hash: int):
+        """Report the result of applying settings on the Tk thread"""
+        success, errors = result
+        if success:
+            self._last_applied_hash = settings_hash
+            self._last_apply_ok = True
+            self.measurement_settings_frame.set_settings_applied(True)
+            self._toast("Measurement settings applied to instrument")
+        else:
+            error_msg = "Configuration failed with errors:\n\n" + "\n".join(errors[:5])  # Show first 5 errors
+            if len(errors) > 5:
+                error_msg += f"\n... and {len(errors) - 5} more errors"
+            
+            self.measurement_settings_frame.set_settings_applied(False, f"Errors: {len(errors)} found")
+            messagebox.showerror("Configuration Errors", error_msg)
+    
+    def _on_apply_error(self, error: Exception):
+        """Report a failure to apply settings on the Tk thread"""
+        self.measurement_settings_frame.set_settings_applied(False, f"Error: {str(error)[:30]}...")
+        messagebox.showerror("Error", f"Failed to apply settings: {error}")
     
     def pull_measurement_settings(self):
         """Pull current measurement settings from the instrument"""
@@ -1574,24 +2341,18 @@ class MainApplication:
             messagebox.showerror("Error", "No instrument connected")
             return
         
+        logger.info("Pulling settings from instrument...")
+        self._submit_visa(self.keithley.read_current_settings, self._on_pull_done, self._on_pull_error,
+                          button=self.measurement_settings_frame.pull_btn)
+    
+    def _on_pull_done(self, current_settings: MeasurementSettings):
+        """Show settings read from the instrument on the Tk thread"""
         try:
-            logger.info("Pulling settings from instrument...")
-            
-            # Read current settings from instrument
-            current_settings = self.keithley.read_current_settings()
-            
-            # Update GUI fields with instrument settings
+            # Update GUI fields with instrument settings (enums as their GUI names;
+            # fields without a GUI widget are ignored by set_values)
             settings_dict = {
-                "source_function": current_settings.source_function.value,
-                "sense_function": current_settings.sense_function.value,
-                "source_range": str(current_settings.source_range),
-                "sense_range": str(current_settings.sense_range),
-                "source_autorange": current_settings.source_autorange,
-                "sense_autorange": current_settings.sense_autorange,
-                "compliance": str(current_settings.compliance),
-                "nplc": str(current_settings.nplc),
-                "filter_enable": current_settings.filter_enable,
-                "filter_count": str(current_settings.filter_count)
+                name: value.value if isinstance(value, Enum) else value
+                for name, value in asdict(current_settings).items()
             }
             
             # Set values in GUI
@@ -1601,25 +2362,23 @@ class MainApplication:
             self.measurement_settings_frame.set_pull_status(True)
             self.measurement_settings_frame.set_settings_applied(False, "Settings pulled - not yet applied")
             
-            messagebox.showinfo("Success", "Settings pulled from instrument successfully!\n\n"
-                              "Review the settings and click 'Apply to Instrument' if you want to make changes.")
+            self._toast("Settings pulled from instrument - review and click 'Apply to Instrument' to make changes")
             
         except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Failed to pull settings: {error_msg}")
-            
-            # Provide specific error feedback
-            if "timeout" in error_msg.lower():
-                reason = "Communication timeout - instrument may be busy"
-            elif "not connected" in error_msg.lower():
-                reason = "Instrument not properly connected"
-            elif "query" in error_msg.lower():
-                reason = "Invalid command or instrument response"
-            else:
-                reason = f"Unknown error: {error_msg[:50]}..."
-            
-            self.measurement_settings_frame.set_pull_status(False, reason)
-            messagebox.showerror("Error", f"Failed to pull settings from instrument:\n\n{reason}")
+            self._on_pull_error(e)
+    
+    def _on_pull_error(self, error: Exception):
+        """Report a failure to pull settings on the Tk thread"""
+        error_msg = str(error)
+        logger.error(f"Failed to pull settings: {error_msg}")
+        
+        # Provide specific error feedback
+        found = {match.lower() for match in _PULL_ERROR_RE.findall(error_msg)}
+        reason = next((text for key, text in _PULL_ERROR_REASONS.items() if key in found),
+                      f"Unknown error: {error_msg[:50]}...")
+        
+        self.measurement_settings_frame.set_pull_status(False, reason)
+        messagebox.showerror("Error", f"Failed to pull settings from instrument:\n\n{reason}")
     
     def pause_measurement(self):
         """Pause current measurement"""
@@ -1627,7 +2386,7 @@ class MainApplication:
             success = self.engine.pause_measurement()
             if success:
                 self.control_frame.set_measuring_state("paused")
-                messagebox.showinfo("Info", "Measurement paused successfully")
+                self._toast("Measurement paused")
             else:
                 messagebox.showwarning("Warning", "Failed to pause measurement")
         else:
@@ -1639,7 +2398,7 @@ class MainApplication:
             success = self.engine.resume_measurement()
             if success:
                 self.control_frame.set_measuring_state("running")
-                messagebox.showinfo("Info", "Measurement resumed successfully")
+                self._toast("Measurement resumed")
             else:
                 messagebox.showwarning("Warning", "Failed to resume measurement - check if measurement is paused")
         else:
@@ -1663,20 +2422,13 @@ class MainApplication:
             
             # Get measurement settings
             settings_values = self.measurement_settings_frame.get_values()
-            settings = MeasurementSettings(
-                source_function=SourceFunction.VOLTAGE if settings_values.get("source_function") == "dcvolts" else SourceFunction.CURRENT,
-                sense_function=SenseFunction.CURRENT if settings_values.get("sense_function") == "dcamps" else SenseFunction.VOLTAGE,
-                source_range=float(settings_values.get("source_range", 1.0)),
-                sense_range=float(settings_values.get("sense_range", 0.001)),
-                source_autorange=bool(settings_values.get("source_autorange", True)),
-                sense_autorange=bool(settings_values.get("sense_autorange", True)),
-                compliance=float(settings_values.get("compliance", 0.001)),
-                nplc=float(settings_values.get("nplc", 1.0)),
-                filter_enable=bool(settings_values.get("filter_enable", False)),
-                filter_count=int(settings_values.get("filter_count", 10))
-            )
+            settings = self._build_settings(settings_values)
             
-            # Clear plots
+            # Skip reconfiguration if these exact settings were already applied
+            reconfigure = not (self._last_apply_ok and 
+                               self._last_applied_hash == self._settings_hash(settings_values))
+            
+            # Clear plots (live rendering starts with the engine, see _start_engine)
             self.plot_frame.clear_plots()
             
             # Start appropriate measurement
@@ -1686,108 +2438,231 @@ class MainApplication:
                     messagebox.showerror("Error", "No sweep segments defined")
                     return
                 
-                sweep_values = self.sweep_frame.get_values()
+                # Each segment is plotted as its own sweep
+                self.plot_frame.set_capacity_hint(max(points for _, _, points in segments))
+                
+                sweep_values = _require_values(self.sweep_frame.get_values())
                 sweep_params = SweepParameters(
                     segments=segments,
-                    delay_per_point=float(sweep_values.get("delay_per_point", 0.1)),
-                    bidirectional=bool(sweep_values.get("bidirectional", False)),
-                    settle_time=float(sweep_values.get("settle_time", 0.0))
+                    delay_per_point=sweep_values.get("delay_per_point", 0.1),
+                    bidirectional=sweep_values.get("bidirectional", False),
+                    settle_time=sweep_values.get("settle_time", 0.0)
                 )
                 
-                if self.engine.start_iv_sweep(sweep_params, settings, custom_filename, custom_path):
-                    self.control_frame.set_measuring_state("running")
-                else:
-                    messagebox.showerror("Error", "Failed to start IV sweep")
+                self._start_engine(functools.partial(self.engine.start_iv_sweep, sweep_params, settings, 
+                                                     custom_filename, custom_path, reconfigure=reconfigure),
+                                   "iv", "Failed to start IV sweep")
             
             elif measurement_type == "time_monitor":
-                monitor_values = self.monitor_frame.get_values()
+                monitor_values = _require_values(self._get_monitor_frame().get_values())
                 monitor_params = MonitorParameters(
-                    duration=float(monitor_values.get("duration", 60.0)),
-                    interval=float(monitor_values.get("interval", 0.1)),
-                    source_level=float(monitor_values.get("source_level", 0.0))
+                    duration=monitor_values.get("duration", 60.0),
+                    interval=monitor_values.get("interval", 0.1),
+                    source_level=monitor_values.get("source_level", 0.0)
                 )
+                if monitor_params.interval > 0:
+                    self.plot_frame.set_capacity_hint(monitor_params.duration / monitor_params.interval + 1)
                 
-                if self.engine.start_time_monitor(monitor_params, settings, custom_filename, custom_path):
-                    self.control_frame.set_measuring_state("running")
-                else:
-                    messagebox.showerror("Error", "Failed to start time monitoring")
+                self._start_engine(functools.partial(self.engine.start_time_monitor, monitor_params, settings, 
+                                                     custom_filename, custom_path, reconfigure=reconfigure),
+                                   "time", "Failed to start time monitoring")
             
         except Exception as e:
             messagebox.showerror("Error", f"Measurement start error: {e}")
     
+    def _start_engine(self, start: Callable[[], bool], plot: str, failure_message: str):
+        """Run an engine start call on the VISA worker thread
+        
+        Starting configures the instrument, which can take seconds; the
+        GUI shows 'Starting...' meanwhile. plot is the plot fed by the
+        measurement ('iv' or 'time').
+        """
+        self.control_frame.set_measuring_state("starting")
+        # Switch to low-DPI live rendering; undone if the start fails
+        self.plot_frame.set_live_mode(True)
+        
+        def done(started: bool):
+            if not started:
+                self.control_frame.set_measuring_state("ready")
+                self.plot_frame.set_live_mode(False)
+                messagebox.showerror("Error", failure_message)
+                return
+            if not self.engine or not self.engine.is_measurement_active():
+                return  # Already finished; _on_measurement_finished resets the state
+            self.control_frame.set_measuring_state("running")
+            self._set_output_state(True)  # Worker turns output on
+            self.plot_frame.set_active(plot)  # Draw only the plot being fed
+            self._kick_data_poll()
+        
+        def failed(error):
+            self.control_frame.set_measuring_state("ready")
+            self.plot_frame.set_live_mode(False)
+            messagebox.showerror("Error", f"Measurement start error: {error}")
+        
+        self._submit_visa(start, done, failed)
+    
     def stop_measurement(self):
-        """Stop current measurement"""
+        """Stop current measurement (joins the worker threads on the VISA worker thread)"""
         if self.engine:
             self.control_frame.set_measuring_state("stopping")
-            self.engine.stop_measurement()
-            self.control_frame.set_measuring_state("ready")
+            
+            def stopped(_=None):
+                self.control_frame.set_measuring_state("ready")
+                self.plot_frame.set_live_mode(False)
+                self.plot_frame.set_active(None)
+                self.plot_frame.refresh_plots()
+            
+            def failed(error):
+                logger.error(f"Error stopping measurement: {error}")
+                stopped()
+            
+            self._submit_visa(self.engine.stop_measurement, stopped, failed)
     
     def clear_plots(self):
         """Clear all plots"""
         self.plot_frame.clear_plots()
+        self.plot_frame.set_active(None)
     
     def on_new_data(self, data_point: Dict[str, Any]):
-        """Handle new data point from measurement engine"""
-        # Put data in queue for thread-safe GUI update
-        self.data_queue.put(data_point)
+        """Handle new data point from measurement engine
+        
+        Called on the measurement worker thread: must not touch Tk or
+        matplotlib, only hand the point to process_data_queue.
+        """
+        self._enqueue_data(data_point, 1)
+    
+    def on_new_batch(self, sweep_number: int, voltages: np.ndarray, currents: np.ndarray, 
+                     timestamps: np.ndarray):
+        """Handle a block of points (as arrays) from the measurement engine worker thread"""
+        self._enqueue_data((sweep_number, voltages, currents, timestamps), len(voltages))
+    
+    def _enqueue_data(self, item, points: int):
+        """Queue an item of data_queue unless max_queued_points would be exceeded (worker thread)"""
+        with self._queued_points_lock:
+            if self._queued_points + points > self.max_queued_points:
+                if not self.dropped_points:
+                    logger.warning(f"GUI data queue full ({self._queued_points} points), dropping live "
+                                   f"points until it drains; the data file is unaffected")
+                self.dropped_points += points
+                return
+            self._queued_points += points
+        self.data_queue.append(item)
+    
+    def on_measurement_done(self):
+        """Handle measurement end notification from the engine worker thread"""
+        # Only flag it here; the Tk thread picks it up in process_data_queue
+        self._measurement_done.set()
     
     def process_data_queue(self):
         """Process data queue and update GUI (called periodically)"""
+        # Drain a bounded batch per tick, grouped by sweep (in arrival order). Items
+        # are point dicts (on_new_data) or (sweep, voltages, currents, timestamps)
+        # array blocks (on_new_batch); consecutive dicts are collected into lists
+        batches: Dict[int, List[tuple]] = {}
         try:
-            while not self.data_queue.empty():
-                data_point = self.data_queue.get_nowait()
+            for _ in range(min(len(self.data_queue), 500)):
+                try:
+                    item = self.data_queue.popleft()
+                except IndexError:
+                    break
                 
-                # Extract data with sweep information
-                voltage = data_point.get('voltage', 0)
-                current = data_point.get('current', 0)
-                timestamp = data_point.get('timestamp', 0)
-                sweep_number = data_point.get('sweep_number', 1)
+                with self._queued_points_lock:
+                    self._queued_points -= len(item[1]) if isinstance(item, tuple) else 1
                 
-                # Update plots with sweep-aware method
-                self.plot_frame.add_data_point(voltage, current, timestamp, sweep_number)
+                if isinstance(item, tuple):
+                    sweep_number, *block = item
+                    batches.setdefault(sweep_number, []).append(block)
+                    continue
+                
+                # Extract data with sweep information
+                chunks = batches.setdefault(item.get('sweep_number', 1), [])
+                if not chunks or not isinstance(chunks[-1][0], list):
+                    chunks.append(([], [], []))
+                voltages, currents, timestamps = chunks[-1]
+                voltages.append(item.get('voltage', 0))
+                currents.append(item.get('current', 0))
+                timestamps.append(item.get('timestamp', 0))
+            
+            # Buffer each chunk in one call; plots are redrawn once by flush()
+            for sweep_number, chunks in batches.items():
+                for voltages, currents, timestamps in chunks:
+                    self.plot_frame.extend_points(voltages, currents, timestamps, sweep_number)
+            
+            # Also flushes points held back by decimation once the stream pauses
+            self.plot_frame.flush()
+            if batches:
+                self.control_frame.update_sweep_info(self.plot_frame.get_sweep_info())
+            
+            # Finish only once all points queued before the end have been drawn
+            if self._measurement_done.is_set() and not self.data_queue:
+                self._measurement_done.clear()
+                self._on_measurement_finished()
                 
-        except queue.Empty:
-            pass
         except Exception as e:
             logger.error(f"Error processing data queue: {e}")
         
-        # Schedule next update
-        self.root.after(100, self.process_data_queue)
+        # Schedule next update: poll quickly while data flows, back off when idle
+        if batches or self.data_queue:
+            self._poll_delay_ms = self._poll_min_ms
+        else:
+            measuring = self.engine is not None and self.engine.is_measurement_active()
+            limit = self._poll_max_ms if measuring or self._measurement_done.is_set() else self._poll_idle_ms
+            self._poll_delay_ms = min(2 * self._poll_delay_ms, limit)
+        self._poll_after_id = self.root.after(self._poll_delay_ms, self.process_data_queue)
+    
+    def _kick_data_poll(self):
+        """Poll the data queue right away and at the fast rate (e.g. after Start)"""
+        if self._poll_after_id is not None:
+            self.root.after_cancel(self._poll_after_id)
+        self._poll_delay_ms = self._poll_min_ms
+        self._poll_after_id = self.root.after(self._poll_min_ms, self.process_data_queue)
+    
+    def _on_measurement_finished(self):
+        """Update GUI state after the measurement worker has ended"""
+        if self.control_frame.status_var.get() != "Ready":
+            self.control_frame.set_measuring_state("ready")
+        
+        # Show any points held back by redraw decimation at screen DPI
+        self.plot_frame.set_live_mode(False)
+        self.plot_frame.set_active(None)
+        self.plot_frame.refresh_plots()
+        
+        # The worker turns the output off when it ends
+        self.update_output_status(force=True)
+        
+        if self.dropped_points:
+            logger.warning(f"{self.dropped_points} live points were not plotted (GUI data queue full); "
+                           f"they are in the data file")
+            self._toast(f"{self.dropped_points} points were not plotted (GUI fell behind); "
+                        f"the data file is complete", "warning")
+            self.dropped_points = 0
+    
+    def _on_status_changed(self, event=None):
+        """Update widgets that depend on instrument/measurement status"""
+        try:
+            self.control_frame.update_sweep_info(self.plot_frame.get_sweep_info())
+        except Exception as e:
+            logger.error(f"Error updating status display: {e}")
     
-    def periodic_status_update(self):
-        """Periodic status update for instrument synchronization"""
+    def _watchdog(self):
+        """Liveness check of the instrument while no measurement is running (adaptive interval)"""
+        state = None
         try:
-            if self.keithley and self.keithley.is_connected:
-                # Update output status
+            connected = self.keithley is not None and self.keithley.is_connected
+            measuring = bool(self.engine and self.engine.is_measurement_active())
+            if connected and not measuring:
                 self.update_output_status()
-                
-                # Check measurement state
-                if self.engine:
-                    if not self.engine.is_measurement_active():
-                        # Measurement has finished
-                        current_state = self.control_frame.status_var.get()
-                        if current_state in ["Measuring...", "Stopping...", "Paused"]:
-                            self.control_frame.set_measuring_state("ready")
-                    elif self.engine.is_measurement_paused():
-                        # Ensure GUI shows paused state
-                        current_state = self.control_frame.status_var.get()
-                        if current_state not in ["Paused"]:
-                            self.control_frame.set_measuring_state("paused")
-                    elif self.engine.is_measurement_active() and not self.engine.is_measurement_paused():
-                        # Ensure GUI shows running state
-                        current_state = self.control_frame.status_var.get()
-                        if current_state not in ["Measuring..."]:
-                            self.control_frame.set_measuring_state("running")
-            
-            # Update sweep information display
-            sweep_info = self.plot_frame.get_sweep_info()
-            self.control_frame.update_sweep_info(sweep_info)
-            
+            state = (connected, measuring, self._status_cache[1] if self._status_cache else None)
         except Exception as e:
-            logger.error(f"Error in periodic status update: {e}")
+            logger.error(f"Error in instrument watchdog: {e}")
+        
+        if state is not None and state == self._watchdog_state:
+            self._watchdog_delay_ms = min(self._watchdog_delay_ms * 2, self._watchdog_max_ms)
+        else:
+            self._watchdog_delay_ms = self._watchdog_min_ms
+        self._watchdog_state = state
         
-        # Schedule next update
-        self.root.after(2000, self.periodic_status_update)
+        self.root.after(self._watchdog_delay_ms, self._watchdog)
     
     def load_data(self):
         """Load data from file"""
@@ -1819,6 +2694,9 @@ class MainApplication:
             return
         
         try:
+            # Direct commands may change instrument settings behind our back
+            self._last_apply_ok = False
+            self.invalidate_status_cache()
             CommandConsoleDialog(self.root, self.keithley)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open command console:\n{e}")
@@ -1890,7 +2768,7 @@ class MainApplication:
             cache_file = cache_files[selection[0]]
             try:
                 if self.engine.recover_from_cache(str(cache_file)):
-                    messagebox.showinfo("Success", f"Data recovered successfully!")
+                    self._notify_success("Data recovered successfully!")
                     dialog.destroy()
                 else:
                     messagebox.showerror("Error", "Failed to recover data from cache")
@@ -1933,29 +2811,16 @@ class MainApplication:
             return
         
         try:
-            # Get sweep data from plot frame
-            sweep_data = self.plot_frame.sweep_data
+            total_points, truncated = self.data_manager.export_live_data(filename, sorted(sweeps_to_export))
             
-            # Create comparison DataFrame
-            comparison_data = []
-            
-            for sweep_num in sorted(sweeps_to_export):
-                if sweep_num in sweep_data:
-                    data = sweep_data[sweep_num]
-                    for i in range(len(data['voltage'])):
-                        comparison_data.append({
-                            'sweep_number': sweep_num,
-                            'voltage': data['voltage'][i],
-                            'current': data['current'][i],
-                            'time': data['time'][i],
-                            'resistance': data['voltage'][i] / data['current'][i] if data['current'][i] != 0 else float('inf')
-                        })
-            
-            # Save to CSV
-            df = pd.DataFrame(comparison_data)
-            df.to_csv(filename, index=False)
-            
-            messagebox.showinfo("Success", f"Sweep comparison exported successfully!\n\nFile: {filename}\nSweeps: {sweeps_to_export}\nTotal points: {len(comparison_data)}")
+            if truncated:
+                missing = ", ".join(f"sweep {sweep}: {count}" for sweep, count in truncated.items())
+                messagebox.showwarning("Export Truncated",
+                                       f"Exported {total_points} points to {filename}, but the oldest points "
+                                       f"of long sweeps are no longer held in memory ({missing}).\n\n"
+                                       f"The file notes this; the complete data is in the measurement file.")
+            else:
+                self._notify_success(f"Sweep comparison exported successfully!\n\nFile: {filename}\nSweeps: {sweeps_to_export}\nTotal points: {total_points}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export sweep comparison:\n{e}")
@@ -1969,7 +2834,7 @@ class MainApplication:
         try:
             self.engine.force_file_sync()
             self.engine._log_file_status()
-            messagebox.showinfo("File Sync", "File synchronization forced.\nCheck console logs for detailed file status.")
+            self._notify_success("File synchronization forced.\nCheck console logs for detailed file status.", "File Sync")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to force file sync:\n{e}")
     
@@ -5,9 +5,15 @@ Professional-grade driver for IV measurements with comprehensive control
 
 import pyvisa
 import numpy as np
+import bisect
+import math
+import re
+import sys
+import threading
 import time
 import logging
 from typing import Optional, Tuple, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
@@ -16,6 +22,31 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# 2634B source/measure ranges, ascending
+_VOLTAGE_RANGES = (0.2, 2, 20, 200)
+_CURRENT_RANGES = (1e-9, 1e-8, 1e-7, 1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 1.5)
+
+
+def _closest_range(ranges: Tuple[float, ...], value: float) -> float:
+    """Range in the ascending ranges closest to abs(value) (the lower one on a tie)"""
+    magnitude = abs(value)
+    index = bisect.bisect_left(ranges, magnitude)
+    if index == 0:
+        return ranges[0]
+    if index == len(ranges):
+        return ranges[-1]
+    lower, upper = ranges[index - 1], ranges[index]
+    return lower if magnitude - lower <= upper - magnitude else upper
+
+
+def _socket_resource(resource_name: str) -> str:
+    """Raw socket form (port 5025) of a TCPIP ::INSTR resource name; other names unchanged"""
+    match = re.fullmatch(r"(TCPIP\d*)::([^:]+)(?:::inst\d+)?::INSTR", resource_name, re.IGNORECASE)
+    if not match:
+        return resource_name
+    return f"{match.group(1)}::{match.group(2)}::5025::SOCKET"
+
+
 class SourceFunction(Enum):
     """Source function enumeration"""
     VOLTAGE = "dcvolts"
@@ -34,7 +65,11 @@ class AutoRange(Enum):
     OFF = "off"
 
 
-@dataclass
+# Slotted dataclasses where supported (dataclass(slots=True) needs Python 3.10)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MeasurementSettings:
     """Data class for measurement settings"""
     source_function: SourceFunction = SourceFunction.VOLTAGE
@@ -48,6 +83,7 @@ class MeasurementSettings:
     filter_count: int = 1  # Digital filter count
     filter_enable: bool = False
     output_off_mode: str = "normal"  # normal, zero, highz
+    blank_display: bool = False  # Static front panel screen while measuring (faster, opt-in)
 
 
 class Keithley2634B:
@@ -56,14 +92,34 @@ class Keithley2634B:
     Supports both channels (smua and smub)
     """
     
-    def __init__(self, resource_name: str, channel: str = "a"):
+    # Fixed attribute set: no per-instance __dict__ (new attributes must be listed here)
+    __slots__ = (
+        'resource_name', 'channel', 'smu_name', 'rm', 'instrument',
+        'is_connected', 'settings', '_constants', '_status_cache', 'buffer_format',
+        '_applied_steps', 'status_ttl', '_lock', '_saved_screen',
+    )
+    
+    # printbuffer formats for buffer readback: format.data name -> struct datatype
+    # (None: ASCII, parsed as text; useful for debugging with a bus monitor)
+    _BUFFER_FORMATS = {"REAL64": 'd', "REAL32": 'f', "ASCII": None}
+    
+    # Longest smuX.measure.interval the instrument accepts (seconds)
+    MAX_BLOCK_INTERVAL = 1.0
+    
+    def __init__(self, resource_name: str, channel: str = "a", prefer_socket: bool = False):
         """
         Initialize the Keithley 2634B driver
         
         Args:
             resource_name: VISA resource name (e.g., "TCPIP::192.168.1.100::INSTR")
             channel: Channel to use ("a" or "b")
+            prefer_socket: Open TCPIP ::INSTR (VXI-11) resources as raw sockets on
+                port 5025 instead, which is much faster for large buffer readbacks
         """
+        if prefer_socket:
+            resource_name = _socket_resource(resource_name)
+        elif _socket_resource(resource_name) != resource_name:
+            logger.info(f"{resource_name} uses VXI-11; prefer_socket=True reads buffers faster")
         self.resource_name = resource_name
         self.channel = channel.lower()
         self.smu_name = f"smu{self.channel}"
@@ -76,6 +132,31 @@ class Keithley2634B:
         # Current settings
         self.settings = MeasurementSettings()
         
+        # Serializes instrument I/O between threads (GUI, VISA executor, measurement
+        # workers) so a query's response can't be read by another caller; held for
+        # whole write-then-read sequences such as sweeps
+        self._lock = threading.RLock()
+        
+        # Numeric values of the TSP constants used in commands, read at connect
+        self._constants: Dict[str, str] = {}
+        
+        # get_status() answers from its last result for this many seconds unless
+        # something was written to the instrument in between
+        self.status_ttl = 0.1
+        
+        # (monotonic time, status) of the last get_status() query
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Buffer readback format (see _BUFFER_FORMATS); REAL32 halves the transfer
+        # at ~7 significant digits, which also limits long timestamps
+        self.buffer_format = "REAL64"
+        
+        # Configuration steps last applied without errors, to send only what changed
+        self._applied_steps: Optional[List[Tuple[str, List[str]]]] = None
+        
+        # display.screen before set_measure_display(True), restored afterwards
+        self._saved_screen: Optional[int] = None
+        
     def connect(self) -> bool:
         """
         Connect to the instrument
@@ -85,22 +166,7 @@ class Keithley2634B:
         """
         try:
             logger.info(f"Attempting to connect to: {self.resource_name}")
-            
-            # First, check if resource manager can list resources
-            try:
-                available_resources = self.rm.list_resources()
-                logger.info(f"Available VISA resources: {available_resources}")
-                
-                if self.resource_name not in available_resources:
-                    logger.warning(f"Resource {self.resource_name} not found in available resources")
-                    logger.warning("Please check:")
-                    logger.warning("1. Instrument is powered on")
-                    logger.warning("2. GPIB cable is connected")
-                    logger.warning("3. GPIB address matches (currently set to 26)")
-                    logger.warning("4. NI-VISA and GPIB drivers are installed")
-            except Exception as rm_error:
-                logger.error(f"Cannot list VISA resources: {rm_error}")
-                logger.error("This usually indicates VISA runtime is not properly installed")
+            self._applied_steps = None  # *RST below resets the configuration
             
             # Attempt to open the resource
             logger.info("Opening VISA resource...")
@@ -109,12 +175,19 @@ class Keithley2634B:
             # Configure timeouts and termination for Keithley 2634B
             self.instrument.timeout = 15000  # 15 second timeout (Keithley can be slow)
             
-            # For GPIB instruments, set appropriate termination
+            # Keithley 2634B uses LF as termination character on every interface
+            self.instrument.read_termination = '\n'
+            self.instrument.write_termination = '\n'
+            
+            # Read long responses (buffers, batched prints) in one low-level call
+            # and do not sleep between the write and read of a query
+            self.instrument.chunk_size = 1024 * 1024
+            self.instrument.query_delay = 0.0
+            
+            # Assert END with the last byte of every write on all interfaces
+            self.instrument.send_end = True
+            
             if "GPIB" in self.resource_name.upper():
-                # Keithley 2634B uses LF as termination character
-                self.instrument.read_termination = '\n'
-                self.instrument.write_termination = '\n'
-                
                 # Set GPIB specific settings
                 try:
                     # Enable service request and set appropriate GPIB settings
@@ -138,6 +211,7 @@ class Keithley2634B:
                 
             except Exception as idn_error:
                 logger.error(f"Failed to get instrument ID: {idn_error}")
+                self._diagnose_failure()
                 self.is_connected = False
                 if self.instrument:
                     self.instrument.close()
@@ -147,7 +221,7 @@ class Keithley2634B:
             logger.info("Configuring instrument...")
             self.write("*RST")
             self.write("*CLS")
-            time.sleep(0.5)  # Give more time for reset
+            self.query("*OPC?")  # Returns once the reset has completed
             
             # Set to remote mode and disable prompts
             self.write("localnode.prompts = 0")
@@ -155,8 +229,9 @@ class Keithley2634B:
             # Test TSP communication and verify the channel exists
             try:
                 # First test basic TSP command
-                self.write("print('TSP Ready')")
-                response = self.instrument.read()
+                with self._lock:
+                    self.write("print('TSP Ready')")
+                    response = self.instrument.read()
                 logger.info(f"TSP communication test: {response.strip()}")
                 
                 # Then verify the channel exists
@@ -170,6 +245,8 @@ class Keithley2634B:
             # Clear any error queue
             self.clear_errors()
             
+            self._load_constants()
+            
             logger.info("Connection successful!")
             return True
             
@@ -190,6 +267,8 @@ class Keithley2634B:
                 logger.error("2. Instrument is not busy")
                 logger.error("3. GPIB cable integrity")
             
+            self._diagnose_failure()
+            
             self.is_connected = False
             if hasattr(self, 'instrument') and self.instrument:
                 try:
@@ -198,24 +277,101 @@ class Keithley2634B:
                     pass
             return False
     
+    def _diagnose_failure(self):
+        """Log the available VISA resources after a failed connection (the scan is slow)"""
+        try:
+            available_resources = self.rm.list_resources()
+            logger.info(f"Available VISA resources: {available_resources}")
+            
+            if self.resource_name not in available_resources:
+                logger.warning(f"Resource {self.resource_name} not found in available resources")
+                logger.warning("Please check:")
+                logger.warning("1. Instrument is powered on")
+                logger.warning("2. GPIB cable is connected")
+                logger.warning("3. GPIB address matches (currently set to 26)")
+                logger.warning("4. NI-VISA and GPIB drivers are installed")
+        except Exception as rm_error:
+            logger.error(f"Cannot list VISA resources: {rm_error}")
+            logger.error("This usually indicates VISA runtime is not properly installed")
+    
+    # TSP constants sent as numbers once read from the instrument
+    _TSP_CONSTANTS = ("OUTPUT_ON", "OUTPUT_OFF", "OUTPUT_NORMAL", "OUTPUT_DCVOLTS", "OUTPUT_DCAMPS",
+                      "AUTORANGE_ON", "AUTORANGE_OFF", "FILTER_ON", "FILTER_OFF")
+    
+    def _load_constants(self):
+        """Read the numeric values of _TSP_CONSTANTS with one query"""
+        try:
+            values = self._query_values(*(f"{self.smu_name}.{name}" for name in self._TSP_CONSTANTS))
+            self._constants = {name: str(int(float(value))) for name, value in zip(self._TSP_CONSTANTS, values)}
+        except Exception as e:
+            logger.warning(f"Could not read TSP constants, sending them by name: {e}")
+            self._constants = {}
+    
+    def _const(self, name: str) -> str:
+        """TSP constant of the SMU as its number if known, else as a symbol (e.g. smua.OUTPUT_ON)"""
+        return self._constants.get(name) or f"{self.smu_name}.{name}"
+    
     def disconnect(self):
         """Disconnect from the instrument"""
         try:
             if self.instrument:
-                self.output_off()
+                if self.is_connected:
+                    self.output_off()
                 self.instrument.close()
+                self.instrument = None
             self.is_connected = False
             logger.info("Disconnected from instrument")
         except Exception as e:
             logger.error(f"Disconnect error: {e}")
     
+    def release(self):
+        """Turn the output off and mark the driver disconnected, keeping the VISA session open"""
+        try:
+            if self.instrument and self.is_connected:
+                self.output_off()
+        except Exception as e:
+            logger.error(f"Release error: {e}")
+        finally:
+            self.is_connected = False
+        logger.info("Instrument released (VISA session kept open)")
+    
+    def reattach(self) -> bool:
+        """
+        Resume a VISA session kept open by release()
+        
+        Returns:
+            bool: True if the session still answers; False if it was closed (call connect())
+        """
+        if not self.instrument:
+            return False
+        
+        self.is_connected = True
+        self._applied_steps = None  # The instrument may have been reconfigured meanwhile
+        try:
+            idn = self.query("*IDN?")
+            self.clear_errors()
+            logger.info(f"Reattached to open session: {idn}")
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled session is stale, reopening: {e}")
+            self.is_connected = False
+            try:
+                self.instrument.close()
+            except:
+                pass
+            self.instrument = None
+            return False
+    
     def write(self, command: str):
         """Write command to instrument"""
         if not self.is_connected or not self.instrument:
             raise RuntimeError("Instrument not connected")
         
+        # Any write may change the output state or level
+        self._status_cache = None
         try:
-            self.instrument.write(command)
+            with self._lock:
+                self.instrument.write(command)
         except Exception as e:
             logger.error(f"Write error: {e}")
             raise
@@ -226,101 +382,80 @@ class Keithley2634B:
             raise RuntimeError("Instrument not connected")
         
         try:
-            return self.instrument.query(command).strip()
+            with self._lock:
+                return self.instrument.query(command).strip()
         except Exception as e:
             logger.error(f"Query error: {e}")
             raise
     
-    def configure_measurement(self, settings: MeasurementSettings):
+    def configure_measurement(self, settings: MeasurementSettings, force: bool = False) -> Tuple[bool, List[str]]:
         """
         Configure the instrument for measurement
         
+        All configuration commands are sent in one write and checked with a
+        single error-count query. Only if that reports errors is the
+        configuration repeated step by step to attribute each error.
+        
         Args:
             settings: MeasurementSettings object with all parameters
+            force: Send every step, even those unchanged since the last
+                configuration (e.g. after changes on the front panel)
+            
+        Returns:
+            Tuple of (success, error_list); communication failures raise
         """
-        self.settings = settings
-        
         logger.info("Configuring measurement settings...")
         
-        try:
-            # Configure source function (using correct TSP constants)
-            if settings.source_function == SourceFunction.VOLTAGE:
-                self.write(f"{self.smu_name}.source.func = {self.smu_name}.OUTPUT_DCVOLTS")
-            else:
-                self.write(f"{self.smu_name}.source.func = {self.smu_name}.OUTPUT_DCAMPS")
-            
-            # Configure measure function (what to measure - current vs voltage)
-            if settings.sense_function == SenseFunction.CURRENT:
-                self.write(f"{self.smu_name}.measure.func = {self.smu_name}.MEASURE_DCAMPS")
-            else:
-                self.write(f"{self.smu_name}.measure.func = {self.smu_name}.MEASURE_DCVOLTS")
-            
-            # Configure source ranges and autorange
-            if settings.source_function == SourceFunction.VOLTAGE:
-                if settings.source_autorange:
-                    self.write(f"{self.smu_name}.source.autorangev = {self.smu_name}.AUTORANGE_ON")
-                else:
-                    self.write(f"{self.smu_name}.source.autorangev = {self.smu_name}.AUTORANGE_OFF")
-                    self.write(f"{self.smu_name}.source.rangev = {settings.source_range}")
-            else:
-                if settings.source_autorange:
-                    self.write(f"{self.smu_name}.source.autorangei = {self.smu_name}.AUTORANGE_ON")
-                else:
-                    self.write(f"{self.smu_name}.source.autorangei = {self.smu_name}.AUTORANGE_OFF")
-                    self.write(f"{self.smu_name}.source.rangei = {settings.source_range}")
-            
-            # Configure measure ranges and autorange
-            if settings.sense_function == SenseFunction.CURRENT:
-                if settings.sense_autorange:
-                    self.write(f"{self.smu_name}.measure.autorangei = {self.smu_name}.AUTORANGE_ON")
-                else:
-                    self.write(f"{self.smu_name}.measure.autorangei = {self.smu_name}.AUTORANGE_OFF")
-                    self.write(f"{self.smu_name}.measure.rangei = {settings.sense_range}")
-            else:
-                if settings.sense_autorange:
-                    self.write(f"{self.smu_name}.measure.autorangev = {self.smu_name}.AUTORANGE_ON")
-                else:
-                    self.write(f"{self.smu_name}.measure.autorangev = {self.smu_name}.AUTORANGE_OFF")
-                    self.write(f"{self.smu_name}.measure.rangev = {settings.sense_range}")
-            
-            # Set compliance limits
-            if settings.source_function == SourceFunction.VOLTAGE:
-                self.write(f"{self.smu_name}.source.limiti = {settings.compliance}")
-            else:
-                self.write(f"{self.smu_name}.source.limitv = {settings.compliance}")
-            
-            # Configure integration time (NPLC)
-            self.write(f"{self.smu_name}.measure.nplc = {settings.nplc}")
-            
-            # Configure digital filter
-            if settings.filter_enable:
-                self.write(f"{self.smu_name}.measure.filter.enable = {self.smu_name}.FILTER_ON")
-                self.write(f"{self.smu_name}.measure.filter.count = {settings.filter_count}")
-            else:
-                self.write(f"{self.smu_name}.measure.filter.enable = {self.smu_name}.FILTER_OFF")
-            
-            # Configure output off mode
-            self.write(f"{self.smu_name}.source.offmode = {self.smu_name}.OUTPUT_NORMAL")
-            
-            # Small delay to let settings settle
-            time.sleep(0.1)
-            
-            logger.info("Measurement configuration completed successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to configure measurement: {e}")
-            raise
+        with self._lock:
+            try:
+                # Clear errors before configuration
+                self.clear_errors()
+                
+                if self.configure_measurement_batched(settings, force):
+                    logger.info("Measurement configuration completed successfully")
+                    return True, []
+                
+                # Re-run step by step to find out which setting failed
+                logger.warning("Batched configuration reported errors, retrying step by step")
+                self.clear_errors()
+                success, errors = self.configure_measurement_stepwise(settings)
+                if not success:
+                    logger.warning(f"Configuration completed with errors: {errors}")
+                return success, errors
+                
+            except Exception as e:
+                logger.error(f"Failed to configure measurement: {e}")
+                raise
     
     def output_on(self):
         """Turn output on"""
-        self.write(f"{self.smu_name}.source.output = {self.smu_name}.OUTPUT_ON")
+        self.write(f"{self.smu_name}.source.output = {self._const('OUTPUT_ON')}")
         logger.info("Output ON")
     
     def output_off(self):
         """Turn output off"""
-        self.write(f"{self.smu_name}.source.output = {self.smu_name}.OUTPUT_OFF")
+        self.write(f"{self.smu_name}.source.output = {self._const('OUTPUT_OFF')}")
         logger.info("Output OFF")
     
+    def set_measure_display(self, measuring: bool):
+        """
+        Show a static user screen while measuring, or restore the screen
+        shown before
+        
+        Front panel updates slow down measurements, so the display can be
+        left static during acquisition (MeasurementSettings.blank_display).
+        """
+        with self._lock:
+            if measuring:
+                if self._saved_screen is None:
+                    self._saved_screen = int(float(self.query("print(display.screen)")))
+                self.write('display.screen = display.USER; display.clear(); display.settext("Measuring...")')
+            else:
+                screen = self._saved_screen
+                self._saved_screen = None
+                self.write(f"display.screen = {screen}" if screen is not None
+                           else f"display.screen = display.{self.smu_name.upper()}")
+    
     def set_source_level(self, level: float):
         """
         Set source level (voltage or current)
@@ -340,20 +475,26 @@ class Keithley2634B:
         Returns:
             Tuple of (source_value, measured_value, resistance, timestamp)
         """
-        # Trigger measurement
-        result = self.query(f"print({self.smu_name}.measure.iv())")
+        if not self.is_connected or not self.instrument:
+            raise RuntimeError("Instrument not connected")
+        
+        # Trigger measurement; the result is "current\tvoltage", parsed by pyvisa
+        try:
+            with self._lock:
+                values = self.instrument.query_ascii_values(
+                    f"print({self.smu_name}.measure.iv())", converter='f', separator='\t')
+        except Exception as e:
+            logger.error(f"Query error: {e}")
+            raise
         
-        # Parse result - format is "current\tvoltage"
-        values = result.split('\t')
         if len(values) >= 2:
-            current = float(values[0])
-            voltage = float(values[1])
+            current, voltage = values[0], values[1]
             
             # Calculate resistance (avoid division by zero)
             if abs(current) > 1e-12:
                 resistance = voltage / current
             else:
-                resistance = float('inf')
+                resistance = math.inf
             
             timestamp = time.time()
             
@@ -364,11 +505,97 @@ class Keithley2634B:
         else:
             raise RuntimeError("Invalid measurement result")
     
+    def measure_block(self, count: int, interval: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Take hardware-timed measurements into the reading buffers and read
+        them back as one binary (REAL64) block
+        
+        Args:
+            count: Number of measurements
+            interval: Time between measurements (seconds, at most MAX_BLOCK_INTERVAL)
+            
+        Returns:
+            Tuple of (source_values, measured_values, timestamps) arrays, with
+            timestamps in seconds relative to the first measurement
+        """
+        if not 0 <= interval <= self.MAX_BLOCK_INTERVAL:
+            raise ValueError(f"Block interval must be 0 to {self.MAX_BLOCK_INTERVAL} s, got {interval}")
+        
+        smu = self.smu_name
+        count = max(1, int(count))
+        
+        with self._lock:
+            # Measure current into nvbuffer1 and voltage into nvbuffer2
+            self.write("; ".join([
+                f"{smu}.nvbuffer1.clear()",
+                f"{smu}.nvbuffer2.clear()",
+                f"{smu}.nvbuffer1.collecttimestamps = 1",
+                f"{smu}.measure.count = {count}",
+                f"{smu}.measure.interval = {interval}",
+                f"{smu}.measure.iv({smu}.nvbuffer1, {smu}.nvbuffer2)",
+                f"{smu}.measure.count = 1",
+            ]))
+            
+            return self._read_loop_buffers(count, interval)
+    
+    def _read_buffers(self, count: int, smus: Tuple[str, ...]) -> np.ndarray:
+        """
+        Read count readings of nvbuffer1 and nvbuffer2 of each SMU back as one
+        block in buffer_format (binary REAL64 by default)
+        
+        Returns:
+            float64 array of shape (count, 3 * len(smus)) with columns
+            (current, voltage, timestamp) for each SMU in turn
+        """
+        columns = ", ".join(f"{smu}.nvbuffer1.readings, {smu}.nvbuffer2.readings, {smu}.nvbuffer1.timestamps"
+                            for smu in smus)
+        
+        datatype = self._BUFFER_FORMATS[self.buffer_format]
+        data_points = 3 * len(smus) * count
+        with self._lock:
+            if datatype is None:
+                data = np.asarray(self.instrument.query_ascii_values(
+                    f"printbuffer(1, {count}, {columns})", converter='f', separator=','), dtype=np.float64)
+            else:
+                # 8 (or 4) bytes per value instead of ~14 ASCII characters, no float parsing.
+                # The format switch and restore travel in the same message as the
+                # printbuffer, so the rest of the driver always sees ASCII output.
+                data = self.instrument.query_binary_values(
+                    f"format.data = format.{self.buffer_format}; format.byteorder = format.LITTLEENDIAN; "
+                    f"printbuffer(1, {count}, {columns}); "
+                    "format.data = format.ASCII",
+                    datatype=datatype, is_big_endian=False, container=np.ndarray, data_points=data_points)
+                data = data.astype(np.float64, copy=False)
+        
+        # printbuffer interleaves the buffers reading by reading
+        return data.reshape(count, 3 * len(smus))
+    
+    def _read_iv_buffers(self, count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Read count readings of nvbuffer1 (current, with timestamps) and
+        nvbuffer2 (voltage) back as one binary (REAL64) block
+        
+        Returns:
+            Tuple of (source_values, measured_values, timestamps) arrays, with
+            timestamps in seconds relative to the first reading
+        """
+        readings = self._read_buffers(count, (self.smu_name,))
+        current, voltage, timestamps = readings[:, 0], readings[:, 1], readings[:, 2] - readings[0, 2]
+        
+        if self.settings.source_function == SourceFunction.VOLTAGE:
+            return voltage, current, timestamps
+        else:
+            return current, voltage, timestamps
+    
     def iv_sweep(self, start: float, stop: float, points: int, 
-                 delay: float = 0.0) -> List[Tuple[float, float, float, float]]:
+                 delay: float = 0.0) -> np.ndarray:
         """
         Perform IV sweep measurement
         
+        The sweep runs as a TSP loop on the instrument, filling the reading
+        buffers; the results are read back in one binary transfer instead of
+        two queries per point.
+        
         Args:
             start: Start value
             stop: Stop value  
@@ -376,63 +603,250 @@ class Keithley2634B:
             delay: Delay between points (seconds)
             
         Returns:
-            List of measurement tuples (source, measure, resistance, timestamp)
+            float64 array of shape (points, 4), one row of
+            (source, measure, resistance, timestamp) per point
         """
         if not self.is_connected:
             raise RuntimeError("Instrument not connected")
         
-        # Generate sweep points
-        sweep_values = np.linspace(start, stop, points)
-        measurements = []
+        smu = self.smu_name
+        points = max(1, int(points))
+        start, delay = float(start), float(delay)  # repr() below must give plain Lua numbers
+        step = (float(stop) - start) / (points - 1) if points > 1 else 0.0
+        level = "levelv" if self.settings.source_function == SourceFunction.VOLTAGE else "leveli"
         
-        self.output_on()
+        with self._lock:
+            # Same levels as np.linspace(start, stop, points), stepped on the instrument
+            self.write("; ".join([
+                f"{smu}.nvbuffer1.clear()",
+                f"{smu}.nvbuffer2.clear()",
+                f"{smu}.nvbuffer1.collecttimestamps = 1",
+                f"{smu}.source.{level} = {start!r}",
+                f"{smu}.source.output = {self._const('OUTPUT_ON')}",
+                f"for i = 0, {points - 1} do "
+                f"{smu}.source.{level} = {start!r} + i * {step!r} "
+                + (f"delay({delay!r}) " if delay > 0 else "")
+                + f"{smu}.measure.iv({smu}.nvbuffer1, {smu}.nvbuffer2) end",
+                f"{smu}.source.output = {self._const('OUTPUT_OFF')}",
+            ]))
+            start_time = time.time()
+            
+            try:
+                source_vals, measured_vals, offsets = self._read_loop_buffers(points, delay)
+            except Exception:
+                self.output_off()
+                raise
+        
+        return self._iv_rows(source_vals, measured_vals, start_time + offsets)
+    
+    def sweep_block(self, start: float, step: float, count: int, settle: float = 0.0,
+                    delay: float = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Step the source through start + i * step (i = 0 .. count - 1) in a TSP
+        loop, measuring at each level, and read the block back in one transfer
+        
+        The output is left as it is, so a long sweep can run as consecutive
+        blocks with the output on throughout.
+        
+        Args:
+            start: First source level
+            step: Source increment per point
+            count: Number of points
+            settle: Wait after setting each level, before measuring (seconds)
+            delay: Wait after each measurement (seconds)
+            
+        Returns:
+            Tuple of (source_values, measured_values, timestamps) arrays, with
+            timestamps in seconds relative to the first measurement
+        """
+        if not self.is_connected:
+            raise RuntimeError("Instrument not connected")
+        
+        smu = self.smu_name
+        count = max(1, int(count))
+        start, step = float(start), float(step)  # repr() below must give plain Lua numbers
+        settle, delay = float(settle), float(delay)
+        level = "levelv" if self.settings.source_function == SourceFunction.VOLTAGE else "leveli"
         
+        with self._lock:
+            self.write("; ".join([
+                f"{smu}.nvbuffer1.clear()",
+                f"{smu}.nvbuffer2.clear()",
+                f"{smu}.nvbuffer1.collecttimestamps = 1",
+                f"for i = 0, {count - 1} do "
+                f"{smu}.source.{level} = {start!r} + i * {step!r} "
+                + (f"delay({settle!r}) " if settle > 0 else "")
+                + f"{smu}.measure.iv({smu}.nvbuffer1, {smu}.nvbuffer2) "
+                + (f"delay({delay!r}) " if delay > 0 else "")
+                + "end",
+            ]))
+            
+            return self._read_loop_buffers(count, settle + delay)
+    
+    def _read_loop_buffers(self, count: int, wait_per_point: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Read back the buffers of a running TSP measurement loop (see _read_iv_buffers)"""
+        # The readback waits for the loop: allow for its duration in the timeout
+        timeout = self.instrument.timeout
+        per_point = wait_per_point + self.settings.nplc / 50.0 + 0.01
+        self.instrument.timeout = max(timeout, int(2000 * count * per_point) + timeout)
         try:
-            for value in sweep_values:
-                self.set_source_level(value)
-                
-                if delay > 0:
-                    time.sleep(delay)
-                
-                measurement = self.measure()
-                measurements.append(measurement)
-                
+            return self._read_iv_buffers(count)
         finally:
-            self.output_off()
+            self.instrument.timeout = timeout
+    
+    def _iv_rows(self, source_vals: np.ndarray, measured_vals: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+        """Stack sweep readings into (source, measure, resistance, timestamp) rows"""
+        if self.settings.source_function == SourceFunction.VOLTAGE:
+            voltages, currents = source_vals, measured_vals
+        else:
+            voltages, currents = measured_vals, source_vals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            resistances = np.where(np.abs(currents) > 1e-12, voltages / currents, np.inf)
+        
+        return np.column_stack((source_vals, measured_vals, resistances, timestamps))
+    
+    def dual_sweep(self, starts: Tuple[float, float], stops: Tuple[float, float], points: int,
+                   delay: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sweep this driver's SMU and the other SMU together in one TSP loop
+        
+        Both SMUs are first configured with self.settings (the other SMU may
+        still hold earlier or front panel settings); the sweep is not started
+        if the instrument reports errors. At each step both SMUs are set and
+        then measured with overlapped measurements, so the two readings are
+        taken at the same time.
+        
+        Args:
+            starts: Start values for (this SMU, other SMU)
+            stops: Stop values for (this SMU, other SMU)
+            points: Number of points
+            delay: Delay between setting the levels and measuring (seconds)
+            
+        Returns:
+            Tuple of (this SMU, other SMU) float64 arrays of shape (points, 4), rows
+            as in iv_sweep, with timestamps on a common time base
+        """
+        if not self.is_connected:
+            raise RuntimeError("Instrument not connected")
+        
+        smus = (self.smu_name, "smub" if self.smu_name == "smua" else "smua")
+        points = max(1, int(points))
+        delay = float(delay)
+        level = "levelv" if self.settings.source_function == SourceFunction.VOLTAGE else "leveli"
+        
+        setup, steps, measure, output_off = [], [], [], []
+        for smu, start, stop in zip(smus, starts, stops):
+            start = float(start)  # repr() below must give plain Lua numbers
+            step = (float(stop) - start) / (points - 1) if points > 1 else 0.0
+            setup += [f"{smu}.nvbuffer1.clear()", f"{smu}.nvbuffer2.clear()",
+                      f"{smu}.nvbuffer1.collecttimestamps = 1", f"{smu}.source.{level} = {start!r}",
+                      f"{smu}.source.output = {self._const('OUTPUT_ON')}"]
+            steps.append(f"{smu}.source.{level} = {start!r} + i * {step!r} ")
+            measure.append(f"{smu}.measure.overlappediv({smu}.nvbuffer1, {smu}.nvbuffer2) ")
+            output_off.append(f"{smu}.source.output = {self._const('OUTPUT_OFF')}")
+        
+        config = [command for smu in smus 
+                  for _, commands in self._build_config_steps(self.settings, smu) for command in commands]
+        
+        with self._lock:
+            # Configure both SMUs (outputs off) before anything is sourced
+            self.clear_errors()
+            self.write("; ".join(config))
+            errors = self.check_errors()
+            if errors:
+                raise RuntimeError(f"Dual sweep configuration failed: {errors}")
+            
+            self.write("; ".join(setup + [
+                f"for i = 0, {points - 1} do "
+                + "".join(steps)
+                + (f"delay({delay!r}) " if delay > 0 else "")
+                + "".join(measure)
+                + "waitcomplete() end",
+            ] + output_off))
+            start_time = time.time()
+            
+            # The readback waits for the loop: allow for its duration in the timeout
+            timeout = self.instrument.timeout
+            per_point = delay + self.settings.nplc / 50.0 + 0.01
+            self.instrument.timeout = max(timeout, int(2000 * points * per_point) + timeout)
+            try:
+                readings = self._read_buffers(points, smus)
+            except Exception:
+                self.write("; ".join(output_off))
+                raise
+            finally:
+                self.instrument.timeout = timeout
+        
+        results = []
+        for k in range(len(smus)):
+            current, voltage = readings[:, 3 * k], readings[:, 3 * k + 1]
+            timestamps = start_time + readings[:, 3 * k + 2] - readings[0, 2]
+            if self.settings.source_function == SourceFunction.VOLTAGE:
+                results.append(self._iv_rows(voltage, current, timestamps))
+            else:
+                results.append(self._iv_rows(current, voltage, timestamps))
         
-        return measurements
+        return results[0], results[1]
     
-    def monitor_current(self, duration: float, interval: float = 0.1) -> List[Tuple[float, float, float]]:
+    def monitor_current(self, duration: float, interval: float = 0.1, block_seconds: float = 0.5,
+                        stop_event: Optional[threading.Event] = None) -> np.ndarray:
         """
         Monitor current vs time
         
+        Intervals up to MAX_BLOCK_INTERVAL are timed by the instrument and read
+        back in blocks of about block_seconds (measure_block); longer ones are
+        measured point by point on a monotonic schedule. The instrument lock
+        is released between blocks and points, and the run ends early once
+        stop_event is set.
+        
         Args:
             duration: Total monitoring duration (seconds)
             interval: Measurement interval (seconds)
+            block_seconds: Measurement time per block transfer (seconds)
+            stop_event: Optional event that ends the monitoring early
             
         Returns:
-            List of (current, voltage, timestamp) tuples
+            float64 array of shape (N, 3), one row of (current, voltage, timestamp) per point
         """
         if not self.is_connected:
             raise RuntimeError("Instrument not connected")
         
-        measurements = []
-        start_time = time.time()
+        interval = float(interval)
+        count = max(1, int(duration / interval)) if interval > 0 else 1
+        rows = []
         
         self.output_on()
-        
         try:
-            while time.time() - start_time < duration:
-                measurement = self.measure()
-                # For time monitoring, we typically want (current, voltage, time)
-                measurements.append((measurement[1], measurement[0], measurement[3]))
-                
-                time.sleep(interval)
-                
+            if interval <= self.MAX_BLOCK_INTERVAL:
+                block_size = max(1, int(block_seconds / interval)) if interval > 0 else count
+                taken = 0
+                while taken < count and not (stop_event and stop_event.is_set()):
+                    block_start = time.time()
+                    source_vals, measured_vals, offsets = self.measure_block(
+                        min(block_size, count - taken), interval)
+                    # For time monitoring, we typically want (current, voltage, time)
+                    rows.append(np.column_stack((measured_vals, source_vals, block_start + offsets)))
+                    taken += len(source_vals)
+            else:
+                next_point = time.monotonic()
+                for _ in range(count):
+                    if stop_event and stop_event.is_set():
+                        break
+                    source_val, measured_val, _, timestamp = self.measure()
+                    rows.append(np.array([[measured_val, source_val, timestamp]]))
+                    
+                    # Wait for the next point (stop_event ends the wait early)
+                    next_point += interval
+                    delay = next_point - time.monotonic()
+                    if delay > 0:
+                        if stop_event:
+                            stop_event.wait(delay)
+                        else:
+                            time.sleep(delay)
         finally:
             self.output_off()
         
-        return measurements
+        return np.concatenate(rows) if rows else np.empty((0, 3))
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -444,22 +858,41 @@ class Keithley2634B:
         if not self.is_connected:
             return {"connected": False}
         
+        cache = self._status_cache
+        if cache is not None and time.monotonic() - cache[0] < self.status_ttl:
+            return dict(cache[1])
+        
         try:
             # Get basic status
-            output_state = self.query(f"print({self.smu_name}.source.output)")
-            source_level = self.query(f"print({self.smu_name}.source.levelv)")
+            output_state, source_level = self._query_values(
+                f"{self.smu_name}.source.output", f"{self.smu_name}.source.levelv")
             
-            return {
+            status = {
                 "connected": True,
                 "output_on": "1" in output_state,
                 "source_level": float(source_level),
                 "channel": self.channel,
                 "settings": self.settings
             }
+            self._status_cache = (time.monotonic(), status)
+            return dict(status)
         except Exception as e:
             logger.error(f"Status query error: {e}")
             return {"connected": False, "error": str(e)}
     
+    def _query_values(self, *expressions: str) -> List[str]:
+        """
+        Read several TSP expressions with a single print() query
+        
+        Returns:
+            The printed values as strings, in the order given
+        """
+        response = self.query(f"print({', '.join(expressions)})")
+        values = [value.strip() for value in response.split("\t")]
+        if len(values) != len(expressions):
+            raise ValueError(f"Expected {len(expressions)} values, got: {response!r}")
+        return values
+    
     def read_current_settings(self) -> MeasurementSettings:
         """
         Read current measurement settings from the instrument
@@ -473,54 +906,55 @@ class Keithley2634B:
         try:
             logger.info("Reading current settings from instrument...")
             
-            # Read source function
-            source_func = self.query(f"print({self.smu_name}.source.func)")
+            smu = self.smu_name
+            
+            # Read everything in one query (TSP print separates values with tabs);
+            # both the v and i variants are fetched and picked from below
+            fields = ("source.func", "source.autorangev", "source.autorangei", "source.rangev",
+                      "source.rangei", "source.limitv", "source.limiti", "measure.autorangev",
+                      "measure.autorangei", "measure.rangev", "measure.rangei", "measure.nplc",
+                      "measure.filter.enable", "measure.filter.count")
+            values = self._query_values(f"display.{self.smu_name}.measure.func", *(f"{smu}.{field}" for field in fields))
+            measure_func = values[0]
+            response = dict(zip(fields, values[1:]))
+            
+            source_func = response["source.func"]
             if "1" in source_func:  # OUTPUT_DCVOLTS = 1
                 source_function = SourceFunction.VOLTAGE
             else:
                 source_function = SourceFunction.CURRENT
             
-            # Read measure function (what is being measured)
-            measure_func = self.query(f"print(display.{self.smu_name}.measure.func)")
             if "1" in measure_func:  # MEASURE_DCAMPS = 1
                 sense_function = SenseFunction.CURRENT
             else:
                 sense_function = SenseFunction.VOLTAGE
             
-            # Read ranges and autorange settings
-            if source_function == SourceFunction.VOLTAGE:
-                source_autorange = self.query(f"print({self.smu_name}.source.autorangev)")
-                source_range = float(self.query(f"print({self.smu_name}.source.rangev)"))
-                compliance = float(self.query(f"print({self.smu_name}.source.limiti)"))
-            else:
-                source_autorange = self.query(f"print({self.smu_name}.source.autorangei)")
-                source_range = float(self.query(f"print({self.smu_name}.source.rangei)"))
-                compliance = float(self.query(f"print({self.smu_name}.source.limitv)"))
-            
-            if sense_function == SenseFunction.CURRENT:
-                sense_autorange = self.query(f"print({self.smu_name}.measure.autorangei)")
-                sense_range = float(self.query(f"print({self.smu_name}.measure.rangei)"))
-            else:
-                sense_autorange = self.query(f"print({self.smu_name}.measure.autorangev)")
-                sense_range = float(self.query(f"print({self.smu_name}.measure.rangev)"))
-            
-            # Read other settings
-            nplc = float(self.query(f"print({self.smu_name}.measure.nplc)"))
-            filter_enable = self.query(f"print({self.smu_name}.measure.filter.enable)")
-            filter_count = int(float(self.query(f"print({self.smu_name}.measure.filter.count)")))
+            # Which attributes apply (v/i) depends on the functions read above
+            src = "v" if source_function == SourceFunction.VOLTAGE else "i"
+            limit = "i" if source_function == SourceFunction.VOLTAGE else "v"
+            sense = "i" if sense_function == SenseFunction.CURRENT else "v"
+            source_autorange = response[f"source.autorange{src}"]
+            source_range = response[f"source.range{src}"]
+            compliance = response[f"source.limit{limit}"]
+            sense_autorange = response[f"measure.autorange{sense}"]
+            sense_range = response[f"measure.range{sense}"]
+            nplc = response["measure.nplc"]
+            filter_enable = response["measure.filter.enable"]
+            filter_count = response["measure.filter.count"]
             
             # Create settings object
             settings = MeasurementSettings(
                 source_function=source_function,
                 sense_function=sense_function,
-                source_range=source_range,
-                sense_range=sense_range,
+                source_range=float(source_range),
+                sense_range=float(sense_range),
                 source_autorange="1" in source_autorange,
                 sense_autorange="1" in sense_autorange,
-                compliance=compliance,
-                nplc=nplc,
+                compliance=float(compliance),
+                nplc=float(nplc),
                 filter_enable="1" in filter_enable,
-                filter_count=filter_count
+                filter_count=int(float(filter_count)),
+                blank_display=self.settings.blank_display  # Not an instrument setting
             )
             
             logger.info("Successfully read settings from instrument")
@@ -542,14 +976,16 @@ class Keithley2634B:
         
         errors = []
         try:
-            # Check error queue
-            while True:
-                error_response = self.query("print(errorqueue.next())")
-                if "0" in error_response and "Queue Is Empty" in error_response:
-                    break
-                errors.append(error_response.strip())
-                if len(errors) > 10:  # Prevent infinite loop
-                    break
+            # Drain the error queue on the instrument and print all entries on one
+            # line, separated by ASCII record separators; empty if there are none
+            response = self.query(
+                "local errs = {} "
+                "while errorqueue.count > 0 do "
+                "local code, message = errorqueue.next() "
+                "errs[table.getn(errs) + 1] = string.format('%d\\t%s', code, message) "
+                "end "
+                "print(table.concat(errs, '\\30'))")
+            errors = [error.strip() for error in response.split("\x1e") if error.strip()]
         except Exception as e:
             logger.error(f"Error checking error queue: {e}")
             errors.append(f"Failed to check errors: {e}")
@@ -567,222 +1003,170 @@ class Keithley2634B:
         except Exception as e:
             logger.error(f"Failed to clear error queue: {e}")
     
-    def configure_measurement_with_error_check(self, settings: MeasurementSettings) -> Tuple[bool, List[str]]:
+    def invalidate_configuration(self):
+        """Forget the last applied configuration, so the next one is sent in full
+        
+        Call after the instrument may have been changed behind the driver's back
+        (direct commands, *RST, front panel).
         """
-        Configure measurement and check for errors
+        self._applied_steps = None
+    
+    def configure_measurement_with_error_check(self, settings: MeasurementSettings,
+                                               force: bool = False) -> Tuple[bool, List[str]]:
+        """
+        Configure measurement and check for errors (see configure_measurement)
         
         Returns:
-            Tuple of (success, error_list)
+            Tuple of (success, error_list); exceptions are reported as errors
         """
         try:
-            # Clear errors before configuration
-            self.clear_errors()
-            
-            # Use step-by-step configuration with error checking
-            success, errors = self.configure_measurement_stepwise(settings)
-            
-            if not success:
-                logger.warning(f"Configuration completed with errors: {errors}")
-                return False, errors
-            else:
-                logger.info("Configuration completed successfully with no errors")
-                return True, []
-                
+            return self.configure_measurement(settings, force)
         except Exception as e:
             logger.error(f"Configuration failed with exception: {e}")
             return False, [str(e)]
     
-    def configure_measurement_stepwise(self, settings: MeasurementSettings) -> Tuple[bool, List[str]]:
+    def configure_measurement_batched(self, settings: MeasurementSettings, force: bool = False) -> bool:
         """
-        Configure measurement step by step with proper sequencing and validation
+        Send the configuration steps in a single write
+        
+        Unless force, steps before the first one that differs from the last
+        successful configuration are skipped (later steps can depend on earlier
+        ones, so they are always sent); the output is always switched off.
+        
+        TSP executes the statements in order, so the error count query that
+        follows also acts as the synchronization point (like *OPC?).
         
         Returns:
-            Tuple of (success, error_list)
+            True if the instrument reported no errors
         """
         self.settings = settings
-        all_errors = []
+        steps = self._build_config_steps(settings)
+        send = steps
+        applied = self._applied_steps
+        if not force and applied is not None and len(applied) == len(steps):
+            first = next((i for i in range(1, len(steps)) if steps[i] != applied[i]), len(steps))
+            send = steps[:1] + steps[first:]
+        self._applied_steps = None
+        commands = [cmd for _, step_commands in send for cmd in step_commands]
         
-        logger.info("Configuring measurement settings with smart sequencing...")
+        logger.info(f"Configuring measurement settings in one batch ({len(commands)} commands)...")
+        self.write("; ".join(commands))
+        if int(float(self.query("print(errorqueue.count)"))) != 0:
+            return False
+        self._applied_steps = steps
+        return True
+    
+    def _build_config_steps(self, settings: MeasurementSettings, 
+                            smu: Optional[str] = None) -> List[Tuple[str, List[str]]]:
+        """
+        Build the configuration commands in the order the instrument needs them
+        
+        Args:
+            settings: Settings to apply
+            smu: SMU to configure (default: this driver's channel)
+        
+        Returns:
+            List of (step label, TSP commands)
+        """
+        smu = smu or self.smu_name
+        steps = []
         
         # CRITICAL: Ensure output is OFF before making changes
-        try:
-            logger.info("Step 0: Ensuring output is OFF before configuration")
-            self.write(f"{self.smu_name}.source.output = {self.smu_name}.OUTPUT_OFF")
-            time.sleep(0.1)  # Let it settle
-            step_errors = self.check_errors()
-            if step_errors:
-                all_errors.extend([f"Output OFF: {e}" for e in step_errors])
-            else:
-                logger.info("Output turned OFF successfully")
-        except Exception as e:
-            all_errors.append(f"Output OFF exception: {e}")
+        steps.append(("Output OFF", [f"{smu}.source.output = {self._const('OUTPUT_OFF')}",
+                                     f"{smu}.source.offmode = {self._const('OUTPUT_NORMAL')}"]))
         
-        # Step 1: Configure source function FIRST
-        try:
-            logger.info(f"Step 1: Configuring source function to {settings.source_function.value}")
-            if settings.source_function == SourceFunction.VOLTAGE:
-                self.write(f"{self.smu_name}.source.func = {self.smu_name}.OUTPUT_DCVOLTS")
-            else:
-                self.write(f"{self.smu_name}.source.func = {self.smu_name}.OUTPUT_DCAMPS")
-            
-            time.sleep(0.1)  # Let it settle
-            step_errors = self.check_errors()
-            if step_errors:
-                all_errors.extend([f"Source function: {e}" for e in step_errors])
-                logger.warning(f"Source function configuration errors: {step_errors}")
-            else:
-                logger.info("✓ Source function configured successfully")
-        except Exception as e:
-            all_errors.append(f"Source function exception: {e}")
+        # Source function FIRST
+        if settings.source_function == SourceFunction.VOLTAGE:
+            steps.append(("Source function", [f"{smu}.source.func = {self._const('OUTPUT_DCVOLTS')}"]))
+        else:
+            steps.append(("Source function", [f"{smu}.source.func = {self._const('OUTPUT_DCAMPS')}"]))
         
-        # Step 2: Configure measure function SECOND (using correct display.smua.measure.func)
-        try:
-            logger.info(f"Step 2: Configuring measure function to {settings.sense_function.value}")
-            
-            # Use the correct TSP command from manual: display.smua.measure.func
-            if settings.sense_function == SenseFunction.CURRENT:
-                logger.info("Setting measure function to current using display.smua.measure.func...")
-                self.write(f"display.{self.smu_name}.measure.func = display.MEASURE_DCAMPS")
-            else:
-                logger.info("Setting measure function to voltage using display.smua.measure.func...")
-                self.write(f"display.{self.smu_name}.measure.func = display.MEASURE_DCVOLTS")
-            
-            time.sleep(0.1)  # Let it settle
-            step_errors = self.check_errors()
-            if step_errors:
-                all_errors.extend([f"Measure function: {e}" for e in step_errors])
-                logger.warning(f"Measure function configuration errors: {step_errors}")
-            else:
-                logger.info("✓ Measure function configured successfully using display command")
-                
-        except Exception as e:
-            all_errors.append(f"Measure function exception: {e}")
+        # Measure function SECOND (display.smua.measure.func per the manual)
+        if settings.sense_function == SenseFunction.CURRENT:
+            steps.append(("Measure function", [f"display.{smu}.measure.func = display.MEASURE_DCAMPS"]))
+        else:
+            steps.append(("Measure function", [f"display.{smu}.measure.func = display.MEASURE_DCVOLTS"]))
         
-        # Step 3: Configure ranges (skip measure ranges if already set in Step 2)
-        try:
-            logger.info("Step 3: Configuring remaining ranges...")
-            
-            # Source ranges (always configure these)
-            if settings.source_function == SourceFunction.VOLTAGE:
-                if settings.source_autorange:
-                    logger.info("Setting source voltage autorange ON")
-                    self.write(f"{self.smu_name}.source.autorangev = {self.smu_name}.AUTORANGE_ON")
-                else:
-                    logger.info(f"Setting source voltage range to {settings.source_range}V")
-                    self.write(f"{self.smu_name}.source.autorangev = {self.smu_name}.AUTORANGE_OFF")
-                    time.sleep(0.05)
-                    # Validate and set range
-                    validated_range = self.validate_voltage_range(settings.source_range)
-                    self.write(f"{self.smu_name}.source.rangev = {validated_range}")
-            else:
-                if settings.source_autorange:
-                    logger.info("Setting source current autorange ON")
-                    self.write(f"{self.smu_name}.source.autorangei = {self.smu_name}.AUTORANGE_ON")
-                else:
-                    logger.info(f"Setting source current range to {settings.source_range}A")
-                    self.write(f"{self.smu_name}.source.autorangei = {self.smu_name}.AUTORANGE_OFF")
-                    time.sleep(0.05)
-                    validated_range = self.validate_current_range(settings.source_range)
-                    self.write(f"{self.smu_name}.source.rangei = {validated_range}")
-            
-            # Measure ranges (only if not using autorange from Step 2 fallback)
-            if settings.sense_function == SenseFunction.CURRENT:
-                if not settings.sense_autorange:  # Only set specific range if not auto
-                    logger.info(f"Setting measure current range to {settings.sense_range}A")
-                    self.write(f"{self.smu_name}.measure.autorangei = {self.smu_name}.AUTORANGE_OFF")
-                    time.sleep(0.05)
-                    validated_range = self.validate_current_range(settings.sense_range)
-                    self.write(f"{self.smu_name}.measure.rangei = {validated_range}")
-                else:
-                    logger.info("Measure current autorange already set (or will use autorange)")
+        # Ranges: source ranges always, measure ranges only when not autoranging
+        ranges = []
+        if settings.source_function == SourceFunction.VOLTAGE:
+            if settings.source_autorange:
+                ranges.append(f"{smu}.source.autorangev = {self._const('AUTORANGE_ON')}")
             else:
-                if not settings.sense_autorange:  # Only set specific range if not auto
-                    logger.info(f"Setting measure voltage range to {settings.sense_range}V")
-                    self.write(f"{self.smu_name}.measure.autorangev = {self.smu_name}.AUTORANGE_OFF")
-                    time.sleep(0.05)
-                    validated_range = self.validate_voltage_range(settings.sense_range)
-                    self.write(f"{self.smu_name}.measure.rangev = {validated_range}")
-                else:
-                    logger.info("Measure voltage autorange already set (or will use autorange)")
-            
-            time.sleep(0.1)
-            step_errors = self.check_errors()
-            if step_errors:
-                all_errors.extend([f"Ranges: {e}" for e in step_errors])
-                logger.warning(f"Range configuration errors: {step_errors}")
+                ranges.append(f"{smu}.source.autorangev = {self._const('AUTORANGE_OFF')}")
+                ranges.append(f"{smu}.source.rangev = {self.validate_voltage_range(settings.source_range)}")
+        else:
+            if settings.source_autorange:
+                ranges.append(f"{smu}.source.autorangei = {self._const('AUTORANGE_ON')}")
             else:
-                logger.info("✓ Ranges configured successfully")
-        except Exception as e:
-            all_errors.append(f"Range configuration exception: {e}")
+                ranges.append(f"{smu}.source.autorangei = {self._const('AUTORANGE_OFF')}")
+                ranges.append(f"{smu}.source.rangei = {self.validate_current_range(settings.source_range)}")
         
-        # Step 4: Configure compliance AFTER ranges (compliance depends on current ranges)
-        try:
-            logger.info("Step 4: Configuring compliance...")
-            if settings.source_function == SourceFunction.VOLTAGE:
-                # Validate current compliance for voltage sourcing
-                validated_compliance = self.validate_current_compliance(settings.compliance)
-                logger.info(f"Setting current compliance to {validated_compliance}A")
-                self.write(f"{self.smu_name}.source.limiti = {validated_compliance}")
+        if settings.sense_function == SenseFunction.CURRENT:
+            if settings.sense_autorange:
+                ranges.append(f"{smu}.measure.autorangei = {self._const('AUTORANGE_ON')}")
             else:
-                # Validate voltage compliance for current sourcing
-                validated_compliance = self.validate_voltage_compliance(settings.compliance)
-                logger.info(f"Setting voltage compliance to {validated_compliance}V")
-                self.write(f"{self.smu_name}.source.limitv = {validated_compliance}")
-            
-            time.sleep(0.1)
-            step_errors = self.check_errors()
-            if step_errors:
-                all_errors.extend([f"Compliance: {e}" for e in step_errors])
-                logger.warning(f"Compliance configuration errors: {step_errors}")
+                ranges.append(f"{smu}.measure.autorangei = {self._const('AUTORANGE_OFF')}")
+                ranges.append(f"{smu}.measure.rangei = {self.validate_current_range(settings.sense_range)}")
+        else:
+            if settings.sense_autorange:
+                ranges.append(f"{smu}.measure.autorangev = {self._const('AUTORANGE_ON')}")
             else:
-                logger.info("✓ Compliance configured successfully")
-        except Exception as e:
-            all_errors.append(f"Compliance exception: {e}")
+                ranges.append(f"{smu}.measure.autorangev = {self._const('AUTORANGE_OFF')}")
+                ranges.append(f"{smu}.measure.rangev = {self.validate_voltage_range(settings.sense_range)}")
+        steps.append(("Ranges", ranges))
         
-        # Step 5: Configure NPLC (usually safe)
-        try:
-            logger.info(f"Step 5: Configuring NPLC to {settings.nplc}")
-            validated_nplc = max(0.001, min(25, settings.nplc))  # Valid range for 2634B
-            self.write(f"{self.smu_name}.measure.nplc = {validated_nplc}")
-            
-            time.sleep(0.1)
-            step_errors = self.check_errors()
-            if step_errors:
-                all_errors.extend([f"NPLC: {e}" for e in step_errors])
-            else:
-                logger.info("✓ NPLC configured successfully")
-        except Exception as e:
-            all_errors.append(f"NPLC exception: {e}")
+        # Compliance AFTER ranges (compliance depends on current ranges)
+        if settings.source_function == SourceFunction.VOLTAGE:
+            steps.append(("Compliance", [f"{smu}.source.limiti = {self.validate_current_compliance(settings.compliance)}"]))
+        else:
+            steps.append(("Compliance", [f"{smu}.source.limitv = {self.validate_voltage_compliance(settings.compliance)}"]))
         
-        # Step 6: Configure filter (if enabled)
+        # NPLC (valid range for 2634B)
+        validated_nplc = max(0.001, min(25, settings.nplc))
+        steps.append(("NPLC", [f"{smu}.measure.nplc = {validated_nplc}"]))
+        
+        # Digital filter
         if settings.filter_enable:
-            try:
-                logger.info(f"Step 6: Configuring digital filter (count: {settings.filter_count})")
-                validated_count = max(1, min(100, settings.filter_count))  # Valid range
-                self.write(f"{self.smu_name}.measure.filter.count = {validated_count}")
-                time.sleep(0.05)
-                self.write(f"{self.smu_name}.measure.filter.enable = {self.smu_name}.FILTER_ON")
-                
-                time.sleep(0.1)
-                step_errors = self.check_errors()
-                if step_errors:
-                    all_errors.extend([f"Filter: {e}" for e in step_errors])
-                else:
-                    logger.info("✓ Digital filter configured successfully")
-            except Exception as e:
-                all_errors.append(f"Filter exception: {e}")
+            validated_count = max(1, min(100, settings.filter_count))
+            steps.append(("Filter", [f"{smu}.measure.filter.count = {validated_count}",
+                                     f"{smu}.measure.filter.enable = {self._const('FILTER_ON')}"]))
         else:
+            steps.append(("Filter disable", [f"{smu}.measure.filter.enable = {self._const('FILTER_OFF')}"]))
+        
+        return steps
+    
+    def configure_measurement_stepwise(self, settings: MeasurementSettings) -> Tuple[bool, List[str]]:
+        """
+        Configure measurement step by step with proper sequencing and validation
+        
+        Slower (one write and one error queue check per step); used to
+        attribute errors after a failed batched configuration.
+        
+        Returns:
+            Tuple of (success, error_list)
+        """
+        self.settings = settings
+        self._applied_steps = None
+        all_errors = []
+        
+        logger.info("Configuring measurement settings with smart sequencing...")
+        
+        steps = self._build_config_steps(settings)
+        for step, (label, commands) in enumerate(steps):
             try:
-                logger.info("Step 6: Disabling digital filter")
-                self.write(f"{self.smu_name}.measure.filter.enable = {self.smu_name}.FILTER_OFF")
-                time.sleep(0.1)
+                logger.info(f"Step {step}: {label}")
+                self.write("; ".join(commands))
+                
+                # The error queue query runs after the step's commands (TSP executes in order)
                 step_errors = self.check_errors()
                 if step_errors:
-                    all_errors.extend([f"Filter disable: {e}" for e in step_errors])
+                    all_errors.extend([f"{label}: {e}" for e in step_errors])
+                    logger.warning(f"{label} configuration errors: {step_errors}")
                 else:
-                    logger.info("✓ Digital filter disabled successfully")
+                    logger.info(f"✓ {label} configured successfully")
             except Exception as e:
-                all_errors.append(f"Filter disable exception: {e}")
+                all_errors.append(f"{label} exception: {e}")
         
         # Final step: Log summary
         if all_errors:
@@ -790,17 +1174,16 @@ class Keithley2634B:
             return False, all_errors
         else:
             logger.info("✓ All configuration steps completed successfully!")
+            self._applied_steps = steps
             return True, []
     
     def validate_voltage_range(self, voltage: float) -> float:
         """Validate and return closest valid voltage range"""
-        valid_ranges = [0.2, 2, 20, 200]  # 2634B voltage ranges
-        return min(valid_ranges, key=lambda x: abs(x - abs(voltage)))
+        return _closest_range(_VOLTAGE_RANGES, voltage)
     
     def validate_current_range(self, current: float) -> float:
         """Validate and return closest valid current range"""
-        valid_ranges = [1e-9, 1e-8, 1e-7, 1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 1.5]  # 2634B current ranges
-        return min(valid_ranges, key=lambda x: abs(x - abs(current)))
+        return _closest_range(_CURRENT_RANGES, current)
     
     def validate_current_compliance(self, current: float) -> float:
         """Validate current compliance value"""
@@ -815,6 +1198,59 @@ class Keithley2634B:
         return max(1e-6, min(max_voltage, abs(voltage)))
 
 
+# Worker threads shared by measure_many() calls, created on first use
+_MEASURE_WORKERS = 8
+_measure_pool: Optional[ThreadPoolExecutor] = None
+_measure_pool_lock = threading.Lock()
+
+
+def _get_measure_pool() -> ThreadPoolExecutor:
+    """Get the measure_many() thread pool, creating it on first use"""
+    global _measure_pool
+    with _measure_pool_lock:
+        if _measure_pool is None:
+            _measure_pool = ThreadPoolExecutor(max_workers=_MEASURE_WORKERS, thread_name_prefix="measure")
+        return _measure_pool
+
+
+def measure_many(instruments: List[Keithley2634B]) -> List[Tuple[float, float, float, float]]:
+    """
+    Take one measure() on each instrument, overlapping the round trips
+    
+    Instruments are measured in parallel on a shared thread pool (pyvisa
+    releases the GIL while waiting for I/O). Drivers that share a connection
+    path, i.e. the same resource or the same GPIB board, which handles one
+    transfer at a time, are measured one after another within their group.
+    
+    Args:
+        instruments: Connected drivers
+        
+    Returns:
+        The measure() results, in the order of instruments
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, keithley in enumerate(instruments):
+        resource = keithley.resource_name.upper()
+        key = resource.split("::")[0] if resource.startswith("GPIB") else resource
+        groups.setdefault(key, []).append(index)
+    
+    results: List[Any] = [None] * len(instruments)
+    
+    def measure_group(indices: List[int]):
+        for index in indices:
+            results[index] = instruments[index].measure()
+    
+    if len(groups) <= 1:
+        for indices in groups.values():
+            measure_group(indices)
+        return results
+    
+    pool = _get_measure_pool()
+    for future in [pool.submit(measure_group, indices) for indices in groups.values()]:
+        future.result()
+    return results
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Example configuration
@@ -314,9 +314,17 @@ def main():
                 if app.engine.is_measurement_active():
                     app.engine.stop_measurement()
             
+            # Drop queued instrument calls; a call already running finishes on its own
+            if hasattr(app, '_visa_exec'):
+                app._visa_exec.shutdown(wait=False)
+            
             if hasattr(app, 'keithley') and app.keithley:
                 app.keithley.disconnect()
             
+            # Close sessions kept open by Disconnect
+            if hasattr(app, 'close_session_pool'):
+                app.close_session_pool()
+            
             app.root.destroy()
         
         app.root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -5,6 +5,8 @@ Handles different measurement types with real-time data acquisition and saving
 
 import numpy as np
 import pandas as pd
+import functools
+import os
 import time
 import threading
 import queue
@@ -33,6 +35,38 @@ class SweepParameters:
     delay_per_point: float = 0.1  # seconds
     bidirectional: bool = False  # Return to start after sweep
     settle_time: float = 0.0  # Additional settling time at each point
+    block_seconds: float = 0.5  # Sweep time run on the instrument per buffer transfer
+    
+    def schedule(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get (source levels, segment indices, sweep numbers) for every point of the sweep"""
+        return _sweep_schedule(tuple((float(a), float(b), int(n)) for a, b, n in self.segments), 
+                               self.bidirectional)
+
+
+@functools.lru_cache(maxsize=8)
+def _sweep_schedule(segments: Tuple[Tuple[float, float, int], ...], 
+                    bidirectional: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Expand sweep segments into per-point arrays (memoized, arrays are read-only)
+    
+    Each forward segment is its own sweep; the return pass of a bidirectional
+    sweep runs the segments reversed as one further sweep.
+    """
+    legs = [(start, stop, points, idx, idx + 1) for idx, (start, stop, points) in enumerate(segments)]
+    if bidirectional:
+        count = len(segments)
+        legs += [(stop, start, points, count + idx, count + 1)
+                 for idx, (start, stop, points) in enumerate(reversed(segments))]
+    
+    points = [max(0, leg[2]) for leg in legs]
+    levels = np.concatenate([np.linspace(start, stop, n) for (start, stop, _, _, _), n in zip(legs, points)]
+                            ) if legs else np.empty(0)
+    segment_idx = np.repeat(np.array([leg[3] for leg in legs], dtype=np.int64), points)
+    sweep_numbers = np.repeat(np.array([leg[4] for leg in legs], dtype=np.int64), points)
+    
+    for array in (levels, segment_idx, sweep_numbers):
+        array.setflags(write=False)
+    return levels, segment_idx, sweep_numbers
 
 
 @dataclass
@@ -41,6 +75,7 @@ class MonitorParameters:
     duration: float  # Total duration in seconds
     interval: float = 0.1  # Measurement interval in seconds
     source_level: float = 0.0  # Constant source level during monitoring
+    block_seconds: float = 0.5  # Data per binary buffer transfer for short intervals (0 = point by point)
 
 
 @dataclass
@@ -84,6 +119,8 @@ class DataAcquisitionEngine:
         
         # Callbacks for real-time updates
         self.data_callbacks: List[Callable] = []
+        self.batch_callbacks: List[Callable] = []
+        self.completion_callbacks: List[Callable] = []
         
         # Current measurement info
         self.current_measurement: Optional[MeasurementResult] = None
@@ -104,6 +141,36 @@ class DataAcquisitionEngine:
         if callback in self.data_callbacks:
             self.data_callbacks.remove(callback)
     
+    def add_batch_callback(self, callback: Callable):
+        """Add callback for blocks of points as arrays: callback(sweep_number, voltages, currents, timestamps)
+        
+        Once a batch callback is registered, blocks read from the instrument
+        buffer go only to the batch callbacks and no per-point dicts are built
+        for them; single points still go to the data callbacks.
+        """
+        self.batch_callbacks.append(callback)
+    
+    def add_completion_callback(self, callback: Callable):
+        """Add callback function called (from the worker thread) when a measurement ends"""
+        self.completion_callbacks.append(callback)
+    
+    def _notify_completion_callbacks(self):
+        """Notify all registered callbacks that the measurement worker has finished"""
+        for callback in self.completion_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Completion callback error: {e}")
+    
+    def _notify_batch_callbacks(self, sweep_number: int, voltages: np.ndarray, 
+                                currents: np.ndarray, timestamps: np.ndarray):
+        """Notify all registered batch callbacks with a block of points"""
+        for callback in self.batch_callbacks:
+            try:
+                callback(sweep_number, voltages, currents, timestamps)
+            except Exception as e:
+                logger.error(f"Batch callback error: {e}")
+    
     def _notify_data_callbacks(self, data_point: Dict[str, Any]):
         """Notify all registered callbacks with new data point"""
         for callback in self.data_callbacks:
@@ -182,17 +249,23 @@ class DataAcquisitionEngine:
             logger.error(f"Failed to initialize cache: {e}")
             return None
     
-    def _write_to_cache(self, data: str):
-        """Write data to cache file immediately"""
+    def _write_to_cache(self, data: str, sync: bool = True):
+        """Write data to cache file (immediately on disk unless sync is False)"""
         if self.cache_handle:
             try:
                 self.cache_handle.write(data + '\n')
-                self.cache_handle.flush()  # Force immediate write
-                import os
-                os.fsync(self.cache_handle.fileno())  # Force OS to write to disk
+                if sync:
+                    self._sync_file(self.cache_handle)
             except Exception as e:
                 logger.error(f"Cache write error: {e}")
     
+    @staticmethod
+    def _sync_file(file_handle):
+        """Flush Python buffers and force the OS to write the file to disk"""
+        if file_handle:
+            file_handle.flush()
+            os.fsync(file_handle.fileno())
+    
     def _close_cache(self):
         """Close cache file"""
         if self.cache_handle:
@@ -267,66 +340,87 @@ class DataAcquisitionEngine:
         logger.info("Save worker thread started")
         
         try:
-            while not self.should_stop or not self.save_queue.empty():
+            while True:
+                # Block for the first item, then take everything else already queued
                 try:
-                    item = self.save_queue.get(timeout=1.0)
-                    
-                    if item is None:  # Shutdown signal
-                        logger.info(f"Save worker received shutdown signal. Lines written: {data_lines_written}")
+                    batch = [self.save_queue.get(timeout=1.0)]
+                except queue.Empty:
+                    if self.should_stop:
                         break
-                    
-                    if isinstance(item, dict) and 'filename' in item:
-                        # New file command
-                        if file_handle:
-                            logger.info(f"Closing previous file. Lines written: {data_lines_written}")
-                            file_handle.close()
-                            data_lines_written = 0
+                    continue
+                try:
+                    while len(batch) < 1000:
+                        batch.append(self.save_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                
+                shutdown = False
+                lines_in_batch = 0
+                for item in batch:
+                    try:
+                        if item is None:  # Shutdown signal
+                            logger.info(f"Save worker received shutdown signal. Lines written: {data_lines_written}")
+                            shutdown = True
+                            break
                         
-                        current_file = self.save_directory / item['filename']
-                        file_handle = open(current_file, 'w', newline='')
+                        if isinstance(item, dict) and 'filename' in item:
+                            # New file command
+                            if file_handle:
+                                self._sync_file(file_handle)
+                                logger.info(f"Closing previous file. Lines written: {data_lines_written}")
+                                file_handle.close()
+                                data_lines_written = 0
+                            
+                            current_file = self.save_directory / item['filename']
+                            file_handle = open(current_file, 'w', newline='')
+                            
+                            # Write header
+                            if 'header' in item:
+                                file_handle.write(item['header'] + '\n')
+                                self._sync_file(file_handle)  # Force OS to write header to disk
+                                # Also write header to cache
+                                self._write_to_cache(item['header'])
+                                logger.info(f"Header written to main file: {current_file}")
+                            
+                            logger.info(f"Started saving to {current_file}")
                         
-                        # Write header
-                        if 'header' in item:
-                            file_handle.write(item['header'] + '\n')
-                            file_handle.flush()  # Ensure header is written immediately
-                            import os
-                            os.fsync(file_handle.fileno())  # Force OS to write header to disk
-                            # Also write header to cache
-                            self._write_to_cache(item['header'])
-                            logger.info(f"Header written to main file: {current_file}")
+                        elif isinstance(item, str) and item == "__SYNC_MARKER__":
+                            # Sync marker - force file operations to complete
+                            if file_handle:
+                                self._sync_file(file_handle)
+                                logger.info(f"File sync completed. Lines written so far: {data_lines_written}")
                         
-                        logger.info(f"Started saving to {current_file}")
-                    
-                    elif isinstance(item, str) and file_handle:
-                        # Data line - write to both main file and cache
-                        file_handle.write(item + '\n')
-                        file_handle.flush()  # Ensure data is written immediately
-                        import os
-                        os.fsync(file_handle.fileno())  # Force OS to write to disk
-                        self._write_to_cache(item)  # Also write to cache
-                        data_lines_written += 1
+                        elif isinstance(item, (str, list)) and file_handle:
+                            # Data line, or list of lines of a block - write to both main
+                            # file and cache (synced once per batch)
+                            lines = [item] if isinstance(item, str) else item
+                            file_handle.writelines(line + '\n' for line in lines)
+                            self._write_to_cache("\n".join(lines), sync=False)
+                            data_lines_written += len(lines)
+                            lines_in_batch += len(lines)
+                            
+                            # Log progress every 10 lines
+                            if data_lines_written // 10 != (data_lines_written - len(lines)) // 10:
+                                logger.debug(f"Written {data_lines_written} data lines to {current_file}")
                         
-                        # Log progress every 10 lines
-                        if data_lines_written % 10 == 0:
-                            logger.debug(f"Written {data_lines_written} data lines to {current_file}")
+                        elif isinstance(item, (str, list)) and not file_handle:
+                            logger.warning(f"Received data line but no file handle open: {str(item)[:50]}...")
                     
-                    elif isinstance(item, str) and item == "__SYNC_MARKER__":
-                        # Sync marker - force file operations to complete
-                        if file_handle:
-                            file_handle.flush()
-                            import os
-                            os.fsync(file_handle.fileno())
-                            logger.info(f"File sync completed. Lines written so far: {data_lines_written}")
-                    
-                    elif isinstance(item, str) and not file_handle:
-                        logger.warning(f"Received data line but no file handle open: {item[:50]}...")
+                    except Exception as e:
+                        logger.error(f"Save worker error: {e}")
+                        import traceback
+                        logger.error(f"Save worker traceback: {traceback.format_exc()}")
                 
-                except queue.Empty:
-                    continue
-                except Exception as e:
-                    logger.error(f"Save worker error: {e}")
-                    import traceback
-                    logger.error(f"Save worker traceback: {traceback.format_exc()}")
+                # One flush + fsync per batch instead of per line
+                if lines_in_batch:
+                    try:
+                        self._sync_file(file_handle)
+                        self._sync_file(self.cache_handle)
+                    except Exception as e:
+                        logger.error(f"Save worker sync error: {e}")
+                
+                if shutdown:
+                    break
         
         finally:
             if file_handle:
@@ -334,26 +428,49 @@ class DataAcquisitionEngine:
                 file_handle.close()
             logger.info("Save worker thread terminated")
     
+    def _prepare_instrument(self, measurement_settings: MeasurementSettings, reconfigure: bool):
+        """
+        Configure the instrument, or only record the settings if already applied
+        
+        Raises:
+            RuntimeError: The instrument reported errors for the settings
+        """
+        if reconfigure:
+            success, errors = self.keithley.configure_measurement(measurement_settings)
+            if not success:
+                raise RuntimeError(f"Instrument rejected the measurement settings: {'; '.join(errors)}")
+        else:
+            logger.info("Settings unchanged since last apply, skipping reconfiguration")
+            self.keithley.settings = measurement_settings
+    
     def start_iv_sweep(self, sweep_params: SweepParameters, 
                       measurement_settings: MeasurementSettings,
-                      custom_filename: str = "", custom_path: str = "") -> bool:
+                      custom_filename: str = "", custom_path: str = "",
+                      reconfigure: bool = True) -> bool:
         """
         Start IV sweep measurement
         
         Args:
             sweep_params: Sweep parameters
             measurement_settings: Instrument settings
+            reconfigure: Send settings to the instrument before starting. Pass
+                False when the same settings were already applied successfully.
             
         Returns:
             bool: True if started successfully
+            
+        Raises:
+            RuntimeError: The instrument rejected the settings. Communication
+                errors while configuring are raised too; nothing is started.
         """
         if self.is_measuring:
             logger.error("Measurement already in progress")
             return False
         
+        # Configure instrument; configuration errors abort with their details
+        self._prepare_instrument(measurement_settings, reconfigure)
+        
         try:
-            # Configure instrument
-            self.keithley.configure_measurement(measurement_settings)
             
             # Initialize measurement
             self.measurement_start_time = datetime.now()
@@ -398,169 +515,106 @@ class DataAcquisitionEngine:
     
     def _iv_sweep_worker(self, sweep_params: SweepParameters):
         """Worker thread for IV sweep measurement"""
+        # Static front panel screen while measuring, if enabled in the settings
+        blank_display = self.keithley.settings.blank_display
+        
         try:
             self.keithley.output_on()
+            if blank_display:
+                self._set_measure_display(True)
             
             total_points = 0
-            sweep_number = 1  # Start sweep numbering from 1
             
-            for segment_idx, (start, stop, points) in enumerate(sweep_params.segments):
-                logger.info(f"Starting segment {segment_idx + 1}: {start}V to {stop}V, {points} points")
+            # Whole sweep (including the return pass) precomputed as flat arrays
+            levels, segment_indices, sweep_numbers = sweep_params.schedule()
+            
+            # Each leg (run of one segment index) is measured in blocks of about
+            # block_seconds: the instrument steps through a block in a TSP loop, so
+            # there is one binary transfer per block instead of a round trip per point
+            per_point = (sweep_params.settle_time + sweep_params.delay_per_point + 
+                         self.keithley.settings.nplc / 50.0 + 0.01)
+            block_size = max(1, int(sweep_params.block_seconds / per_point))
+            edges = np.r_[0, np.flatnonzero(np.diff(segment_indices)) + 1, len(levels)].tolist()
+            legs = list(zip(edges[:-1], edges[1:])) if len(levels) else []
+            
+            for leg_start, leg_end in legs:
+                if self.should_stop:
+                    break
                 
-                # Generate sweep points for this segment
-                sweep_values = np.linspace(start, stop, points)
+                segment_idx, sweep_number = int(segment_indices[leg_start]), int(sweep_numbers[leg_start])
+                if segment_idx < len(sweep_params.segments):
+                    start, stop, points = sweep_params.segments[segment_idx]
+                    logger.info(f"Starting segment {segment_idx + 1}: {start}V to {stop}V, {points} points")
+                elif segment_idx == len(sweep_params.segments):
+                    logger.info("Performing return sweep")
                 
-                for point_idx, voltage in enumerate(sweep_values):
+                # Levels of a leg are evenly spaced (np.linspace)
+                step = 0.0
+                if leg_end - leg_start > 1:
+                    step = float(levels[leg_end - 1] - levels[leg_start]) / (leg_end - leg_start - 1)
+                
+                for block_start in range(leg_start, leg_end, block_size):
                     if self.should_stop:
                         break
                     
                     # Wait if paused
                     self.pause_event.wait()
                     
+                    count = min(block_size, leg_end - block_start)
                     try:
-                        # Set source level
-                        self.keithley.set_source_level(voltage)
-                        
-                        # Wait for settling
-                        if sweep_params.settle_time > 0:
-                            time.sleep(sweep_params.settle_time)
-                        
-                        # Perform measurement
-                        source_val, measured_val, resistance, timestamp = self.keithley.measure()
+                        # Seconds from the start of the measurement to the request
+                        started = (datetime.now() - self.measurement_start_time).total_seconds()
+                        source_vals, measured_vals, offsets = self.keithley.sweep_block(
+                            float(levels[block_start]), step, count, 
+                            sweep_params.settle_time, sweep_params.delay_per_point)
                         
-                        # Calculate relative timestamp (seconds from start)
-                        relative_timestamp = (datetime.now() - self.measurement_start_time).total_seconds()
-                        
-                        # Create data point
-                        data_point = {
-                            'timestamp': relative_timestamp,  # Use relative timestamp
-                            'source_value': source_val,
-                            'measured_value': measured_val,
-                            'resistance': resistance,
-                            'segment': segment_idx,
-                            'point_index': total_points,
-                            'sweep_number': sweep_number,  # Add sweep number
-                            'voltage': source_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else measured_val,
-                            'current': measured_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else source_val
-                        }
-                        
-                        # Save data with sweep_number and relative timestamp
-                        data_line = f"{relative_timestamp:.3f},{source_val},{measured_val},{resistance},{segment_idx},{total_points},{sweep_number}"
-                        self.save_queue.put(data_line)
-                        
-                        # Force file sync every 50 points for safety
-                        if total_points % 50 == 0:
-                            self.save_queue.put("__SYNC_MARKER__")
-                        
-                        # Notify callbacks
-                        self._notify_data_callbacks(data_point)
-                        
-                        total_points += 1
-                        
-                        # Inter-point delay
-                        if sweep_params.delay_per_point > 0:
-                            time.sleep(sweep_params.delay_per_point)
+                        self._emit_sweep_block(source_vals, measured_vals, started + offsets, 
+                                               segment_idx, sweep_number, total_points)
+                        total_points += len(source_vals)
                     
                     except Exception as e:
                         logger.error(f"Measurement error at point {total_points}: {e}")
-                
-                if self.should_stop:
-                    break
-                
-                # Increment sweep number for next segment
-                sweep_number += 1
-            
-            # Bidirectional sweep - return to start
-            if sweep_params.bidirectional and not self.should_stop:
-                logger.info("Performing return sweep")
-                # Reverse the segments and sweep back
-                reversed_segments = [(stop, start, points) for start, stop, points in reversed(sweep_params.segments)]
-                
-                for segment_idx, (start, stop, points) in enumerate(reversed_segments):
-                    sweep_values = np.linspace(start, stop, points)
-                    
-                    for point_idx, voltage in enumerate(sweep_values):
-                        if self.should_stop:
-                            break
-                        
-                        # Wait if paused
-                        self.pause_event.wait()
-                        
-                        try:
-                            self.keithley.set_source_level(voltage)
-                            
-                            if sweep_params.settle_time > 0:
-                                time.sleep(sweep_params.settle_time)
-                            
-                            source_val, measured_val, resistance, timestamp = self.keithley.measure()
-                            
-                            # Calculate relative timestamp
-                            relative_timestamp = (datetime.now() - self.measurement_start_time).total_seconds()
-                            
-                            data_point = {
-                                'timestamp': relative_timestamp,  # Use relative timestamp
-                                'source_value': source_val,
-                                'measured_value': measured_val,
-                                'resistance': resistance,
-                                'segment': len(sweep_params.segments) + segment_idx,
-                                'point_index': total_points,
-                                'sweep_number': sweep_number,  # Add sweep number
-                                'voltage': source_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else measured_val,
-                                'current': measured_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else source_val
-                            }
-                            
-                            data_line = f"{relative_timestamp:.3f},{source_val},{measured_val},{resistance},{len(sweep_params.segments) + segment_idx},{total_points},{sweep_number}"
-                            self.save_queue.put(data_line)
-                            
-                            # Force file sync every 50 points for safety
-                            if total_points % 50 == 0:
-                                self.save_queue.put("__SYNC_MARKER__")
-                            
-                            self._notify_data_callbacks(data_point)
-                            
-                            total_points += 1
-                            
-                            if sweep_params.delay_per_point > 0:
-                                time.sleep(sweep_params.delay_per_point)
-                        
-                        except Exception as e:
-                            logger.error(f"Measurement error at return point {total_points}: {e}")
-                    
-                    if self.should_stop:
-                        break
-                
-                # Increment sweep number for next bidirectional segment
-                sweep_number += 1
         
         except Exception as e:
             logger.error(f"IV sweep worker error: {e}")
         
         finally:
             self.keithley.output_off()
+            if blank_display:
+                self._set_measure_display(False)
             self.is_measuring = False
             self._close_cache()  # Close cache file
             logger.info(f"IV sweep completed. Total points: {total_points}")
+            self._notify_completion_callbacks()
     
     def start_time_monitor(self, monitor_params: MonitorParameters,
                           measurement_settings: MeasurementSettings,
-                          custom_filename: str = "", custom_path: str = "") -> bool:
+                          custom_filename: str = "", custom_path: str = "",
+                          reconfigure: bool = True) -> bool:
         """
         Start time monitoring measurement
         
         Args:
             monitor_params: Monitor parameters
             measurement_settings: Instrument settings
+            reconfigure: Send settings to the instrument before starting. Pass
+                False when the same settings were already applied successfully.
             
         Returns:
             bool: True if started successfully
+            
+        Raises:
+            RuntimeError: The instrument rejected the settings. Communication
+                errors while configuring are raised too; nothing is started.
         """
         if self.is_measuring:
             logger.error("Measurement already in progress")
             return False
         
+        # Configure instrument; configuration errors abort with their details
+        self._prepare_instrument(measurement_settings, reconfigure)
+        
         try:
-            # Configure instrument
-            self.keithley.configure_measurement(measurement_settings)
             
             # Set source level
             self.keithley.set_source_level(monitor_params.source_level)
@@ -605,44 +659,59 @@ class DataAcquisitionEngine:
     
     def _time_monitor_worker(self, monitor_params: MonitorParameters):
         """Worker thread for time monitoring measurement"""
+        # Static front panel screen while measuring, if enabled in the settings
+        blank_display = self.keithley.settings.blank_display
+        
         try:
             self.keithley.output_on()
+            if blank_display:
+                self._set_measure_display(True)
             
             start_time = time.time()
             point_count = 0
             
+            # Short intervals: hardware-timed blocks read back in binary instead of
+            # one ASCII query per point
+            block_size = 0
+            if monitor_params.interval > 0:
+                block_size = int(monitor_params.block_seconds / monitor_params.interval)
+            
+            # Point-by-point: due time of the next point, so the period stays
+            # interval however long a measurement takes
+            next_point = time.monotonic()
+            
             while not self.should_stop and (time.time() - start_time) < monitor_params.duration:
                 # Wait if paused
                 self.pause_event.wait()
                 
                 try:
-                    # Perform measurement
-                    source_val, measured_val, resistance, timestamp = self.keithley.measure()
-                    elapsed_time = time.time() - start_time
-                    
-                    # Create data point
-                    data_point = {
-                        'timestamp': timestamp,
-                        'elapsed_time': elapsed_time,
-                        'source_value': source_val,
-                        'measured_value': measured_val,
-                        'resistance': resistance,
-                        'point_index': point_count,
-                        'voltage': source_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else measured_val,
-                        'current': measured_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else source_val
-                    }
-                    
-                    # Save data
-                    data_line = f"{timestamp},{elapsed_time},{source_val},{measured_val},{resistance}"
-                    self.save_queue.put(data_line)
-                    
-                    # Notify callbacks
-                    self._notify_data_callbacks(data_point)
-                    
-                    point_count += 1
-                    
-                    # Wait for next measurement
-                    time.sleep(monitor_params.interval)
+                    if block_size > 1:
+                        # Do not run past the requested duration
+                        remaining = monitor_params.duration - (time.time() - start_time)
+                        count = max(1, min(block_size, int(remaining / monitor_params.interval) + 1))
+                        
+                        block_start = time.time()
+                        source_vals, measured_vals, offsets = self.keithley.measure_block(
+                            count, monitor_params.interval)
+                        
+                        self._emit_monitor_block(source_vals, measured_vals, block_start + offsets, 
+                                                 start_time, point_count)
+                        point_count += len(source_vals)
+                    else:
+                        # Perform measurement
+                        source_val, measured_val, resistance, timestamp = self.keithley.measure()
+                        self._emit_monitor_point(source_val, measured_val, resistance, timestamp, 
+                                                 start_time, point_count)
+                        point_count += 1
+                        
+                        # Wait for next measurement; when running late (slow query,
+                        # pause) restart the schedule instead of catching up
+                        next_point += monitor_params.interval
+                        delay = next_point - time.monotonic()
+                        if delay > 0:
+                            time.sleep(delay)
+                        else:
+                            next_point = time.monotonic()
                 
                 except Exception as e:
                     logger.error(f"Measurement error at point {point_count}: {e}")
@@ -653,8 +722,117 @@ class DataAcquisitionEngine:
         
         finally:
             self.keithley.output_off()
+            if blank_display:
+                self._set_measure_display(False)
             self.is_measuring = False
             logger.info(f"Time monitoring completed. Total points: {point_count}")
+            self._notify_completion_callbacks()
+    
+    def _set_measure_display(self, measuring: bool):
+        """Switch the front panel display for a measurement, logging failures"""
+        try:
+            self.keithley.set_measure_display(measuring)
+        except Exception as e:
+            logger.warning(f"Could not switch instrument display: {e}")
+    
+    def _emit_monitor_block(self, source_vals: np.ndarray, measured_vals: np.ndarray, 
+                            timestamps: np.ndarray, start_time: float, point_count: int):
+        """Save a block of time monitor points and hand it to the callbacks as arrays"""
+        if self.keithley.settings.source_function == SourceFunction.VOLTAGE:
+            voltages, currents = source_vals, measured_vals
+        else:
+            voltages, currents = measured_vals, source_vals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            resistances = np.where(np.abs(currents) > 1e-12, voltages / currents, np.inf)
+        elapsed = timestamps - start_time
+        
+        # Save data (one queue item for the whole block, a list of lines)
+        rows = zip(timestamps.tolist(), elapsed.tolist(), source_vals.tolist(), 
+                   measured_vals.tolist(), resistances.tolist())
+        self.save_queue.put([f"{t},{e},{s},{m},{r}" for t, e, s, m, r in rows])
+        
+        if self.batch_callbacks:
+            self._notify_batch_callbacks(1, voltages, currents, timestamps)
+        else:
+            # No batch listeners: hand the block out point by point
+            for index, (timestamp, elapsed_time, source_val, measured_val, resistance, voltage, current) in \
+                    enumerate(zip(timestamps.tolist(), elapsed.tolist(), source_vals.tolist(), 
+                                  measured_vals.tolist(), resistances.tolist(), 
+                                  voltages.tolist(), currents.tolist())):
+                self._notify_data_callbacks({
+                    'timestamp': timestamp,
+                    'elapsed_time': elapsed_time,
+                    'source_value': source_val,
+                    'measured_value': measured_val,
+                    'resistance': resistance,
+                    'point_index': point_count + index,
+                    'voltage': voltage,
+                    'current': current
+                })
+    
+    def _emit_sweep_block(self, source_vals: np.ndarray, measured_vals: np.ndarray, 
+                          timestamps: np.ndarray, segment_idx: int, sweep_number: int, point_count: int):
+        """Save a block of IV sweep points and hand it to the callbacks as arrays"""
+        if self.keithley.settings.source_function == SourceFunction.VOLTAGE:
+            voltages, currents = source_vals, measured_vals
+        else:
+            voltages, currents = measured_vals, source_vals
+        with np.errstate(divide='ignore', invalid='ignore'):
+            resistances = np.where(np.abs(currents) > 1e-12, voltages / currents, np.inf)
+        
+        # Save data with sweep_number and relative timestamp (one queue item for the
+        # block, a list of lines)
+        rows = zip(timestamps.tolist(), source_vals.tolist(), measured_vals.tolist(), 
+                   resistances.tolist(), range(point_count, point_count + len(source_vals)))
+        self.save_queue.put([f"{t:.3f},{s},{m},{r},{segment_idx},{i},{sweep_number}" 
+                             for t, s, m, r, i in rows])
+        
+        # Force file sync every 50 points for safety
+        if (point_count - 1) // 50 != (point_count + len(source_vals) - 1) // 50:
+            self.save_queue.put("__SYNC_MARKER__")
+        
+        if self.batch_callbacks:
+            self._notify_batch_callbacks(sweep_number, voltages, currents, timestamps)
+        else:
+            # No batch listeners: hand the block out point by point
+            for index, (timestamp, source_val, measured_val, resistance, voltage, current) in \
+                    enumerate(zip(timestamps.tolist(), source_vals.tolist(), measured_vals.tolist(), 
+                                  resistances.tolist(), voltages.tolist(), currents.tolist())):
+                self._notify_data_callbacks({
+                    'timestamp': timestamp,
+                    'source_value': source_val,
+                    'measured_value': measured_val,
+                    'resistance': resistance,
+                    'segment': segment_idx,
+                    'point_index': point_count + index,
+                    'sweep_number': sweep_number,
+                    'voltage': voltage,
+                    'current': current
+                })
+    
+    def _emit_monitor_point(self, source_val: float, measured_val: float, resistance: float, 
+                            timestamp: float, start_time: float, point_count: int):
+        """Save one time monitor point and hand it to the data callbacks"""
+        elapsed_time = timestamp - start_time
+        
+        # Create data point
+        data_point = {
+            'timestamp': timestamp,
+            'elapsed_time': elapsed_time,
+            'source_value': source_val,
+            'measured_value': measured_val,
+            'resistance': resistance,
+            'point_index': point_count,
+            'voltage': source_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else measured_val,
+            'current': measured_val if self.keithley.settings.source_function == SourceFunction.VOLTAGE else source_val
+        }
+        
+        # Save data
+        data_line = f"{timestamp},{elapsed_time},{source_val},{measured_val},{resistance}"
+        self.save_queue.put(data_line)
+        
+        # Notify callbacks
+        self._notify_data_callbacks(data_point)
     
     def stop_measurement(self):
         """Stop current measurement"""
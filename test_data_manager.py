@@ -0,0 +1,105 @@
+"""
+Unit tests for the live data buffer and live data export
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_manager import DataManager, MeasurementBuffer
+
+
+def fill(buffer, start, stop):
+    """Append samples start..stop-1 one at a time (voltage = index)"""
+    for i in range(start, stop):
+        buffer.append(float(i), i * 1e-6, i * 0.1)
+
+
+# MeasurementBuffer
+
+def test_buffer_grows_and_returns_views_in_order():
+    buffer = MeasurementBuffer(capacity=4)
+    fill(buffer, 0, 10)
+
+    voltage, current, timestamps = buffer.get_array()
+    assert len(buffer) == 10
+    np.testing.assert_array_equal(voltage, np.arange(10.0))
+    np.testing.assert_allclose(current, np.arange(10) * 1e-6)
+    np.testing.assert_array_equal(buffer['time'], timestamps)
+    assert buffer.dropped == 0
+
+
+def test_buffer_window_keeps_newest_points():
+    buffer = MeasurementBuffer(capacity=4, max_points=5)
+    fill(buffer, 0, 23)
+
+    assert len(buffer) == 5
+    np.testing.assert_array_equal(buffer['voltage'], np.arange(18.0, 23.0))
+    assert buffer.dropped == 18
+    assert buffer._capacity <= 10
+
+
+def test_buffer_extend_matches_append():
+    appended = MeasurementBuffer(capacity=2, max_points=7)
+    extended = MeasurementBuffer(capacity=2, max_points=7)
+    fill(appended, 0, 30)
+    for start in range(0, 30, 4):
+        index = np.arange(start, min(start + 4, 30))
+        extended.extend(index.astype(float), index * 1e-6, index * 0.1)
+
+    for column in MeasurementBuffer.COLUMNS:
+        np.testing.assert_array_equal(appended[column], extended[column])
+    assert extended.dropped == appended.dropped
+
+
+def test_buffer_extend_larger_than_window():
+    buffer = MeasurementBuffer(max_points=3)
+    index = np.arange(10)
+    buffer.extend(index.astype(float), index * 1e-6, index * 0.1)
+
+    np.testing.assert_array_equal(buffer['voltage'], [7.0, 8.0, 9.0])
+    assert buffer.dropped == 7
+
+
+def test_buffer_clear_resets_counts():
+    buffer = MeasurementBuffer(max_points=3)
+    fill(buffer, 0, 10)
+    buffer.clear()
+
+    assert len(buffer) == 0
+    assert buffer.dropped == 0
+
+
+# Live data export
+
+def test_export_live_data_writes_all_points(tmp_path):
+    manager = DataManager(str(tmp_path / "data"))
+    manager.live_data[1] = MeasurementBuffer()
+    fill(manager.live_data[1], 0, 5)
+    manager.live_data[1].append(1.0, 1e-15, 1.0)
+
+    filename = tmp_path / "export.csv"
+    total_points, truncated = manager.export_live_data(str(filename), [1])
+
+    assert (total_points, truncated) == (6, {})
+    data = pd.read_csv(filename)
+    assert len(data) == 6
+    assert data['resistance'].iloc[1] == pytest.approx(1e6)
+    # Currents at the noise floor (|I| <= 1e-12) have no finite resistance
+    assert np.isinf(data['resistance'].iloc[0]) and np.isinf(data['resistance'].iloc[-1])
+
+
+def test_export_live_data_records_truncation(tmp_path):
+    manager = DataManager(str(tmp_path / "data"))
+    manager.live_data[1] = MeasurementBuffer(max_points=4)
+    manager.live_data[2] = MeasurementBuffer(max_points=4)
+    fill(manager.live_data[1], 0, 10)
+    fill(manager.live_data[2], 0, 3)
+
+    filename = tmp_path / "export.csv"
+    total_points, truncated = manager.export_live_data(str(filename), [1, 2])
+
+    assert (total_points, truncated) == (7, {1: 6})
+    assert filename.read_text().startswith("# sweep 1: oldest 6 points not included")
+    data = pd.read_csv(filename, comment='#')
+    np.testing.assert_array_equal(data['voltage'], [6.0, 7.0, 8.0, 9.0, 0.0, 1.0, 2.0])
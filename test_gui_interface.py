@@ -0,0 +1,64 @@
+"""
+Unit tests for GUI helpers that need no display
+"""
+
+import threading
+from collections import deque
+from types import SimpleNamespace
+
+import numpy as np
+
+from gui_interface import MainApplication, _minmax_decimate
+
+
+def test_decimate_keeps_extremes_ends_and_order():
+    x = np.arange(1000.0)
+    y = np.sin(x / 7.0)
+    y[123] = 5.0
+    y[777] = -5.0
+
+    dx, dy = _minmax_decimate(x, y, 50)
+
+    assert len(dx) <= 2 * 50 + 2
+    assert np.all(np.diff(dx) > 0)
+    assert (dx[0], dx[-1]) == (0.0, 999.0)
+    assert {123.0, 777.0} <= set(dx.tolist())
+    np.testing.assert_array_equal(dy, y[dx.astype(int)])
+    # Every bin keeps its lowest and highest value
+    step = 20
+    for start in range(0, 1000, step):
+        in_bin = (dx >= start) & (dx < start + step)
+        assert dy[in_bin].min() == y[start:start + step].min()
+        assert dy[in_bin].max() == y[start:start + step].max()
+
+
+def test_decimate_handles_partial_last_bin():
+    x = np.arange(1003.0)
+    y = np.zeros(1003)
+    y[1001] = 1.0
+
+    dx, dy = _minmax_decimate(x, y, 100)
+
+    assert 1001.0 in dx.tolist() and dx[-1] == 1002.0
+
+
+def test_decimate_leaves_short_lines_unchanged():
+    x, y = np.arange(40.0), np.arange(40.0)
+
+    assert _minmax_decimate(x, y, 10)[0] is x
+    assert _minmax_decimate(x, y, 0)[1] is y
+
+
+def test_data_queue_is_bounded_by_points_and_counts_drops():
+    # The queue helpers only use these attributes of MainApplication
+    app = SimpleNamespace(data_queue=deque(), max_queued_points=10, dropped_points=0,
+                          _queued_points=0, _queued_points_lock=threading.Lock())
+    block = (1, np.zeros(8), np.zeros(8), np.zeros(8))
+
+    MainApplication._enqueue_data(app, block, 8)
+    MainApplication._enqueue_data(app, {'voltage': 1.0}, 1)
+    MainApplication._enqueue_data(app, block, 8)  # Does not fit
+    MainApplication._enqueue_data(app, {'voltage': 2.0}, 1)
+
+    assert len(app.data_queue) == 3
+    assert (app._queued_points, app.dropped_points) == (10, 8)
@@ -0,0 +1,498 @@
+"""
+Unit tests for the Keithley 2634B driver against a fake VISA resource
+(no instrument or VISA runtime needed)
+"""
+
+import math
+import threading
+import time
+
+import numpy as np
+import pytest
+
+import keithley_driver
+from keithley_driver import Keithley2634B, MeasurementSettings
+
+
+class FakeInstrument:
+    """Stands in for a pyvisa resource: records writes, answers queries by substring"""
+
+    def __init__(self, responses=None):
+        self.timeout = 15000
+        self.writes = []
+        self.queries = []
+        self.responses = dict(responses or {})
+        self.binary_data = np.empty(0)
+        self.binary_calls = []
+        self.ascii_data = []
+
+    def write(self, command):
+        self.writes.append(command)
+
+    def query(self, command):
+        self.queries.append(command)
+        for key, response in self.responses.items():
+            if key in command:
+                return response
+        return ""
+
+    def query_ascii_values(self, command, converter='f', separator=','):
+        self.queries.append(command)
+        return list(self.ascii_data)
+
+    def query_binary_values(self, command, datatype='f', is_big_endian=False, container=list,
+                            data_points=0):
+        self.queries.append(command)
+        self.binary_calls.append({'datatype': datatype, 'is_big_endian': is_big_endian,
+                                  'data_points': data_points})
+        if isinstance(self.binary_data, Exception):
+            raise self.binary_data
+        return np.asarray(self.binary_data, dtype=datatype)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    """Connected driver on a FakeInstrument whose error queue is empty"""
+    monkeypatch.setattr(keithley_driver.pyvisa, "ResourceManager", lambda: None)
+    keithley = Keithley2634B("GPIB0::26::INSTR", "a")
+    keithley.instrument = FakeInstrument({"errorqueue.count": "0.00000e+00"})
+    keithley.is_connected = True
+    return keithley
+
+
+def sent_commands(instrument):
+    """All statements written so far, split at '; '"""
+    return [command for write in instrument.writes for command in write.split("; ")]
+
+
+# Skipping unchanged configuration steps
+
+def test_unchanged_configuration_only_turns_output_off(driver):
+    settings = MeasurementSettings()
+    assert driver.configure_measurement(settings) == (True, [])
+    driver.instrument.writes.clear()
+
+    assert driver.configure_measurement(settings) == (True, [])
+
+    commands = sent_commands(driver.instrument)
+    assert any("source.output" in command for command in commands)
+    assert not any("nplc" in command or "limiti" in command for command in commands)
+
+
+def test_changed_step_is_sent_with_all_later_steps(driver):
+    driver.configure_measurement(MeasurementSettings())
+    driver.instrument.writes.clear()
+
+    driver.configure_measurement(MeasurementSettings(nplc=5.0))
+
+    commands = sent_commands(driver.instrument)
+    assert "smua.measure.nplc = 5.0" in commands
+    assert any("filter.enable" in command for command in commands)
+    assert not any("limiti" in command or "source.func" in command for command in commands)
+
+
+def test_force_sends_every_step(driver):
+    settings = MeasurementSettings()
+    driver.configure_measurement(settings)
+    full = list(driver.instrument.writes)
+    driver.instrument.writes.clear()
+
+    driver.configure_measurement(settings, force=True)
+
+    assert driver.instrument.writes == full
+
+
+def test_invalidate_configuration_sends_every_step(driver):
+    settings = MeasurementSettings()
+    driver.configure_measurement(settings)
+    full = list(driver.instrument.writes)
+    driver.instrument.writes.clear()
+
+    driver.invalidate_configuration()
+    driver.configure_measurement(settings)
+
+    assert driver.instrument.writes == full
+
+
+def test_failed_configuration_is_not_remembered(driver):
+    settings = MeasurementSettings()
+    driver.instrument.responses["errorqueue.count"] = "1.00000e+00"
+    driver.configure_measurement(settings)
+
+    driver.instrument.responses["errorqueue.count"] = "0.00000e+00"
+    driver.instrument.writes.clear()
+    driver.configure_measurement(settings)
+
+    assert any("nplc" in command for command in sent_commands(driver.instrument))
+
+
+# Instrument-side sweep blocks
+
+def test_sweep_block_runs_tsp_loop_and_reads_binary(driver):
+    # printbuffer rows: current, voltage, timestamp
+    driver.instrument.binary_data = np.array([1e-6, 0.0, 10.0, 2e-6, 0.5, 10.1, 3e-6, 1.0, 10.2])
+
+    source, measured, timestamps = driver.sweep_block(0.0, 0.5, 3, settle=0.01, delay=0.02)
+
+    script = driver.instrument.writes[-1]
+    assert "for i = 0, 2 do smua.source.levelv = 0.0 + i * 0.5 delay(0.01) " \
+           "smua.measure.iv(smua.nvbuffer1, smua.nvbuffer2) delay(0.02) end" in script
+    assert "source.output" not in script
+    np.testing.assert_allclose(source, [0.0, 0.5, 1.0])
+    np.testing.assert_allclose(measured, [1e-6, 2e-6, 3e-6])
+    np.testing.assert_allclose(timestamps, [0.0, 0.1, 0.2])
+    assert driver.instrument.timeout == 15000
+
+
+# Front panel display
+
+def test_measure_display_restores_previous_screen(driver):
+    driver.instrument.responses["display.screen"] = "1.00000e+00"  # SMUB screen
+
+    driver.set_measure_display(True)
+    assert "display.USER" in driver.instrument.writes[-1]
+    driver.set_measure_display(False)
+
+    assert driver.instrument.writes[-1] == "display.screen = 1"
+
+
+# Measuring several instruments
+
+class RecordingDriver:
+    """measure_many() stand-in: logs (resource, thread) and optionally waits at a barrier"""
+
+    def __init__(self, resource_name, value, log, barrier=None):
+        self.resource_name = resource_name
+        self.value = value
+        self.log = log
+        self.barrier = barrier
+
+    def measure(self):
+        self.log.append((self.resource_name, threading.current_thread().name))
+        if self.barrier:
+            self.barrier.wait()
+        time.sleep(0.01)
+        return (self.value, 0.0, math.inf, 0.0)
+
+
+def test_measure_many_keeps_order_and_groups_connections():
+    log = []
+    resources = ["GPIB0::26::INSTR", "TCPIP0::10.0.0.1::INSTR", "GPIB0::27::INSTR",
+                 "TCPIP0::10.0.0.2::INSTR", "GPIB1::26::INSTR", "TCPIP0::10.0.0.3::INSTR"]
+    # Expected groups: GPIB0 (both), GPIB1 and each TCPIP resource. The first
+    # instrument of every group waits for the others, so the groups must run at once
+    barrier = threading.Barrier(5, timeout=5)
+    drivers = [RecordingDriver(resource, float(index), log, None if index == 2 else barrier)
+               for index, resource in enumerate(resources)]
+
+    results = keithley_driver.measure_many(drivers)
+
+    assert [result[0] for result in results] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    # Same GPIB board: one thread, in order
+    threads = dict(log)
+    assert threads["GPIB0::26::INSTR"] == threads["GPIB0::27::INSTR"]
+    assert [resource for resource, _ in log if resource.startswith("GPIB0")] == resources[0:3:2]
+
+
+def test_measure_many_reuses_one_pool():
+    log = []
+    drivers = [RecordingDriver("TCPIP0::10.0.0.1::INSTR", 1.0, log),
+               RecordingDriver("TCPIP0::10.0.0.2::INSTR", 2.0, log)]
+
+    keithley_driver.measure_many(drivers)
+    pool = keithley_driver._measure_pool
+    keithley_driver.measure_many(drivers)
+
+    assert pool is not None and keithley_driver._measure_pool is pool
+
+
+def test_measure_many_single_group_runs_inline():
+    log = []
+    drivers = [RecordingDriver("GPIB0::26::INSTR", 1.0, log), RecordingDriver("GPIB0::27::INSTR", 2.0, log)]
+
+    assert [result[0] for result in keithley_driver.measure_many(drivers)] == [1.0, 2.0]
+    assert {thread for _, thread in log} == {threading.current_thread().name}
+
+
+# Batched configuration
+
+def test_configuration_is_one_write_and_one_error_query(driver):
+    success, errors = driver.configure_measurement(MeasurementSettings(compliance=2e-3, nplc=2.0))
+
+    assert (success, errors) == (True, [])
+    assert driver.instrument.writes[0] == "errorqueue.clear()"
+    assert len(driver.instrument.writes) == 2
+    assert driver.instrument.queries == ["print(errorqueue.count)"]
+    commands = sent_commands(driver.instrument)
+    assert "smua.measure.nplc = 2.0" in commands
+    assert any("limiti = 0.002" in command for command in commands)
+
+
+def test_configuration_errors_are_attributed_step_by_step(driver):
+    # Every error queue check reports one error
+    driver.instrument = FakeInstrument({"errorqueue.next": "-286\tTSP Runtime error",
+                                        "errorqueue.count": "1.00000e+00"})
+    steps = driver._build_config_steps(MeasurementSettings())
+
+    success, errors = driver.configure_measurement(MeasurementSettings())
+
+    assert not success
+    assert errors == [f"{label}: -286\tTSP Runtime error" for label, _ in steps]
+    # Clear, batch, clear again, then one write per step
+    assert len(driver.instrument.writes) == 3 + len(steps)
+    assert driver._applied_steps is None
+
+
+# On-instrument IV sweep
+
+def test_iv_sweep_is_one_tsp_loop_with_array_rows(driver):
+    # printbuffer rows: current, voltage, timestamp; the last current is below 1 pA
+    driver.instrument.binary_data = np.array([1e-3, 0.0, 5.0, 2e-3, 1.0, 5.5, 1e-15, 2.0, 6.0])
+
+    rows = driver.iv_sweep(0, 2, 3, delay=0.1)
+
+    script = driver.instrument.writes[-1]
+    assert "for i = 0, 2 do smua.source.levelv = 0.0 + i * 1.0 delay(0.1) " in script
+    assert script.count("source.output") == 2
+    assert rows.shape == (3, 4) and rows.dtype == np.float64
+    np.testing.assert_allclose(rows[:, 0], [0.0, 1.0, 2.0])
+    np.testing.assert_allclose(rows[:, 1], [1e-3, 2e-3, 1e-15])
+    np.testing.assert_allclose(rows[:2, 2], [0.0, 500.0])
+    assert np.isinf(rows[2, 2])
+    np.testing.assert_allclose(np.diff(rows[:, 3]), [0.5, 0.5], atol=1e-6)
+    assert driver.instrument.timeout == 15000
+
+
+def test_iv_sweep_turns_output_off_when_readback_fails(driver):
+    driver.instrument.binary_data = TimeoutError("VI_ERROR_TMO")
+
+    with pytest.raises(TimeoutError):
+        driver.iv_sweep(0, 1, 5)
+
+    assert driver.instrument.writes[-1] == "smua.source.output = smua.OUTPUT_OFF"
+    assert driver.instrument.timeout == 15000
+
+
+def test_monitor_current_returns_current_voltage_time_rows(driver):
+    driver.instrument.binary_data = np.array([1e-6, 0.5, 2.0, 2e-6, 0.5, 2.1])
+
+    rows = driver.monitor_current(duration=0.2, interval=0.1)
+
+    assert rows.shape == (2, 3)
+    np.testing.assert_allclose(rows[:, 0], [1e-6, 2e-6])
+    np.testing.assert_allclose(rows[:, 1], [0.5, 0.5])
+    np.testing.assert_allclose(np.diff(rows[:, 2]), [0.1], atol=1e-6)
+    assert "smua.measure.count = 2" in sent_commands(driver.instrument)
+    assert driver.instrument.writes[-1] == "smua.source.output = smua.OUTPUT_OFF"
+
+
+class FakeClock:
+    """Stands in for the time module in keithley_driver: sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+def test_monitor_current_long_interval_measures_point_by_point(driver, monkeypatch):
+    monkeypatch.setattr(keithley_driver, "time", FakeClock())
+    driver.instrument.ascii_data = [1e-6, 0.5]
+
+    rows = driver.monitor_current(duration=6.0, interval=2.0)
+
+    # No measure.interval (limited to 1 s on the instrument): one measure.iv() per point
+    assert not any("measure.interval" in command for command in sent_commands(driver.instrument))
+    assert driver.instrument.queries == ["print(smua.measure.iv())"] * 3
+    np.testing.assert_allclose(rows[:, 0], [1e-6] * 3)
+    np.testing.assert_allclose(np.diff(rows[:, 2]), [2.0, 2.0])
+    assert driver.instrument.writes[-1] == "smua.source.output = smua.OUTPUT_OFF"
+
+
+def test_monitor_current_reads_blocks_and_stops_early(driver):
+    driver.instrument.binary_data = np.array([1e-6, 0.5, 0.0, 2e-6, 0.5, 0.1])
+    stop_event = threading.Event()
+    readback = driver.instrument.query_binary_values
+
+    def query_binary_values(command, **kwargs):
+        stop_event.set()  # Stop requested during the first block
+        return readback(command, **kwargs)
+
+    driver.instrument.query_binary_values = query_binary_values
+
+    rows = driver.monitor_current(duration=100.0, interval=0.1, block_seconds=0.2, stop_event=stop_event)
+
+    assert rows.shape == (2, 3)
+    assert "smua.measure.count = 2" in sent_commands(driver.instrument)
+    assert driver.instrument.writes[-1] == "smua.source.output = smua.OUTPUT_OFF"
+    assert driver.instrument.timeout == 15000
+
+
+def test_measure_block_rejects_intervals_over_one_second(driver):
+    with pytest.raises(ValueError):
+        driver.measure_block(3, 1.5)
+
+
+# Buffer readback formats
+
+def test_binary_readback_switches_format_within_one_message(driver):
+    driver.instrument.binary_data = np.arange(6.0)
+
+    readings = driver._read_buffers(2, ("smua",))
+
+    command = driver.instrument.queries[-1]
+    assert command.startswith("format.data = format.REAL64; format.byteorder = format.LITTLEENDIAN; ")
+    assert ("printbuffer(1, 2, smua.nvbuffer1.readings, smua.nvbuffer2.readings, "
+            "smua.nvbuffer1.timestamps)") in command
+    assert command.endswith("format.data = format.ASCII")
+    assert driver.instrument.binary_calls[-1] == {'datatype': 'd', 'is_big_endian': False, 'data_points': 6}
+    np.testing.assert_array_equal(readings, [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    assert driver.instrument.writes == []
+
+
+def test_real32_readback_is_returned_as_float64(driver):
+    driver.buffer_format = "REAL32"
+    driver.instrument.binary_data = np.arange(12.0)
+
+    readings = driver._read_buffers(2, ("smua", "smub"))
+
+    assert "format.data = format.REAL32" in driver.instrument.queries[-1]
+    assert driver.instrument.binary_calls[-1]['datatype'] == 'f'
+    assert driver.instrument.binary_calls[-1]['data_points'] == 12
+    assert readings.dtype == np.float64 and readings.shape == (2, 6)
+
+
+def test_ascii_readback(driver):
+    driver.buffer_format = "ASCII"
+    driver.instrument.ascii_data = [1e-6, 0.5, 0.0, 2e-6, 1.0, 0.1]
+
+    readings = driver._read_buffers(2, ("smua",))
+
+    assert driver.instrument.queries[-1].startswith("printbuffer(1, 2, ")
+    assert driver.instrument.binary_calls == []
+    np.testing.assert_allclose(readings[:, 1], [0.5, 1.0])
+
+
+# Error queue
+
+def test_check_errors_drains_queue_in_one_query(driver):
+    driver.instrument = FakeInstrument({"errorqueue.next": "-285\tSyntax error\x1e-286\tRuntime error\n"})
+
+    assert driver.check_errors() == ["-285\tSyntax error", "-286\tRuntime error"]
+    assert len(driver.instrument.queries) == 1
+    assert "table.getn(errs)" in driver.instrument.queries[0]
+
+
+def test_check_errors_empty_queue(driver):
+    driver.instrument = FakeInstrument({"errorqueue.next": "\n"})
+
+    assert driver.check_errors() == []
+
+
+def test_check_errors_reports_query_failure(driver):
+    def fail(command):
+        raise TimeoutError("VI_ERROR_TMO")
+    driver.instrument.query = fail
+
+    assert driver.check_errors() == ["Failed to check errors: VI_ERROR_TMO"]
+
+
+# Status cache
+
+def test_status_is_cached_for_status_ttl(driver):
+    driver.instrument.responses["source.output"] = "1.00000e+00\t5.00000e-01"
+    driver.status_ttl = 10.0
+
+    first = driver.get_status()
+    first["output_on"] = False  # Callers get copies
+    second = driver.get_status()
+
+    assert second["output_on"] and second["source_level"] == 0.5
+    assert len(driver.instrument.queries) == 1
+
+
+def test_write_invalidates_status_cache(driver):
+    driver.instrument.responses["source.output"] = "0.00000e+00\t0.00000e+00"
+    driver.status_ttl = 10.0
+    driver.get_status()
+
+    driver.output_on()
+    driver.instrument.responses["source.output"] = "1.00000e+00\t0.00000e+00"
+
+    assert driver.get_status()["output_on"]
+    assert len(driver.instrument.queries) == 2
+
+
+def test_status_ttl_zero_always_queries(driver):
+    driver.instrument.responses["source.output"] = "0.00000e+00\t0.00000e+00"
+    driver.status_ttl = 0
+
+    driver.get_status()
+    driver.get_status()
+
+    assert len(driver.instrument.queries) == 2
+
+
+# Dual-SMU sweep
+
+def dual_instrument(errors=""):
+    """FakeInstrument whose error queue drain returns errors"""
+    return FakeInstrument({"errorqueue.next": errors, "errorqueue.count": "0.00000e+00"})
+
+
+def test_dual_sweep_configures_both_smus_then_runs_one_loop(driver):
+    driver.instrument = dual_instrument()
+    driver.settings = MeasurementSettings(compliance=2e-3)
+    # printbuffer rows: smua current, voltage, time, smub current, voltage, time
+    driver.instrument.binary_data = np.array([1e-3, 0.0, 7.0, 2e-3, 1.0, 7.0,
+                                              3e-3, 1.0, 7.5, 4e-3, 0.5, 7.5])
+
+    smua_rows, smub_rows = driver.dual_sweep((0.0, 1.0), (1.0, 0.5), 2, delay=0.05)
+
+    # Errors cleared, both SMUs configured (constants by name: not read at connect), sweep
+    clear, config, script = driver.instrument.writes
+    assert clear == "errorqueue.clear()"
+    for smu in ("smua", "smub"):
+        assert f"{smu}.source.output = smua.OUTPUT_OFF" in config
+        assert f"{smu}.source.func = smua.OUTPUT_DCVOLTS" in config
+        assert f"{smu}.source.limiti = 0.002" in config
+        assert f"display.{smu}.measure.func = display.MEASURE_DCAMPS" in config
+    assert ("for i = 0, 1 do smua.source.levelv = 0.0 + i * 1.0 smub.source.levelv = 1.0 + i * -0.5 "
+            "delay(0.05) smua.measure.overlappediv(smua.nvbuffer1, smua.nvbuffer2) "
+            "smub.measure.overlappediv(smub.nvbuffer1, smub.nvbuffer2) waitcomplete() end") in script
+    assert driver.instrument.binary_calls[-1]['data_points'] == 12
+
+    np.testing.assert_allclose(smua_rows[:, :3], [[0.0, 1e-3, 0.0], [1.0, 3e-3, 1.0 / 3e-3]])
+    np.testing.assert_allclose(smub_rows[:, :3], [[1.0, 2e-3, 500.0], [0.5, 4e-3, 125.0]])
+    np.testing.assert_allclose(smub_rows[:, 3] - smua_rows[0, 3], [0.0, 0.5], atol=1e-6)
+
+
+def test_dual_sweep_follows_the_driver_channel(driver):
+    driver.instrument = dual_instrument()
+    driver.smu_name, driver.channel = "smub", "b"
+    driver.instrument.binary_data = np.array([1e-3, 0.0, 7.0, 2e-3, 1.0, 7.0])
+
+    smub_rows, smua_rows = driver.dual_sweep((0.0, 1.0), (0.0, 1.0), 1)
+
+    assert "printbuffer(1, 1, smub.nvbuffer1.readings" in driver.instrument.queries[-1]
+    np.testing.assert_allclose(smub_rows[:, 1], [1e-3])
+    np.testing.assert_allclose(smua_rows[:, 1], [2e-3])
+
+
+def test_dual_sweep_does_not_source_after_configuration_errors(driver):
+    driver.instrument = dual_instrument("-221\tSettings conflict")
+
+    with pytest.raises(RuntimeError, match="Settings conflict"):
+        driver.dual_sweep((0.0, 0.0), (1.0, 1.0), 3)
+
+    assert not any("OUTPUT_ON" in write for write in driver.instrument.writes)
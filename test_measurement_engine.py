@@ -0,0 +1,181 @@
+"""
+Unit tests for the measurement engine workers against a stub driver
+"""
+
+import queue
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import measurement_engine
+from keithley_driver import MeasurementSettings
+from measurement_engine import DataAcquisitionEngine, MonitorParameters, SweepParameters
+
+
+class StubKeithley:
+    """Driver stand-in: sweep blocks return I = V / 1000 and 1 ms per point"""
+
+    def __init__(self):
+        self.settings = MeasurementSettings()
+        self.blocks = []
+        self.displays = []
+
+    def sweep_block(self, start, step, count, settle=0.0, delay=0.0):
+        self.blocks.append((start, step, count))
+        source = start + step * np.arange(count)
+        return source, source / 1000.0, np.arange(count) * 1e-3
+
+    def output_on(self):
+        pass
+
+    def output_off(self):
+        pass
+
+    def set_measure_display(self, measuring):
+        self.displays.append(measuring)
+
+
+def run_sweep(tmp_path, sweep_params):
+    """Run the IV sweep worker synchronously; returns (driver, saved data rows)"""
+    keithley = StubKeithley()
+    engine = DataAcquisitionEngine(keithley, str(tmp_path))
+    engine.measurement_start_time = datetime.now()
+    engine._iv_sweep_worker(sweep_params)
+
+    rows = []
+    while True:
+        try:
+            item = engine.save_queue.get_nowait()
+        except queue.Empty:
+            break
+        if isinstance(item, list):
+            rows += [line.split(",") for line in item]
+    return keithley, rows
+
+
+def test_iv_sweep_runs_each_leg_in_blocks(tmp_path):
+    sweep_params = SweepParameters(segments=[(0.0, 1.0, 11), (1.0, 0.0, 5)], delay_per_point=0.0,
+                                   bidirectional=True, block_seconds=0.1)
+    keithley, rows = run_sweep(tmp_path, sweep_params)
+
+    # nplc 1: 0.03 s per point, so 3 points per block; blocks never span legs
+    counts = [count for _, _, count in keithley.blocks]
+    assert counts == [3, 3, 3, 2, 3, 2, 3, 2, 3, 3, 3, 2]
+    assert keithley.blocks[0] == (0.0, 0.1, 3)
+
+    levels, segments, sweeps = sweep_params.schedule()
+    np.testing.assert_allclose([float(row[1]) for row in rows], levels, atol=1e-12)
+    assert [int(row[4]) for row in rows] == segments.tolist()
+    assert [int(row[5]) for row in rows] == list(range(len(levels)))
+    assert [int(row[6]) for row in rows] == sweeps.tolist()
+
+
+def test_iv_sweep_hands_blocks_to_batch_callbacks(tmp_path):
+    keithley = StubKeithley()
+    engine = DataAcquisitionEngine(keithley, str(tmp_path))
+    engine.measurement_start_time = datetime.now()
+    batches = []
+    engine.add_batch_callback(lambda sweep, v, i, t: batches.append((sweep, len(v))))
+
+    engine._iv_sweep_worker(SweepParameters(segments=[(0.0, 1.0, 4)], delay_per_point=0.0, 
+                                            block_seconds=0.0))
+
+    assert batches == [(1, 1)] * 4
+
+
+def test_display_is_blanked_only_when_enabled(tmp_path):
+    sweep_params = SweepParameters(segments=[(0.0, 1.0, 2)], delay_per_point=0.0)
+
+    keithley, _ = run_sweep(tmp_path, sweep_params)
+    assert keithley.displays == []
+
+    keithley = StubKeithley()
+    keithley.settings = MeasurementSettings(blank_display=True)
+    engine = DataAcquisitionEngine(keithley, str(tmp_path))
+    engine.measurement_start_time = datetime.now()
+    engine._iv_sweep_worker(sweep_params)
+    assert keithley.displays == [True, False]
+
+
+class FakeClock:
+    """Stands in for the time module in measurement_engine: sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+def test_point_by_point_monitor_keeps_its_period(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(measurement_engine, "time", clock)
+    keithley = StubKeithley()
+    readings = []
+
+    def measure():
+        readings.append(clock.now)
+        clock.now += 0.03  # Query round trip
+        return 0.0, 1e-6, 0.0, clock.now
+
+    keithley.measure = measure
+    engine = DataAcquisitionEngine(keithley, str(tmp_path))
+    engine._time_monitor_worker(MonitorParameters(duration=0.6, interval=0.1, block_seconds=0.0))
+
+    # Started every 0.1 s, not every 0.1 s + round trip
+    np.testing.assert_allclose(np.diff(readings), 0.1)
+    assert len(readings) == 6
+
+
+def test_point_by_point_monitor_restarts_schedule_when_late(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(measurement_engine, "time", clock)
+    keithley = StubKeithley()
+    readings = []
+
+    def measure():
+        readings.append(clock.now)
+        clock.now += 0.25 if len(readings) == 2 else 0.01  # One slow query
+        return 0.0, 1e-6, 0.0, clock.now
+
+    keithley.measure = measure
+    engine = DataAcquisitionEngine(keithley, str(tmp_path))
+    engine._time_monitor_worker(MonitorParameters(duration=0.6, interval=0.1, block_seconds=0.0))
+
+    # No burst of catch-up points after the slow one
+    np.testing.assert_allclose(np.diff(readings), [0.1, 0.25, 0.1, 0.1])
+
+
+def test_save_worker_counts_every_line_of_a_block(tmp_path, caplog):
+    engine = DataAcquisitionEngine(StubKeithley(), str(tmp_path))
+    engine.save_queue.put({'filename': "out.csv", 'header': "a,b"})
+    engine.save_queue.put(["1,2", "3,4", "5,6"])
+    engine.save_queue.put("7,8")
+    engine.save_queue.put(None)
+
+    with caplog.at_level("INFO", logger="measurement_engine"):
+        engine._save_worker()
+
+    assert (tmp_path / "out.csv").read_text() == "a,b\n1,2\n3,4\n5,6\n7,8\n"
+    assert "Lines written: 4" in caplog.text
+
+
+def test_start_aborts_when_instrument_rejects_settings(tmp_path):
+    keithley = StubKeithley()
+    keithley.configure_measurement = lambda settings: (False, ["Compliance: -221\tSettings conflict"])
+    engine = DataAcquisitionEngine(keithley, str(tmp_path))
+
+    with pytest.raises(RuntimeError, match="Settings conflict"):
+        engine.start_iv_sweep(SweepParameters(segments=[(0.0, 1.0, 3)]), MeasurementSettings())
+    with pytest.raises(RuntimeError, match="Settings conflict"):
+        engine.start_time_monitor(MonitorParameters(duration=1.0), MeasurementSettings())
+
+    assert not engine.is_measuring
+    assert engine.measurement_thread is None and engine.save_thread is None